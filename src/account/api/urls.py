@@ -1,14 +1,16 @@
 from django.urls import path, include
-from account.api.views import registration_view, ChangePasswordView, current_user_view
-
-from rest_framework.authtoken.views import obtain_auth_token
+from account.api.views import (
+    registration_view, ChangePasswordView, current_user_view, login_view, logout_view, refresh_token_view,
+)
 
 app_name = 'account'
 
 
 urlpatterns = [
     path('register', registration_view, name='register'),
-    path('login', obtain_auth_token, name='login'),
+    path('login', login_view, name='login'),
+    path('token/refresh', refresh_token_view, name='token-refresh'),
+    path('logout', logout_view, name='logout'),
     path('me', current_user_view, name='current-user'),
     path('change-password', ChangePasswordView.as_view(), name='change-password'),
 ]
\ No newline at end of file
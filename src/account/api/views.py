@@ -2,11 +2,15 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.authtoken.models import Token
+from rest_framework.authtoken.serializers import AuthTokenSerializer
 from rest_framework import generics
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.views.decorators.csrf import csrf_exempt
 
+from account.authentication import revoke
 from account.models import Account
+from account.tokens import TokenClaims, issue_token
 from account.api.serializers import RegistrationSerializer, ChangePasswordSerializer, AccountSerializer
 
 
@@ -24,13 +28,37 @@ def registration_view(request):
             data['first_name'] = account.first_name
             data['last_name'] = account.last_name
             data['role'] = account.role
-            token = Token.objects.get(user=account).key
-            data['token'] = token
+            data['token'], data['expires_at'] = issue_token(account)
             return Response(data, status=status.HTTP_200_OK)
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def login_view(request):
+    """Exchange email and password for a signed, expiring token"""
+    serializer = AuthTokenSerializer(data=request.data, context={'request': request})
+    serializer.is_valid(raise_exception=True)
+    token, expires_at = issue_token(serializer.validated_data['user'])
+    return Response({'token': token, 'expires_at': expires_at}, status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def refresh_token_view(request):
+    """
+    Rotate the caller's token: a new signed token is issued and the presented
+    one is revoked. A legacy token is exchanged and stays valid until pruned.
+    """
+    if not isinstance(request.auth, (TokenClaims, Token)):
+        raise AuthenticationFailed('Token authentication required.')
+    token, expires_at = issue_token(request.user)
+    if isinstance(request.auth, TokenClaims):
+        revoke(request.auth)
+    return Response({'token': token, 'expires_at': expires_at}, status=status.HTTP_200_OK)
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def current_user_view(request):
@@ -39,6 +67,17 @@ def current_user_view(request):
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def logout_view(request):
+    """Revoke the caller's signed token, or delete a legacy token (which also drops its cached lookup)"""
+    if isinstance(request.auth, TokenClaims):
+        revoke(request.auth)
+    else:
+        Token.objects.filter(user=request.user).delete()
+    return Response({'response': 'Successfully logged out.'}, status=status.HTTP_200_OK)
+
+
 class ChangePasswordView(generics.UpdateAPIView):
     serializer_class = ChangePasswordSerializer
     model = Account
@@ -56,6 +95,13 @@ class ChangePasswordView(generics.UpdateAPIView):
             if not self.object.check_password(serializer.data.get("old_password")):
                 return Response('Your provided old password is not correct.', status=status.HTTP_400_BAD_REQUEST)
             self.object.set_password(serializer.data.get("new_password"))
+            # Refuses tokens issued up to now; saving drops the cached lookups (account.models.drop_cached_tokens)
             self.object.save()
-            return Response('Password updated successfully', status=status.HTTP_200_OK)
+            # The presented token is refused from now on, so the caller gets a new one
+            token, expires_at = issue_token(self.object)
+            return Response({
+                'response': 'Password updated successfully',
+                'token': token,
+                'expires_at': expires_at,
+            }, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,118 @@
+"""
+Token authentication without per-request queries.
+
+Signed tokens (``account.tokens``) are verified by HMAC; the user they name
+and the revocation list are read through a process-local LRU (``TTLCache``)
+and, when ``AUTH_TOKEN_CACHE_ALIAS`` names a Django cache, that shared cache
+too. Legacy ``authtoken`` keys resolve through the same caches, so a warm
+request authenticates without a query either way.
+
+Cached users are dropped on every save of the account, which covers password
+changes, deactivation and role changes; legacy keys are dropped when their
+token is deleted. Other processes' local entries expire within
+``AUTH_TOKEN_CACHE_TTL`` seconds, and their revocation lists within
+``AUTH_REVOCATION_CACHE_TTL`` seconds.
+"""
+import copy
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils import timezone
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from account.tokens import InvalidToken, decode_token, expires_at, is_signed_token
+from base.helpers.cache import TTLCache
+
+_local = TTLCache(maxsize=settings.AUTH_TOKEN_CACHE_SIZE, ttl=settings.AUTH_TOKEN_CACHE_TTL)
+REVOKED_KEY = 'auth-token:revoked'
+
+
+def _shared():
+    alias = settings.AUTH_TOKEN_CACHE_ALIAS
+    return caches[alias] if alias else None
+
+
+def _cached(key, load, ttl=None):
+    """``load()`` through the local and shared caches; ``load`` returning None is not cached"""
+    value = _local.get(key)
+    if value is None:
+        shared = _shared()
+        value = shared.get(key) if shared is not None else None
+        if value is None:
+            value = load()
+            if value is None:
+                return None
+            if shared is not None:
+                shared.set(key, value, ttl or settings.AUTH_TOKEN_CACHE_TTL)
+        _local.set(key, value, ttl)
+    return value
+
+
+def _forget(key):
+    _local.delete(key)
+    shared = _shared()
+    if shared is not None:
+        shared.delete(key)
+
+
+def invalidate_token(key):
+    _forget(f'auth-token:{key}')
+
+
+def invalidate_user_tokens(user):
+    _forget(f'auth-user:{user.pk}')
+    for key in Token.objects.filter(user=user).values_list('key', flat=True):
+        invalidate_token(key)
+
+
+def _revoked_ids():
+    """Every revoked id whose token has not expired yet, i.e. up to one token lifetime of revocations"""
+    from account.models import RevokedToken
+
+    def load():
+        return frozenset(RevokedToken.objects.filter(expires_at__gt=timezone.now()).values_list('token_id', flat=True))
+    return _cached(REVOKED_KEY, load, settings.AUTH_REVOCATION_CACHE_TTL)
+
+
+def revoke(claims):
+    """Refuse a signed token from now until it expires"""
+    from account.models import RevokedToken
+    RevokedToken.objects.get_or_create(token_id=claims.token_id, defaults={'expires_at': expires_at(claims)})
+    _forget(REVOKED_KEY)
+
+
+def _user(user_id):
+    User = get_user_model()
+    return _cached(f'auth-user:{user_id}', lambda: User.objects.filter(pk=user_id).first())
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+
+    def authenticate_credentials(self, key):
+        if is_signed_token(key):
+            user, auth = self._signed_credentials(key)
+        else:
+            # Raises AuthenticationFailed for unknown keys and inactive users; failures are not cached
+            user, auth = _cached(f'auth-token:{key}', lambda: super(CachedTokenAuthentication, self)
+                                 .authenticate_credentials(key))
+        # Each request gets its own instance since views may modify request.user
+        return copy.copy(user), auth
+
+    def _signed_credentials(self, key):
+        try:
+            claims = decode_token(key)
+        except InvalidToken as error:
+            raise exceptions.AuthenticationFailed(str(error))
+        if claims.token_id in _revoked_ids():
+            raise exceptions.AuthenticationFailed('Token has been revoked.')
+
+        user = _user(claims.user_id)
+        if user is None or not user.is_active:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        valid_after = user.tokens_valid_after
+        if valid_after and claims.issued_at < int(valid_after.timestamp()):
+            raise exceptions.AuthenticationFailed('Token has been revoked.')
+        return user, claims
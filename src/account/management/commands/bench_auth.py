@@ -0,0 +1,41 @@
+import statistics
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from account.authentication import CachedTokenAuthentication
+from account.models import Account
+from account.tokens import issue_token
+from base.benchmark import measure, percentile, rolled_back
+
+
+class Command(BaseCommand):
+    help = 'Compare queries and time per authenticate() for DRF and cached token authentication (rolled back afterwards)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=10000)
+
+    def report(self, label, backend, key, repeat):
+        request = RequestFactory().get('/', HTTP_AUTHORIZATION=f'Token {key}')
+        backend.authenticate(request)  # warm the caches
+        with CaptureQueriesContext(connection) as queries:
+            backend.authenticate(request)
+        samples = [sample * 1000 for sample in measure(lambda: backend.authenticate(request), repeat)]
+        self.stdout.write(f'{label}: {len(queries)} queries per request, p50 {statistics.median(samples):.1f} µs, '
+                          f'p95 {percentile(samples, 95):.1f} µs ({repeat} runs)')
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        with rolled_back():
+            user = Account.objects.create(email=f'bench-{uuid.uuid4().hex[:12]}@example.com', role=Account.USER)
+            legacy_key = Token.objects.create(user=user).key
+            signed_key, _ = issue_token(user)
+
+            self.report('DRF TokenAuthentication, legacy key', TokenAuthentication(), legacy_key, repeat)
+            self.report('CachedTokenAuthentication, legacy key', CachedTokenAuthentication(), legacy_key, repeat)
+            self.report('CachedTokenAuthentication, signed token', CachedTokenAuthentication(), signed_key, repeat)
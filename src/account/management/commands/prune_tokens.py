@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+
+from account.models import RevokedToken
+
+
+class Command(BaseCommand):
+    help = 'Delete expired revocation entries and legacy tokens older than --legacy-days'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--legacy-days', type=int, default=settings.AUTH_LEGACY_TOKEN_MAX_AGE_DAYS,
+                            help='Delete legacy tokens created more than this many days ago (0 keeps them)')
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        revoked, _ = RevokedToken.objects.filter(expires_at__lte=now).delete()
+        self.stdout.write(f'Deleted {revoked} expired revocation entries.')
+
+        if options['legacy_days']:
+            # Token has a post_delete receiver (account.models.drop_cached_token), so the
+            # queryset delete fetches the rows and sends it per token, dropping cached lookups
+            legacy, _ = Token.objects.filter(created__lt=now - timedelta(days=options['legacy_days'])).delete()
+            self.stdout.write(f'Deleted {legacy} legacy tokens.')
+        self.stdout.write(self.style.SUCCESS('Tokens pruned.'))
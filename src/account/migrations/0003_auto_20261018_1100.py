@@ -0,0 +1,17 @@
+# Generated by Django 3.1.7 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_account_role'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(fields=['date_joined', 'id'], name='account_acc_date_jo_26caf2_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.7 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0004_auto_20261018_1400'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(fields=['email', 'id'], name='account_acc_email_a821c6_idx'),
+        ),
+    ]
@@ -1,15 +1,19 @@
 import os
+from datetime import timedelta
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
+from django.utils import timezone
 
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from rest_framework.authtoken.models import Token
 
 from django.urls import reverse
 from django_rest_passwordreset.signals import reset_password_token_created
-from django.core.mail import send_mail
+
+from account.authentication import invalidate_token, invalidate_user_tokens
+from mailer.outbox import enqueue
 
 
 class MyAccountManager(BaseUserManager):
@@ -59,14 +63,27 @@ class Account(AbstractBaseUser):
     is_admin        = models.BooleanField(default=False)
     is_staff        = models.BooleanField(default=False)
     is_superuser    = models.BooleanField(default=False)
+    # Signed tokens issued before this are refused (see account.tokens)
+    tokens_valid_after = models.DateTimeField(null=True, blank=True)
 
     USERNAME_FIELD  = 'email'
 
     objects = MyAccountManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['date_joined', 'id']),
+            models.Index(fields=['email', 'id'])
+        ]
+
     def __str__(self):
         return self.email
 
+    def set_password(self, raw_password):
+        super().set_password(raw_password)
+        # Token issue times are whole seconds; the next one, so tokens issued earlier in this second are refused too
+        self.tokens_valid_after = timezone.now().replace(microsecond=0) + timedelta(seconds=1)
+
     def has_perm(self, perm, obj=None):
         return self.is_active
 
@@ -83,23 +100,42 @@ class Account(AbstractBaseUser):
         return self.role == self.USER
 
 
+class RevokedToken(models.Model):
+    """Ids of signed tokens refused before they expire; rows are pruned once expired"""
+    token_id = models.CharField(max_length=32, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = 'account_revoked_tokens'
+
+    def __str__(self):
+        return self.token_id
+
+
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def create_auth_token(sender, instance=None, created=False, **kwargs):
-    if created:
-        Token.objects.create(user=instance)
+def drop_cached_tokens(sender, instance=None, created=False, **kwargs):
+    """Password, role and is_active changes must not be served from the token cache"""
+    if not created:
+        invalidate_user_tokens(instance)
+
+
+@receiver(post_delete, sender=Token)
+def drop_cached_token(sender, instance=None, **kwargs):
+    invalidate_token(instance.key)
 
 
 @receiver(reset_password_token_created)
 def password_reset_token_created(sender, instance, reset_password_token, *args, **kwargs):
     email_plaintext_message = "{}?token={}".format(reverse('password_reset:reset-password-request'), reset_password_token.key)
 
-    send_mail(
+    # Queued; delivered by the send_queued_mail worker outside the request
+    enqueue(
         # title:
         "Password Reset for {title}".format(title="hotel management system"),
         # message:
         email_plaintext_message,
+        # to:
+        [reset_password_token.user.email],
         # from:
         os.environ.get('EMAIL_SENDER'),
-        # to:
-        [reset_password_token.user.email]
     )
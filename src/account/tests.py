@@ -1,3 +1,50 @@
+import time
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
+
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.testing import make_account
+
+
+class PasswordChangeRevocationTests(TestCase):
+
+    def setUp(self):
+        self.user = make_account()
+        self.client = APIClient()
+
+    def _me(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+        return self.client.get(reverse('account_api:current-user'))
+
+    def _change_password(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+        return self.client.put(reverse('account_api:change-password'),
+                               {'old_password': 'test-pass-123', 'new_password': 'new-pass-456'})
+
+    def test_token_from_the_same_second_is_refused(self):
+        # Issue, refresh and change the password within one wall-clock second
+        second = int(time.time())
+        now = datetime.fromtimestamp(second + 0.5, tz=dt_timezone.utc)
+        with mock.patch('account.tokens.time.time', return_value=second + 0.2):
+            token = self.client.post(reverse('account_api:login'),
+                                     {'username': self.user.email, 'password': 'test-pass-123'}).data['token']
+            self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+            refreshed = self.client.post(reverse('account_api:token-refresh')).data['token']
+            with mock.patch('account.models.timezone.now', return_value=now):
+                response = self._change_password(refreshed)
+        self.assertEqual(response.status_code, 200, response.content)
+
+        self.assertEqual(self._me(refreshed).status_code, 401)
+        self.assertEqual(self._me(response.data['token']).status_code, 200)
+
+    def test_login_after_the_change_is_accepted(self):
+        token = self.client.post(reverse('account_api:login'),
+                                 {'username': self.user.email, 'password': 'test-pass-123'}).data['token']
+        self.assertEqual(self._change_password(token).status_code, 200)
 
-# Create your tests here.
+        token = self.client.post(reverse('account_api:login'),
+                                 {'username': self.user.email, 'password': 'new-pass-456'}).data['token']
+        self.assertEqual(self._me(token).status_code, 200)
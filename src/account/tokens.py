@@ -0,0 +1,77 @@
+"""
+Signed, expiring API tokens.
+
+A token is ``<user id>.<issued at>.<expires at>.<token id>.<signature>``
+(numbers in base 36, times in epoch seconds). The signature is an HMAC of the
+rest keyed from ``SECRET_KEY``, so a token is validated without touching the
+database. A token is refused when:
+
+- its signature does not match or it has expired,
+- its id is in the revocation list (logout, rotation). The list holds every id
+  revoked within the last ``AUTH_TOKEN_LIFETIME`` (rows are kept until the token
+  would have expired) and is cached for ``AUTH_REVOCATION_CACHE_TTL`` seconds,
+  so its size follows the logout and refresh rate over one token lifetime,
+- it was issued before the account's ``tokens_valid_after``. A password change
+  sets it to the next whole second, and tokens issued from then on are dated
+  no earlier, so only tokens issued after the change survive it.
+
+Legacy ``authtoken`` keys keep working until pruned; ``refresh`` exchanges one
+for a signed token.
+"""
+import secrets
+import time
+from collections import namedtuple
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.http import base36_to_int, int_to_base36
+
+TOKEN_SALT = 'account.tokens'
+SIGNATURE_LENGTH = 32
+
+TokenClaims = namedtuple('TokenClaims', ['user_id', 'issued_at', 'expires_at', 'token_id'])
+
+
+class InvalidToken(Exception):
+    pass
+
+
+def _signature(payload):
+    return salted_hmac(TOKEN_SALT, payload, algorithm='sha256').hexdigest()[:SIGNATURE_LENGTH]
+
+
+def is_signed_token(key):
+    return key.count('.') == 4
+
+
+def issue_token(user, lifetime=None):
+    """Return (token, expires_at as an aware datetime) for ``user``"""
+    issued_at = int(time.time())
+    if user.tokens_valid_after:
+        # Tokens issued right after a password change would otherwise share its second and be refused
+        issued_at = max(issued_at, int(user.tokens_valid_after.timestamp()))
+    expires_at = issued_at + (lifetime or settings.AUTH_TOKEN_LIFETIME)
+    payload = '.'.join([
+        int_to_base36(user.pk), int_to_base36(issued_at), int_to_base36(expires_at), secrets.token_hex(8),
+    ])
+    return f'{payload}.{_signature(payload)}', datetime.fromtimestamp(expires_at, tz=dt_timezone.utc)
+
+
+def decode_token(key):
+    """Verify signature and expiry; returns ``TokenClaims`` or raises ``InvalidToken``"""
+    payload, _, signature = key.rpartition('.')
+    if not constant_time_compare(signature, _signature(payload)):
+        raise InvalidToken('Invalid token.')
+    try:
+        user_id, issued_at, expires_at, token_id = payload.split('.')
+        claims = TokenClaims(base36_to_int(user_id), base36_to_int(issued_at), base36_to_int(expires_at), token_id)
+    except ValueError:
+        raise InvalidToken('Invalid token.')
+    if claims.expires_at <= time.time():
+        raise InvalidToken('Token has expired.')
+    return claims
+
+
+def expires_at(claims):
+    return datetime.fromtimestamp(claims.expires_at, tz=dt_timezone.utc)
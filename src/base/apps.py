@@ -1,5 +1,14 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class BaseConfig(AppConfig):
     name = 'base'
+
+    def ready(self):
+        if settings.DB_CONN_HEALTH_CHECKS:
+            from django.core.signals import request_finished, request_started
+            from base.db import check_connections, mark_idle
+            # Connected after Django's close_old_connections, so expired connections are already gone
+            request_started.connect(check_connections, dispatch_uid='base.check_connections')
+            request_finished.connect(mark_idle, dispatch_uid='base.mark_idle')
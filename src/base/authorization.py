@@ -0,0 +1,150 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+
+from base.helpers.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class AuthorizationMetrics:
+    """Counters and cumulative latency for cache hits and misses"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    def record(self, hit, seconds):
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self.hit_seconds += seconds
+            else:
+                self.misses += 1
+                self.miss_seconds += seconds
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'errors': self.errors,
+                'avg_hit_ms': self.hit_seconds * 1000 / self.hits if self.hits else 0.0,
+                'avg_miss_ms': self.miss_seconds * 1000 / self.misses if self.misses else 0.0,
+            }
+
+
+class AuthorizationClient:
+    """
+    Client for the remote authorization service.
+    Reuses pooled HTTP connections, bounds every call with a timeout and keeps
+    decisions in a TTL + LRU cache keyed by (module, role, action).
+    Failed calls are never cached, so the service is asked again next time.
+    """
+    platform = 'ebilling'
+
+    def __init__(self, base_url, secret_key, timeout=(1.0, 2.0), cache_ttl=300, cache_size=1024, pool_size=10):
+        self.base_url = (base_url or '').rstrip('/')
+        self.secret_key = secret_key
+        self.timeout = timeout
+        self.cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self.metrics = AuthorizationMetrics()
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _request(self, action, module, role):
+        payload = {
+            "platform": self.platform,
+            "module": module,
+            "role": role,
+            "action": action
+        }
+        response = self.session.post(
+            f"{self.base_url}/authorize",
+            json=payload,
+            headers={'secret-key': self.secret_key},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return bool(response.json().get('success'))
+
+    def is_authorized(self, action, module, role):
+        started = time.perf_counter()
+        key = (module, role, action)
+        decision = self.cache.get(key, _MISSING)
+        if decision is not _MISSING:
+            self.metrics.record(True, time.perf_counter() - started)
+            return decision
+
+        try:
+            decision = self._request(action, module, role)
+        except (requests.RequestException, ValueError):
+            self.metrics.record_error()
+            raise
+        self.cache.set(key, decision)
+        self.metrics.record(False, time.perf_counter() - started)
+        return decision
+
+    def preload(self, entries):
+        """
+        Warm the cache with the policy matrix.
+        ``entries`` is an iterable of (module, role, action); lookups run concurrently over the pool.
+        """
+        def load(entry):
+            try:
+                module, role, action = entry
+                self.is_authorized(action, module, role)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f'Authorization preload failed for {entry}: {e}')
+
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            list(executor.map(load, entries))
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_authorization_client():
+    """
+    Process-wide client built from settings.
+    Creating it starts warming ``AUTHORIZATION_PRELOAD`` in the background, so
+    only processes that check permissions (not migrate, shell, ...) call the service.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                client = AuthorizationClient(
+                    base_url=settings.AUTHORIZATION_SERVICE,
+                    secret_key=settings.EVALY_API_SECRET_KEY,
+                    timeout=(settings.AUTHORIZATION_CONNECT_TIMEOUT, settings.AUTHORIZATION_READ_TIMEOUT),
+                    cache_ttl=settings.AUTHORIZATION_CACHE_TTL,
+                    cache_size=settings.AUTHORIZATION_CACHE_SIZE,
+                )
+                if settings.AUTHORIZATION_SERVICE and settings.AUTHORIZATION_PRELOAD:
+                    threading.Thread(target=client.preload, args=(settings.AUTHORIZATION_PRELOAD,),
+                                     name='authorization-preload', daemon=True).start()
+                _client = client
+    return _client
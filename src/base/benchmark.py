@@ -0,0 +1,146 @@
+"""
+Helpers for the ``bench_*`` management commands.
+
+A benchmark seeds synthetic rows inside one transaction, ANALYZEs them,
+measures, and rolls everything back, so it can run against a development
+database without leaving data behind. Timings are wall-clock milliseconds
+per call, reported as p50 / p95 / max.
+"""
+import math
+import statistics
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from account.models import Account
+from booking.models import Booking
+from hotel.geo import encode_geohash
+from hotel.models import Hotel
+from room.models import Room
+
+BENCH_USER = 'benchmark@example.com'
+CITIES = ['Dhaka', 'Chittagong', 'Sylhet', 'Khulna', 'Rajshahi', 'Barisal', 'Rangpur', 'Comilla',
+          "Cox's Bazar", 'Mymensingh', 'Bogra', 'Jessore', 'Narayanganj', 'Gazipur', 'Dinajpur',
+          'Tangail', 'Pabna', 'Noakhali', 'Feni', 'Sreemangal']
+NAME_WORDS = ['Grand', 'Royal', 'Palace', 'Inn', 'Lodge', 'Resort', 'Plaza', 'Garden', 'Ocean', 'Hill',
+              'River', 'Lake', 'Park', 'Star', 'Crown', 'Golden', 'Green', 'Blue', 'Sunset', 'Harbour']
+BATCH_SIZE = 5000
+
+
+class _Rollback(Exception):
+    pass
+
+
+def require_postgres():
+    if connection.vendor != 'postgresql':
+        raise CommandError('Benchmarks measure the Postgres query plans; configure a Postgres database.')
+
+
+@contextmanager
+def rolled_back():
+    """Run the block in a transaction that is always rolled back"""
+    try:
+        with transaction.atomic():
+            yield
+            raise _Rollback
+    except _Rollback:
+        pass
+
+
+def analyze(*models):
+    """Refresh planner statistics after seeding so plans match a populated table"""
+    with connection.cursor() as cursor:
+        for model in models:
+            cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
+
+
+def measure(call, repeat, warmup=3):
+    for _ in range(warmup):
+        call()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def percentile(samples, percent):
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def summary(label, samples):
+    return (f'{label}: p50 {statistics.median(samples):.1f} ms, p95 {percentile(samples, 95):.1f} ms, '
+            f'max {max(samples):.1f} ms ({len(samples)} runs)')
+
+
+def make_landlord():
+    return Account.objects.create(email=f'bench-{uuid.uuid4().hex[:12]}@example.com', role=Account.LANDLORD,
+                                  first_name='Bench', last_name='Landlord')
+
+
+def seed_hotels(count, landlord, rng, coordinates=False):
+    """``count`` hotels with word-list names spread over CITIES; returns their ids"""
+    token = uuid.uuid4().hex[:8]
+    for first in range(0, count, BATCH_SIZE):
+        hotels = []
+        for number in range(first, min(first + BATCH_SIZE, count)):
+            name = ' '.join(rng.sample(NAME_WORDS, 2) + [str(number)])
+            hotel = Hotel(
+                name=name, slug=f'bench-{token}-{number}', address=f'{number} {rng.choice(NAME_WORDS)} Road',
+                city=rng.choice(CITIES), country='Bangladesh', star_rating=rng.randint(1, 5), landlord=landlord,
+                created_by=BENCH_USER, updated_by=BENCH_USER,
+            )
+            if coordinates:
+                # Bangladesh's bounding box
+                hotel.latitude, hotel.longitude = rng.uniform(20.6, 26.6), rng.uniform(88.0, 92.7)
+                hotel.geohash = encode_geohash(hotel.latitude, hotel.longitude)
+            hotels.append(hotel)
+        Hotel.objects.bulk_create(hotels)
+    return list(Hotel.objects.filter(slug__startswith=f'bench-{token}-').values_list('pk', flat=True))
+
+
+def seed_rooms(hotel_ids, count, rng):
+    """``count`` rooms spread round-robin over ``hotel_ids``; returns their ids"""
+    for first in range(0, count, BATCH_SIZE):
+        Room.objects.bulk_create([
+            Room(hotel_id=hotel_ids[number % len(hotel_ids)], room_no=f'B{number}', floor_no=rng.randint(1, 20),
+                 capacity=rng.randint(1, 6), price=rng.randint(20, 300) * 10, created_by=BENCH_USER,
+                 updated_by=BENCH_USER)
+            for number in range(first, min(first + BATCH_SIZE, count))
+        ])
+    return list(Room.objects.filter(created_by=BENCH_USER).values_list('pk', flat=True))
+
+
+def seed_bookings(count, first_day):
+    """
+    ``count`` one-night bookings of the seeded rooms, round-robin, one every
+    other night per room from ``first_day``; one INSERT ... SELECT.
+    Returns the last day booked.
+    """
+    rooms = Room.objects.filter(created_by=BENCH_USER).count()
+    with connection.cursor() as cursor:
+        cursor.execute(f'''
+            INSERT INTO {connection.ops.quote_name(Booking._meta.db_table)}
+                (customer_phone_no, room_id, price, discounted_price, booking_time, booking_start_time,
+                 booking_end_time, created_at, updated_at, created_by, updated_by)
+            SELECT lpad(n::text, 11, '0'), rooms.ids[1 + n %% rooms.total], 100, 100, now(),
+                   %s + (n / rooms.total) * interval '2 days',
+                   %s + (n / rooms.total) * interval '2 days' + interval '1 day',
+                   now(), now(), %s, %s
+            FROM generate_series(0, %s - 1) AS n,
+                 (SELECT array_agg(id ORDER BY id) AS ids, count(*)::int AS total
+                  FROM {connection.ops.quote_name(Room._meta.db_table)} WHERE created_by = %s) AS rooms
+        ''', [first_day, first_day, BENCH_USER, BENCH_USER, count, BENCH_USER])
+    return first_day + timedelta(days=2 * math.ceil(count / max(rooms, 1)))
+
+
+def benchmark_start():
+    """Midnight a week from now, so seeded stays lie in the future"""
+    return timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=7)
@@ -0,0 +1,40 @@
+"""
+Health checks for persistent database connections.
+
+With ``CONN_MAX_AGE`` a connection outlives the request that opened it, and the
+server, a pooler or a failover can drop it in between; the next query would then
+fail. ``check_connections`` runs at the start of each request and closes reused
+connections that no longer answer, so Django reconnects on first use.
+
+Like Django's ``close_old_connections`` it only looks at connections that are
+suspect: open ones that sat idle for more than ``DB_CONN_HEALTH_CHECK_IDLE``
+seconds since the last request finished, or whose last request raised database
+errors. Those cost one ``SELECT 1``; a busy worker reuses its connections
+without the extra round trip.
+"""
+import time
+
+from django.conf import settings
+from django.db import connections
+
+
+def mark_idle(**kwargs):
+    """At the end of a request, remember when each connection still open was last used"""
+    now = time.monotonic()
+    for connection in connections.all():
+        if connection.connection is not None:
+            connection.health_check_idle_since = now
+
+
+def check_connections(**kwargs):
+    now = time.monotonic()
+    for connection in connections.all():
+        if connection.connection is None or connection.in_atomic_block:
+            continue
+        idle = now - getattr(connection, 'health_check_idle_since', now)
+        if idle <= settings.DB_CONN_HEALTH_CHECK_IDLE and not connection.errors_occurred:
+            continue
+        if connection.is_usable():
+            connection.errors_occurred = False
+        else:
+            connection.close()
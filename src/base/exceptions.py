@@ -1,4 +1,5 @@
 from rest_framework.views import Response, exception_handler
+from rest_framework.exceptions import APIException
 from rest_framework import status
 
 
@@ -10,3 +11,9 @@ def custom_exception_handler(exc, context):
     if isinstance(exc, Exception) and not response:
         response = Response({'message': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     return response
+
+
+class Conflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'Request conflicts with the current state of the resource.'
+    default_code = 'conflict'
@@ -1 +1,7 @@
-from base.helpers.pagination import *
\ No newline at end of file
+from base.helpers.pagination import *
+from base.helpers.cache import *
+from base.helpers.keyset import *
+from base.helpers.streaming import *
+from base.helpers.search import *
+from base.helpers.conditional import *
+from base.helpers.fields import *
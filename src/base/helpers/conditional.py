@@ -0,0 +1,85 @@
+"""
+Conditional GET for viewset ``list`` and ``retrieve``.
+
+Validators come from the rows' ``updated_at`` instead of the response body.
+A list's ETag hashes the request path (filters, page, ordering) with the
+filtered queryset's ``max(updated_at)`` and count, taken in one aggregate
+query; lists send no ``Last-Modified`` since rows leaving the filter do not
+raise the max. A detail's ETag and ``Last-Modified`` come from the object's
+``updated_at``. A matching ``If-None-Match`` / ``If-Modified-Since`` returns
+304 without serializing (and, for lists, without fetching the page).
+
+Related rows shown in the representation are folded in through
+``conditional_related`` (their ``updated_at`` maxima). Anonymous responses get
+``Cache-Control: public, max-age=CATALOG_HTTP_MAX_AGE``; authenticated ones are
+``private, no-cache`` so clients revalidate every time.
+"""
+import hashlib
+from calendar import timegm
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+class ConditionalGetMixin:
+    # Related fields whose updated_at changes the representation, e.g. ('hotel',)
+    conditional_related = ()
+
+    def _etag(self, *parts):
+        key = '|'.join([
+            self.request.get_full_path(),
+            self.request.accepted_media_type or '',
+            *(part.isoformat() if hasattr(part, 'isoformat') else str(part) for part in parts),
+        ])
+        return 'W/' + quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+    def _list_validators(self, queryset):
+        aggregates = {'count': Count('pk'), 'last': Max('updated_at')}
+        for name in self.conditional_related:
+            aggregates[name] = Max(f'{name}__updated_at')
+        values = queryset.order_by().aggregate(**aggregates)
+        return self._etag(*(values[name] for name in sorted(values)))
+
+    def _detail_validators(self, instance):
+        times = [instance.updated_at]
+        for name in self.conditional_related:
+            related = getattr(instance, name, None)
+            times.append(related.updated_at if related is not None else None)
+        last_modified = max(time for time in times if time is not None)
+        return self._etag(*times), last_modified
+
+    def _cache_headers(self, response, etag, last_modified):
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(timegm(last_modified.utctimetuple()))
+        if self.request.user.is_authenticated:
+            patch_cache_control(response, private=True, no_cache=True)
+        else:
+            patch_cache_control(response, public=True, max_age=settings.CATALOG_HTTP_MAX_AGE)
+        patch_vary_headers(response, ('Authorization',))
+        return response
+
+    def _not_modified(self, request, etag, last_modified=None):
+        last_modified_ts = timegm(last_modified.utctimetuple()) if last_modified else None
+        return get_conditional_response(request._request, etag=etag, last_modified=last_modified_ts)
+
+    def list(self, request, *args, **kwargs):
+        # ETag only: a row leaving the filter (soft delete) lowers the count without raising
+        # max(updated_at), so a Last-Modified date could validate a stale page
+        etag = self._list_validators(self.filter_queryset(self.get_queryset()))
+        response = self._not_modified(request, etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        return self._cache_headers(response, etag, None)
+
+    def retrieve(self, request, *args, **kwargs):
+        # get_object() keeps DRF's lookup handling, so malformed ids are still 404
+        instance = self.get_object()
+        etag, last_modified = self._detail_validators(instance)
+        response = self._not_modified(request, etag, last_modified)
+        if response is None:
+            response = Response(self.get_serializer(instance).data)
+        return self._cache_headers(response, etag, last_modified)
@@ -0,0 +1,117 @@
+"""
+Sparse fieldsets for viewset ``list`` and ``retrieve``.
+
+``?fields=id,name`` keeps only the named serializer fields and ``?exclude=description``
+drops fields. The fields left are also pushed down to the query with ``.only()``,
+so unused columns (and columns no serializer shows, like ``search_vector``)
+are not read even without the parameters.
+
+Model fields are resolved from each serializer field's ``source``; method
+fields declare the columns they read in the serializer's ``sparse_sources``::
+
+    sparse_sources = {'hotel_name': ['hotel__name']}
+
+When a kept field cannot be resolved the queryset is left as it is.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import ListSerializer
+
+FIELDS_PARAM = 'fields'
+EXCLUDE_PARAM = 'exclude'
+SPARSE_ACTIONS = ('list', 'retrieve')
+
+
+def _names(request, param):
+    value = request.query_params.get(param)
+    return [name.strip() for name in value.split(',') if name.strip()] if value else []
+
+
+def _column(model, path):
+    """Validated ``only()`` path for a dotted source, or None when it is not a concrete column"""
+    parts = path.split('.')
+    current = model
+    for index, part in enumerate(parts):
+        try:
+            field = current._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete:
+            return None
+        if index < len(parts) - 1:
+            if not field.is_relation:
+                return None
+            current = field.related_model
+    return '__'.join(parts)
+
+
+def sparse_columns(serializer, model):
+    """``only()`` arguments for the serializer's fields, or None when some field cannot be resolved"""
+    sources = getattr(serializer, 'sparse_sources', {})
+    columns = {'pk'}
+    for name, field in serializer.fields.items():
+        if name in sources:
+            paths = sources[name]
+        elif field.source == '*':
+            return None
+        else:
+            paths = [field.source]
+        for path in paths:
+            column = _column(model, path.replace('__', '.'))
+            if column is None:
+                return None
+            columns.add(column)
+            # The relations on the way, needed to traverse them with select_related
+            parts = column.split('__')
+            columns.update('__'.join(parts[:index]) for index in range(1, len(parts)))
+    return columns
+
+
+def _related_paths(related, prefix=''):
+    for name, nested in related.items():
+        yield prefix + name
+        yield from _related_paths(nested, f'{prefix}{name}__')
+
+
+class SparseFieldsMixin:
+
+    def _sparse(self):
+        return getattr(self, 'action', None) in SPARSE_ACTIONS
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if self._sparse():
+            target = serializer.child if isinstance(serializer, ListSerializer) else serializer
+            self._trim(target)
+        return serializer
+
+    def _trim(self, serializer):
+        fields, exclude = _names(self.request, FIELDS_PARAM), _names(self.request, EXCLUDE_PARAM)
+        if not fields and not exclude:
+            return
+        available = set(serializer.fields)
+        unknown = sorted((set(fields) | set(exclude)) - available)
+        if unknown:
+            raise ValidationError(detail=f"Unknown field(s): {', '.join(unknown)}. "
+                                         f"Available: {', '.join(sorted(available))}.")
+        for name in list(serializer.fields):
+            if (fields and name not in fields) or name in exclude:
+                serializer.fields.pop(name)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self._sparse():
+            return queryset
+        related = queryset.query.select_related
+        if related is True:
+            # select_related() without names follows every relation; leave it alone
+            return queryset
+        serializer = self.get_serializer_class()(context=self.get_serializer_context())
+        self._trim(serializer)
+        columns = sparse_columns(serializer, queryset.model)
+        if columns is None:
+            return queryset
+        # Relations followed by select_related cannot be deferred
+        if related:
+            columns.update(_related_paths(related))
+        return queryset.only(*columns)
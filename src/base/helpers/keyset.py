@@ -0,0 +1,138 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.db import connections
+from django.db.models import Q, QuerySet
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _to_json(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def encode_cursor(direction, values):
+    """Opaque, URL-safe cursor holding the direction and the keyset values of a boundary row"""
+    payload = json.dumps({'d': direction, 'v': [_to_json(value) for value in values]}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        direction, values = payload['d'], payload['v']
+    except (ValueError, TypeError, KeyError, AttributeError):
+        raise InvalidCursor('Invalid cursor.')
+    if direction not in ('next', 'previous') or not isinstance(values, list):
+        raise InvalidCursor('Invalid cursor.')
+    return direction, values
+
+
+def _row_value(row, field):
+    return row[field] if isinstance(row, dict) else getattr(row, field)
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+def keyset_paginate(queryset, cursor=None, page_size=25, ordering='-created_at', tiebreaker='id'):
+    """
+    Seek-based pagination over (``ordering``, ``tiebreaker``).
+    Each page is one ``WHERE (field, id) < (v, pk) ORDER BY field, id LIMIT n + 1``
+    query, so the cost does not depend on how deep the page is. ``ordering``
+    must name a non-null local field or annotation, optionally prefixed with ``-``.
+    Raises ``InvalidCursor`` for a cursor that cannot be decoded.
+    """
+    descending = ordering.startswith('-')
+    field = ordering.lstrip('-')
+    direction, values = decode_cursor(cursor) if cursor else ('next', None)
+
+    if values is not None:
+        if len(values) != 2:
+            raise InvalidCursor('Invalid cursor.')
+        annotation = queryset.query.annotations.get(field)
+        model_field = annotation.output_field if annotation is not None else queryset.model._meta.get_field(field)
+        tiebreaker_field = queryset.model._meta.get_field(tiebreaker)
+        try:
+            value, pk = model_field.to_python(values[0]), tiebreaker_field.to_python(values[1])
+        except Exception:
+            raise InvalidCursor('Invalid cursor.')
+        # Rows after the boundary in display order, or before it for a previous page
+        lookup = 'lt' if descending == (direction == 'next') else 'gt'
+        queryset = queryset.filter(
+            Q(**{f'{field}__{lookup}': value}) | Q(**{field: value, f'{tiebreaker}__{lookup}': pk})
+        )
+
+    backwards = direction == 'previous'
+    sign = '-' if descending != backwards else ''
+    rows = list(queryset.order_by(f'{sign}{field}', f'{sign}{tiebreaker}')[:page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+
+    has_next = has_more if not backwards else True
+    has_previous = has_more if backwards else values is not None
+
+    def boundary(direction, row):
+        return encode_cursor(direction, [_row_value(row, field), _row_value(row, tiebreaker)])
+
+    return KeysetPage(
+        rows,
+        next_cursor=boundary('next', rows[-1]) if rows and has_next else None,
+        previous_cursor=boundary('previous', rows[0]) if rows and has_previous else None,
+    )
+
+
+def estimated_count(source, using=None):
+    """
+    Planner row estimate instead of an exact ``COUNT(*)``.
+    ``source`` is a model or a queryset: a whole table is estimated from
+    ``pg_class.reltuples`` and a filtered queryset from its ``EXPLAIN`` plan, both
+    O(1) regardless of table size. Falls back to an exact count on other
+    databases or on tables never analyzed.
+    """
+    queryset = source if isinstance(source, QuerySet) else source._default_manager.all()
+    using = using or queryset.db
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            if queryset.query.where:
+                sql, params = queryset.order_by().query.sql_with_params()
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+                plan = cursor.fetchone()[0]
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                estimate = plan[0]['Plan']['Plan Rows']
+            else:
+                cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                               [queryset.model._meta.db_table])
+                row = cursor.fetchone()
+                estimate = row[0] if row else 0
+        if estimate > 0:
+            return int(estimate)
+    return queryset.using(using).count()
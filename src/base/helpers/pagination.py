@@ -1,28 +1,163 @@
 from typing import Union
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
 
+from base.helpers.keyset import InvalidCursor, estimated_count, keyset_paginate
+
+
+class EstimatedPage(Page):
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self._has_more = has_more
+
+    def has_next(self):
+        return self._has_more
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Django paginator that reports a planner estimate instead of running COUNT(*).
+    The estimate is only reported: pages are sliced and bounded by fetching one
+    extra row, so an underestimate never hides or truncates pages that exist.
+    """
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, QuerySet):
+            return estimated_count(self.object_list)
+        return len(self.object_list)
+
+    def validate_number(self, number):
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('That page number is not an integer')
+        if number < 1:
+            raise EmptyPage('That page number is less than 1')
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage('That page contains no results')
+        return EstimatedPage(rows[:self.per_page], number, self, has_more=len(rows) > self.per_page)
+
 
 class CustomPagination(pagination.PageNumberPagination):
+    """
+    Page-number pagination with an opt-in cursor (keyset) mode.
+
+    Cursor mode is selected with ``?pagination=cursor`` (or by sending a ``cursor``)
+    or by setting ``pagination_mode = 'cursor'`` on the view. It pages on
+    (``cursor_ordering``, ``id``) without OFFSET, and ``meta_data.next``/``previous``
+    hold opaque cursors instead of page numbers. An ``?ordering=`` on one
+    non-null column replaces ``cursor_ordering``; any other active ordering
+    (several columns, search rank, distance) is rejected with 400.
+
+    ``?count=exact|estimate|none`` (or ``count_mode`` on the view) controls
+    ``meta_data.count``; ``estimate`` reads the planner statistics instead of
+    running COUNT(*). Page mode always needs a count, so ``none`` falls back to exact there.
+    """
     page_query_param = 'page'
     page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    count_query_param = 'count'
+    pagination_mode = 'page'
+    cursor_ordering = '-created_at'
+    count_modes = ('exact', 'estimate', 'none')
+
+    def _get_mode(self, request, view):
+        requested = request.query_params.get(self.mode_query_param)
+        if requested in ('page', 'cursor'):
+            return requested
+        if request.query_params.get(self.cursor_query_param):
+            return 'cursor'
+        return getattr(view, 'pagination_mode', self.pagination_mode)
+
+    def _get_count_mode(self, request, view, mode):
+        requested = request.query_params.get(self.count_query_param)
+        count_mode = requested if requested in self.count_modes else getattr(view, 'count_mode', None)
+        if count_mode is None:
+            count_mode = 'none' if mode == 'cursor' else 'exact'
+        if mode == 'page' and count_mode == 'none':
+            count_mode = 'exact'
+        return count_mode
+
+    def _get_cursor_ordering(self, queryset, view):
+        """The keyset column: the queryset's own ordering when it is one non-null column"""
+        ordering = queryset.query.order_by
+        if not ordering:
+            return getattr(view, 'cursor_ordering', self.cursor_ordering)
+        if len(ordering) == 1 and isinstance(ordering[0], str):
+            try:
+                field = queryset.model._meta.get_field(ordering[0].lstrip('-'))
+            except FieldDoesNotExist:
+                field = None
+            if field is not None and field.concrete and not field.is_relation and not field.null:
+                return ordering[0]
+        raise ValidationError(detail='Cursor pagination needs an ordering on one non-null column; '
+                                     'use page pagination for this ordering.')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.mode = self._get_mode(request, view)
+        self.count_mode = self._get_count_mode(request, view, self.mode)
+
+        if self.mode == 'page':
+            self.django_paginator_class = EstimatedCountPaginator if self.count_mode == 'estimate' else Paginator
+            return super().paginate_queryset(queryset, request, view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        try:
+            self.page = keyset_paginate(
+                queryset,
+                cursor=request.query_params.get(self.cursor_query_param),
+                page_size=page_size,
+                ordering=self._get_cursor_ordering(queryset, view),
+            )
+        except InvalidCursor as exc:
+            raise NotFound(str(exc))
+
+        if self.count_mode == 'exact':
+            self.count = queryset.count()
+        elif self.count_mode == 'estimate':
+            self.count = estimated_count(queryset)
+        else:
+            self.count = None
+        return list(self.page)
 
-    def _get_next_page(self) -> Union[int, None]:
+    def _get_next_page(self) -> Union[int, str, None]:
         if not self.page.has_next():
             return None
+        if self.mode == 'cursor':
+            return self.page.next_cursor
         page_number: int = self.page.next_page_number()
         return page_number
 
-    def _get_previous_page(self) -> Union[int, None]:
+    def _get_previous_page(self) -> Union[int, str, None]:
         if not self.page.has_previous():
             return None
+        if self.mode == 'cursor':
+            return self.page.previous_cursor
         page_number: int = self.page.previous_page_number()
         return page_number
 
     def get_paginated_response(self, data):
         return Response({
             'meta_data': {
-                'count': self.page.paginator.count,
+                'count': self.count if self.mode == 'cursor' else self.page.paginator.count,
                 'page_size': self.get_page_size(self.request),
                 'next': self._get_next_page(),
                 'previous': self._get_previous_page(),
@@ -0,0 +1,106 @@
+"""
+Postgres full-text and trigram search.
+
+Searchable models keep a ``search_vector`` column that a database trigger fills
+from their text columns (see the migrations adding it), with a GIN index on it
+and ``gin_trgm_ops`` indexes on short name-like columns. A query matches rows
+whose vector contains every word as a prefix, or whose trigram columns are
+similar to the whole query so typos still match. Both conditions are answered
+from the indexes instead of ``ILIKE '%q%'`` scans.
+
+``search_rank`` is rounded to a ``numeric`` so it survives a cursor round trip
+and keyset pages can seek on (``search_rank``, ``id``).
+"""
+import re
+
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import DecimalField, F, FloatField, Q, Value
+from django.db.models.functions import Cast, Coalesce, Greatest
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+SEARCH_CONFIG = 'simple'
+RANK_FIELD = 'search_rank'
+_WORD = re.compile(r'\w+')
+
+
+def search_query(text):
+    """Prefix tsquery requiring every word of ``text``, or None when there are no words"""
+    words = _WORD.findall(text or '')
+    if not words:
+        return None
+    return SearchQuery(' & '.join(f'{word}:*' for word in words), config=SEARCH_CONFIG, search_type='raw')
+
+
+def ranked_search(queryset, text, trigram_fields=(), vector_field='search_vector', lookup_fields=()):
+    """
+    Rows of ``queryset`` matching ``text``, annotated with ``search_rank`` and
+    ordered best first. ``lookup_fields`` are also matched with ``icontains``
+    (e.g. columns of related rows outside the search vector); they add no rank.
+    """
+    query = search_query(text)
+    if query is None:
+        return queryset
+    text = text.strip()
+
+    condition = Q(**{vector_field: query})
+    rank = Coalesce(SearchRank(F(vector_field), query), Value(0.0), output_field=FloatField())
+    if trigram_fields:
+        for field in trigram_fields:
+            condition |= Q(**{f'{field}__trigram_similar': text})
+        similarities = [TrigramSimilarity(field, text) for field in trigram_fields]
+        similarity = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+        rank = rank + Coalesce(similarity, Value(0.0), output_field=FloatField())
+    for field in lookup_fields:
+        condition |= Q(**{f'{field}__icontains': text})
+    rank = Cast(rank, DecimalField(max_digits=12, decimal_places=6))
+    return queryset.filter(condition).annotate(**{RANK_FIELD: rank}).order_by(f'-{RANK_FIELD}', '-pk')
+
+
+class RankedSearchFilter(BaseFilterBackend):
+    """
+    Ranked ``?q=`` search for viewsets (``?search=`` is accepted too).
+    The view may set ``search_trigram_fields``. Results are ordered by rank
+    unless an explicit ``ordering`` is requested.
+    """
+    search_params = ('q', 'search')
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        text = next((params[param] for param in self.search_params if params.get(param)), None)
+        if not text:
+            return queryset
+        ordering = queryset.query.order_by
+        queryset = ranked_search(queryset, text, getattr(view, 'search_trigram_fields', ()))
+        if params.get(api_settings.ORDERING_PARAM) and ordering:
+            queryset = queryset.order_by(*ordering)
+        return queryset
+
+
+class RankedChangeList(ChangeList):
+    """Changelist keeping search results in rank order unless a column header is clicked"""
+
+    def get_ordering(self, request, queryset):
+        if ORDER_VAR not in self.params and RANK_FIELD in queryset.query.annotations:
+            return [f'-{RANK_FIELD}', '-pk']
+        return super().get_ordering(request, queryset)
+
+
+class RankedSearchAdminMixin:
+    """
+    ModelAdmin mixin running the changelist search box through ``ranked_search``.
+    ``search_lookup_fields`` are matched with ``icontains`` alongside the vector.
+    """
+    search_trigram_fields = ()
+    search_lookup_fields = ()
+
+    def get_changelist(self, request, **kwargs):
+        return RankedChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        queryset = ranked_search(queryset, search_term, self.search_trigram_fields,
+                                 lookup_fields=self.search_lookup_fields)
+        return queryset, False
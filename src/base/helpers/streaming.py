@@ -0,0 +1,129 @@
+import csv
+import io
+import json
+import zlib
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+
+CSV = 'csv'
+NDJSON = 'ndjson'
+FORMATS = {
+    CSV: 'text/csv',
+    NDJSON: 'application/x-ndjson',
+}
+# Lines are joined into chunks of about this many bytes before being sent
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the csv writer caller"""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(fields, rows):
+    """Header plus one CSV line per row; ``rows`` yields sequences ordered like ``fields``"""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def ndjson_lines(fields, rows):
+    """One JSON object per line; ``rows`` yields sequences ordered like ``fields``"""
+    for row in rows:
+        yield json.dumps(dict(zip(fields, row)), cls=DjangoJSONEncoder) + '\n'
+
+
+def buffered(lines, size=STREAM_CHUNK_SIZE):
+    """Join text lines into encoded chunks of about ``size`` bytes"""
+    chunk, length = [], 0
+    for line in lines:
+        data = line.encode()
+        chunk.append(data)
+        length += len(data)
+        if length >= size:
+            yield b''.join(chunk)
+            chunk, length = [], 0
+    if chunk:
+        yield b''.join(chunk)
+
+
+def gzip_chunks(chunks, level=6):
+    """Incrementally gzip a stream of byte chunks"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_rows(fields, rows, data_format, filename, compress=False):
+    """
+    ``StreamingHttpResponse`` over ``rows`` without materializing them.
+    Pass a ``values_list(...).iterator(chunk_size=...)`` so the database also streams.
+    With ``compress`` the body is a ``.gz`` file compressed on the fly.
+    """
+    lines = csv_lines(fields, rows) if data_format == CSV else ndjson_lines(fields, rows)
+    chunks = buffered(lines)
+    filename = f'{filename}.{data_format}'
+    if compress:
+        response = StreamingHttpResponse(gzip_chunks(chunks), content_type='application/gzip')
+        filename += '.gz'
+    else:
+        response = StreamingHttpResponse(chunks, content_type=FORMATS[data_format])
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def data_format_param(request, filename=None, default=CSV):
+    """
+    Export/import format from ``data_format`` (``format`` is taken by DRF's
+    format suffix override), then the uploaded file's extension.
+    """
+    data_format = request.query_params.get('data_format')
+    if not data_format and filename and '.' in filename:
+        data_format = filename.rsplit('.', 1)[-1].lower()
+    data_format = data_format or default
+    if data_format not in FORMATS:
+        raise ValidationError(detail=f'data_format must be one of: {", ".join(FORMATS)}.')
+    return data_format
+
+
+def compress_param(request):
+    return request.query_params.get('gzip', '').lower() in ('1', 'true', 'yes')
+
+
+def read_records(upload, data_format):
+    """
+    Iterate (line number, record) over an uploaded CSV or NDJSON file without reading it whole.
+    ``record`` is a dict, or None for an NDJSON line that is not a JSON object.
+    """
+    text = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+    if data_format == CSV:
+        reader = csv.DictReader(text)
+        for record in reader:
+            yield reader.line_num, record
+    else:
+        for line_no, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield line_no, record if isinstance(record, dict) else None
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.benchmark import measure, summary
+
+
+class Command(BaseCommand):
+    help = 'Compare request latency with a new database connection per request against persistent connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', help='Defaults to the hotel list with page_size=1')
+        parser.add_argument('--repeat', type=int, default=200)
+
+    # Every request has to reach the database, not the Redis query cache
+    @override_settings(CACHEOPS_ENABLED=False)
+    def handle(self, *args, **options):
+        url = options['url'] or f"{reverse('hotel_api:hotel-list')}?page_size=1"
+        client = APIClient()
+
+        def get():
+            response = client.get(url)
+            if response.status_code != 200:
+                raise AssertionError(response.content)
+
+        def reconnecting():
+            # What every request pays with CONN_MAX_AGE = 0
+            connections.close_all()
+            get()
+
+        # The test client keeps connections open between requests, as CONN_MAX_AGE > 0 does
+        self.stdout.write(summary('new connection per request', measure(reconnecting, options['repeat'])))
+        self.stdout.write(summary('persistent connection', measure(get, options['repeat'])))
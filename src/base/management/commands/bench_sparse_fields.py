@@ -0,0 +1,87 @@
+import random
+import statistics
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from account.models import Account
+from base.benchmark import (
+    analyze, benchmark_start, make_landlord, measure, require_postgres, rolled_back, seed_bookings, seed_hotels,
+    seed_rooms, summary,
+)
+from booking.models import Booking
+from hotel.models import Hotel
+from room.models import Room
+
+# (label, url name, model, ?fields=, ?exclude=)
+ENDPOINTS = [
+    ('hotels', 'hotel_api:hotel-list', Hotel, 'id,name,city,star_rating,thumbnail_url',
+     'landlord_name,landlord_email,image_srcset'),
+    ('rooms', 'room_api:room-list', Room, 'id,room_no,price,hotel_name', 'hotel_city,created_by,updated_by'),
+    ('bookings', 'booking_api:booking-list', Booking, 'id,room_no,booking_start_time,booking_end_time',
+     'room_no,last_checkin_time,last_checkout_time'),
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare payload size, latency and SELECT columns of list endpoints with and without ?fields= / ?exclude='
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hotels', type=int, default=2000)
+        parser.add_argument('--rooms', type=int, default=20000)
+        parser.add_argument('--bookings', type=int, default=100000)
+        parser.add_argument('--page-size', type=int, default=100)
+        parser.add_argument('--repeat', type=int, default=50)
+        parser.add_argument('--seed', type=int, default=1)
+
+    def main_select(self, model, queries):
+        """Column list of the page query, i.e. the SELECT from the model's table that is not the count"""
+        table = connection.ops.quote_name(model._meta.db_table)
+        for query in queries:
+            sql = query['sql']
+            if sql.startswith('SELECT') and f'FROM {table}' in sql and 'COUNT(' not in sql:
+                return sql.split(' FROM ')[0]
+        return '(no query; served from cache?)'
+
+    # Every request has to reach the database, not the Redis query cache
+    @override_settings(CACHEOPS_ENABLED=False)
+    def handle(self, *args, **options):
+        require_postgres()
+        rng = random.Random(options['seed'])
+        repeat = options['repeat']
+        with rolled_back():
+            self.stdout.write(f"Seeding {options['hotels']} hotels, {options['rooms']} rooms "
+                              f"and {options['bookings']} bookings...")
+            hotels = seed_hotels(options['hotels'], make_landlord(), rng)
+            seed_rooms(hotels, options['rooms'], rng)
+            seed_bookings(options['bookings'], benchmark_start())
+            analyze(Hotel, Room, Booking)
+
+            admin = Account.objects.create(email=f'bench-{uuid.uuid4().hex[:12]}@example.com', role=Account.ADMIN)
+            client = APIClient()
+            client.force_authenticate(user=admin)
+
+            for label, name, model, fields, exclude in ENDPOINTS:
+                url = reverse(name)
+                for variant, params in [('all fields', {}), (f'fields={fields}', {'fields': fields}),
+                                        (f'exclude={exclude}', {'exclude': exclude})]:
+                    params = {'page_size': options['page_size'], **params}
+                    sizes = []
+
+                    def get():
+                        response = client.get(url, params)
+                        if response.status_code != 200:
+                            raise AssertionError(response.content)
+                        sizes.append(len(response.content))
+
+                    with CaptureQueriesContext(connection) as queries:
+                        get()
+                    samples = measure(get, repeat)
+                    self.stdout.write(summary(f'{label}, {variant}', samples)
+                                      + f', {statistics.median(sizes):.0f} bytes')
+                    self.stdout.write(f'    {self.main_select(model, queries)}')
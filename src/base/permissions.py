@@ -1,25 +1,16 @@
-import os, logging, requests, json
+import logging
 from rest_framework import permissions
 from django.conf import settings
 
+from base.authorization import get_authorization_client
+
 logger = logging.getLogger(__name__)
 
 
 class EvalyAPIUserPermission(permissions.BasePermission):
 
     def is_authorized(self, action, module, role):
-        payload = {
-            "platform": "ebilling",
-            "module": module,
-            "role": role,
-            "action": action
-        }
-        response = requests.post(
-            f"{os.environ.get('AUTHORIZATION_SERVICE')}/authorize",
-            json=payload,
-            headers={'secret-key': settings.EVALY_API_SECRET_KEY}
-        )
-        return response.json().get('success')
+        return get_authorization_client().is_authorized(action, module, role)
 
     """
     Allows access only to users who have the appropriate permission.
@@ -0,0 +1,99 @@
+"""
+Read replicas with read-your-writes.
+
+``ReplicaRouter`` sends reads to a random alias of ``DB_REPLICA_ALIASES`` only
+while ``ReplicaMiddleware`` allows it: during GET/HEAD/OPTIONS requests, until
+the request writes. Everything else (other methods, management commands,
+atomic blocks and any write) uses the primary. After a write the middleware
+sets a short-lived cookie so the client's following requests also read the
+primary until the replicas have caught up (``DB_REPLICA_PIN_SECONDS``).
+
+Views override the choice with a ``read_database`` attribute (or the
+``read_database`` decorator on function views): ``PRIMARY`` for reads that must
+see the latest writes, ``REPLICA`` for reports served from a replica whatever
+the method. ``use_primary()`` does the same for a block of code.
+"""
+import random
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+PRIMARY = 'primary'
+REPLICA = 'replica'
+PIN_COOKIE = 'db_primary'
+
+_state = threading.local()
+
+
+def _replica_allowed():
+    return getattr(_state, 'replica', False)
+
+
+@contextmanager
+def use_primary():
+    allowed = _replica_allowed()
+    _state.replica = False
+    try:
+        yield
+    finally:
+        _state.replica = allowed
+
+
+def read_database(choice):
+    """Function view decorator; put it above ``@api_view``"""
+    def decorator(view):
+        view.read_database = choice
+        return view
+    return decorator
+
+
+class ReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        if not _replica_allowed() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DB_REPLICA_ALIASES)
+
+    def db_for_write(self, model, **hints):
+        # The rest of the request reads what it wrote
+        _state.replica = False
+        _state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        _state.replica = request.method in SAFE_METHODS and PIN_COOKIE not in request.COOKIES
+        _state.wrote = False
+        try:
+            response = self.get_response(request)
+            wrote = _state.wrote
+        finally:
+            _state.replica = _state.wrote = False
+        if wrote:
+            response.set_cookie(PIN_COOKIE, '1', max_age=settings.DB_REPLICA_PIN_SECONDS, httponly=True,
+                                samesite='Lax')
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # DRF views keep their class on ``cls``
+        choice = getattr(view_func, 'read_database', None) or getattr(getattr(view_func, 'cls', None),
+                                                                     'read_database', None)
+        if choice == PRIMARY:
+            _state.replica = False
+        elif choice == REPLICA and not _state.wrote:
+            _state.replica = True
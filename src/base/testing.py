@@ -0,0 +1,95 @@
+"""
+Builders for test data shared by the apps' test suites.
+
+Every builder fills the required fields with unique defaults and accepts
+overrides as keyword arguments. ``ConstantQueriesMixin`` guards list endpoints
+against per-row queries.
+"""
+from datetime import timedelta
+from itertools import count
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from account.models import Account
+from booking.models import Booking
+from hotel.models import Hotel
+from payment.models import Payment
+from room.models import Room
+
+_sequence = count(1)
+
+
+def make_account(role=Account.USER, **fields):
+    number = next(_sequence)
+    account = Account.objects.create_user(fields.pop('email', f'{role.lower()}{number}@example.com'), 'test-pass-123')
+    account.role = role
+    for name, value in fields.items():
+        setattr(account, name, value)
+    account.save()
+    return account
+
+
+def make_hotel(landlord, **fields):
+    number = next(_sequence)
+    defaults = {
+        'name': f'Hotel {number}',
+        'address': f'{number} Lake Road',
+        'city': 'Dhaka',
+        'country': 'Bangladesh',
+        'created_by': landlord.email,
+    }
+    defaults.update(fields)
+    return Hotel.objects.create(landlord=landlord, **defaults)
+
+
+def make_room(hotel, **fields):
+    number = next(_sequence)
+    defaults = {
+        'room_no': str(number),
+        'floor_no': 1,
+        'capacity': 2,
+        'price': 100.0,
+        'created_by': hotel.created_by,
+    }
+    defaults.update(fields)
+    return Room.objects.create(hotel=hotel, **defaults)
+
+
+def make_booking(room, start=None, nights=1, **fields):
+    start = start or timezone.now() + timedelta(days=1)
+    defaults = {
+        'customer_phone_no': f'0170000{next(_sequence):04d}',
+        'price': room.price * nights,
+        'discounted_price': room.price * nights,
+        'booking_time': timezone.now(),
+        'booking_start_time': start,
+        'booking_end_time': start + timedelta(days=nights),
+    }
+    defaults.update(fields)
+    return Booking.objects.create(room=room, **defaults)
+
+
+def make_payment(booking, **fields):
+    defaults = {'amount': booking.discounted_price}
+    defaults.update(fields)
+    return Payment.objects.create(booking=booking, **defaults)
+
+
+class ConstantQueriesMixin:
+    """TestCase mixin failing when a list endpoint runs more queries for a bigger page"""
+
+    def _list_queries(self, client, url, page_size):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, {'page_size': page_size})
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(len(response.data['data']), page_size, 'not enough rows to compare pages')
+        return len(queries)
+
+    def assertConstantQueries(self, url, client=None, sizes=(1, 10)):
+        client = client or self.client
+        # One-off lookups (content types, caches) must not count against the first page
+        self._list_queries(client, url, sizes[0])
+        small, large = (self._list_queries(client, url, size) for size in sizes)
+        self.assertEqual(small, large, f'{url}: {small} queries for {sizes[0]} rows but {large} for {sizes[1]}')
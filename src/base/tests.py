@@ -1,3 +1,238 @@
-from django.test import TestCase
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.db import DEFAULT_DB_ALIAS, connections, router
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from base.authorization import AuthorizationClient
+from base.db import check_connections, mark_idle
+from base.routers import PIN_COOKIE, PRIMARY, REPLICA, ReplicaMiddleware, ReplicaRouter, read_database, use_primary
+from hotel.models import Hotel
+
+REPLICAS = ['replica_0', 'replica_1']
+
+
+@override_settings(DB_REPLICA_ALIASES=REPLICAS)
+class ReplicaRoutingTests(SimpleTestCase):
+    """
+    Routing decisions for two replica aliases. ``QuerySet.db`` asks the router
+    without connecting, so the aliases need no database behind them.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(router, 'routers', [ReplicaRouter()])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.factory = RequestFactory()
+
+    def _serve(self, request, view):
+        """Run ``view`` behind ReplicaMiddleware; returns (response, aliases the view read from)"""
+        aliases = []
+
+        def recording_view(request):
+            aliases.append(Hotel.objects.all().db)
+            if request.method == 'POST' or request.GET.get('write'):
+                router.db_for_write(Hotel)
+                aliases.append(Hotel.objects.all().db)
+            return HttpResponse()
+        recording_view.read_database = getattr(view, 'read_database', None)
+
+        def get_response(request):
+            middleware.process_view(request, recording_view, (), {})
+            return recording_view(request)
+        middleware = ReplicaMiddleware(get_response)
+        return middleware(request), aliases
+
+    def test_safe_request_reads_from_a_replica(self):
+        response, aliases = self._serve(self.factory.get('/api/hotel/'), None)
+        self.assertIn(aliases[0], REPLICAS)
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_reads_spread_over_every_replica(self):
+        seen = {self._serve(self.factory.get('/api/hotel/'), None)[1][0] for _ in range(100)}
+        self.assertEqual(seen, set(REPLICAS))
+
+    def test_unsafe_request_reads_from_primary(self):
+        response, aliases = self._serve(self.factory.post('/api/hotel/'), None)
+        self.assertEqual(aliases, [DEFAULT_DB_ALIAS, DEFAULT_DB_ALIAS])
+
+    def test_write_pins_the_rest_of_the_request_and_the_client(self):
+        response, aliases = self._serve(self.factory.get('/api/hotel/', {'write': 1}), None)
+        self.assertIn(aliases[0], REPLICAS)
+        self.assertEqual(aliases[1], DEFAULT_DB_ALIAS)
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+    def test_pinned_client_reads_from_primary(self):
+        request = self.factory.get('/api/hotel/')
+        request.COOKIES[PIN_COOKIE] = '1'
+        response, aliases = self._serve(request, None)
+        self.assertEqual(aliases, [DEFAULT_DB_ALIAS])
+
+    def test_view_override_to_primary(self):
+        @read_database(PRIMARY)
+        def view(request):
+            pass
+        response, aliases = self._serve(self.factory.get('/api/booking/'), view)
+        self.assertEqual(aliases, [DEFAULT_DB_ALIAS])
+
+    def test_view_override_to_replica(self):
+        class View:
+            read_database = REPLICA
+        response, aliases = self._serve(self.factory.post('/admin-panel/'), View)
+        self.assertIn(aliases[0], REPLICAS)
+        self.assertEqual(aliases[1], DEFAULT_DB_ALIAS)
+
+    def test_use_primary_block(self):
+        request = self.factory.get('/api/hotel/')
+        aliases = []
+
+        def get_response(request):
+            with use_primary():
+                aliases.append(Hotel.objects.all().db)
+            aliases.append(Hotel.objects.all().db)
+            return HttpResponse()
+        ReplicaMiddleware(get_response)(request)
+        self.assertEqual(aliases[0], DEFAULT_DB_ALIAS)
+        self.assertIn(aliases[1], REPLICAS)
+
+    def test_atomic_block_reads_from_primary(self):
+        aliases = []
+
+        def get_response(request):
+            with mock.patch.object(connections[DEFAULT_DB_ALIAS], 'in_atomic_block', True):
+                aliases.append(Hotel.objects.all().db)
+            return HttpResponse()
+        ReplicaMiddleware(get_response)(self.factory.get('/api/hotel/'))
+        self.assertEqual(aliases, [DEFAULT_DB_ALIAS])
+
+    def test_outside_requests_use_primary(self):
+        # Management commands, shells and background threads never pass through the middleware
+        self.assertEqual(Hotel.objects.all().db, DEFAULT_DB_ALIAS)
+
+    def test_migrations_only_run_on_primary(self):
+        self.assertTrue(ReplicaRouter().allow_migrate(DEFAULT_DB_ALIAS, 'hotel'))
+        self.assertFalse(ReplicaRouter().allow_migrate('replica_0', 'hotel'))
+
+
+@override_settings(DB_CONN_HEALTH_CHECK_IDLE=10)
+class ConnectionHealthCheckTests(SimpleTestCase):
+    """check_connections against stand-in connection wrappers; only suspect connections are pinged"""
+
+    def setUp(self):
+        self.connection = mock.Mock(connection=object(), in_atomic_block=False, errors_occurred=False)
+        self.connection.is_usable.return_value = True
+        patcher = mock.patch('base.db.connections', mock.Mock(all=lambda: [self.connection]))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _idle_for(self, seconds):
+        mark_idle()
+        with mock.patch('base.db.time.monotonic', return_value=time.monotonic() + seconds):
+            check_connections()
+
+    def test_recently_used_connection_is_not_pinged(self):
+        self._idle_for(1)
+        self.connection.is_usable.assert_not_called()
+
+    def test_idle_connection_is_pinged(self):
+        self._idle_for(60)
+        self.connection.is_usable.assert_called_once()
+        self.connection.close.assert_not_called()
+
+    def test_dead_idle_connection_is_closed(self):
+        self.connection.is_usable.return_value = False
+        self._idle_for(60)
+        self.connection.close.assert_called_once()
+
+    def test_connection_with_errors_is_pinged(self):
+        self.connection.errors_occurred = True
+        self._idle_for(1)
+        self.connection.is_usable.assert_called_once()
+        self.assertFalse(self.connection.errors_occurred)
+
+    def test_closed_and_atomic_connections_are_skipped(self):
+        self.connection.in_atomic_block = True
+        self._idle_for(60)
+        self.connection.connection = None
+        self.connection.in_atomic_block = False
+        self._idle_for(60)
+        self.connection.is_usable.assert_not_called()
+
+
+class StubAuthorizationHandler(BaseHTTPRequestHandler):
+    """``POST /authorize`` allowing admins only; ``server.status`` and ``server.delay`` shape the reply"""
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.calls.append((payload, self.headers.get('secret-key')))
+        time.sleep(self.server.delay)
+        body = json.dumps({'success': payload['role'] == 'ADMIN'}).encode()
+        try:
+            self.send_response(self.server.status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except ConnectionError:
+            # The client gave up (timeout test)
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AuthorizationClientTests(SimpleTestCase):
+    """AuthorizationClient against a local stub of the authorization service"""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubAuthorizationHandler)
+        self.server.daemon_threads = True
+        self.server.calls, self.server.status, self.server.delay = [], 200, 0
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        host, port = self.server.server_address
+        self.client = AuthorizationClient(f'http://{host}:{port}', 'stub-secret', timeout=(1.0, 0.5), cache_ttl=60)
+
+    def test_decisions_are_cached_per_module_role_action(self):
+        self.assertTrue(self.client.is_authorized('create', 'hotel', 'ADMIN'))
+        self.assertTrue(self.client.is_authorized('create', 'hotel', 'ADMIN'))
+        self.assertFalse(self.client.is_authorized('create', 'hotel', 'USER'))
+
+        self.assertEqual(len(self.server.calls), 2)
+        payload, secret = self.server.calls[0]
+        self.assertEqual(payload, {'platform': 'ebilling', 'module': 'hotel', 'role': 'ADMIN', 'action': 'create'})
+        self.assertEqual(secret, 'stub-secret')
+        metrics = self.client.metrics.snapshot()
+        self.assertEqual((metrics['hits'], metrics['misses']), (1, 2))
+
+    def test_failures_are_not_cached(self):
+        self.server.status = 503
+        with self.assertRaises(requests.HTTPError):
+            self.client.is_authorized('delete', 'room', 'ADMIN')
+        self.server.status = 200
+        self.assertTrue(self.client.is_authorized('delete', 'room', 'ADMIN'))
+        self.assertEqual(len(self.server.calls), 2)
+        self.assertEqual(self.client.metrics.snapshot()['errors'], 1)
+
+    def test_slow_service_times_out(self):
+        self.server.delay = 1.0
+        with self.assertRaises(requests.Timeout):
+            self.client.is_authorized('view', 'booking', 'ADMIN')
+
+    def test_preload_warms_the_cache(self):
+        entries = [(module, role, 'view') for module in ('hotel', 'room', 'booking') for role in ('ADMIN', 'USER')]
+        with self.assertLogs('base.authorization', 'WARNING'):
+            self.client.preload(entries + [('malformed',)])
+        self.assertEqual(len(self.server.calls), len(entries))
+
+        for module, role, action in entries:
+            self.assertEqual(self.client.is_authorized(action, module, role), role == 'ADMIN')
+        self.assertEqual(len(self.server.calls), len(entries))
+        self.assertEqual(self.client.metrics.snapshot()['hits'], len(entries))
@@ -11,6 +11,7 @@ class BookingAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'updated_at', 'created_by', 'updated_by')
     date_hierarchy = 'booking_start_time'
     list_per_page = 25
+    list_select_related = ('room', 'room__hotel')
 
     fieldsets = (
         ('Booking Information', {
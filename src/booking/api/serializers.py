@@ -3,20 +3,34 @@ from rest_framework import serializers
 from booking.models import Booking
 
 
+def validate_period(attrs, instance=None):
+    """Stays are half-open [start, end); an empty or reversed one would never conflict with anything"""
+    start = attrs.get('booking_start_time', getattr(instance, 'booking_start_time', None))
+    end = attrs.get('booking_end_time', getattr(instance, 'booking_end_time', None))
+    if start and end and end <= start:
+        raise serializers.ValidationError('Booking end time must be after the start time.')
+    return attrs
+
+
 class BookingSerializer(serializers.ModelSerializer):
     room_no = serializers.SerializerMethodField()
+    sparse_sources = {'room_no': ['room__room_no']}
 
     class Meta:
         model = Booking
         fields = '__all__'
         read_only_fields = ('created_by', 'updated_by', 'created_at', 'updated_at')
 
+    def validate(self, attrs):
+        return validate_period(attrs, self.instance)
+
     def get_room_no(self, obj):
         return obj.room.room_no if obj.room else None
 
 
 class BookingListSerializer(serializers.ModelSerializer):
     room_no = serializers.SerializerMethodField()
+    sparse_sources = {'room_no': ['room__room_no']}
 
     class Meta:
         model = Booking
@@ -24,3 +38,16 @@ class BookingListSerializer(serializers.ModelSerializer):
 
     def get_room_no(self, obj):
         return obj.room.room_no if obj.room else None
+
+
+class BookingBulkItemSerializer(serializers.ModelSerializer):
+    """One entry of a bulk request; rooms are resolved for the whole batch at once"""
+    room = serializers.IntegerField()
+
+    class Meta:
+        model = Booking
+        fields = ('room', 'customer_phone_no', 'price', 'discounted_price', 'booking_time',
+                  'booking_start_time', 'booking_end_time')
+
+    def validate(self, attrs):
+        return validate_period(attrs)
@@ -7,12 +7,20 @@ booking_list = BookingViewset.as_view({
     'get': 'list',
     'post': 'create'
 })
+booking_bulk = BookingViewset.as_view({
+    'post': 'bulk'
+})
+booking_export = BookingViewset.as_view({
+    'get': 'export'
+})
 booking_detail = BookingViewset.as_view({
     'get': 'retrieve'
 })
 
 urlpatterns = [
     path('', booking_list, name='booking-list'),
+    path('bulk', booking_bulk, name='booking-bulk'),
+    path('export', booking_export, name='booking-export'),
     path('<int:pk>/', booking_detail, name='booking-detail'),
     path('<int:pk>/checkin/', check_in, name='check-in'),
     path('<int:pk>/checkout/', check_out, name='check-out'),
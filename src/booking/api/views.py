@@ -3,30 +3,39 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, filters, mixins, viewsets
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
-from base.helpers import CustomPagination
+from base.helpers import CustomPagination, SparseFieldsMixin
 from booking.models import Booking
-from .serializers import BookingSerializer, BookingListSerializer
+from .serializers import BookingSerializer, BookingListSerializer, BookingBulkItemSerializer
 from django.utils.decorators import method_decorator
 from rest_framework.decorators import api_view, permission_classes
 from datetime import datetime
-from payment.models import Payment
 from rest_framework.exceptions import ValidationError
-from django.db.models import Sum
+from django.db import transaction
 
+from base.exceptions import Conflict
+from base.helpers.streaming import compress_param, data_format_param, stream_rows
+from base.routers import PRIMARY
+from booking.availability import filter_period, is_room_free, lock_room, parse_id
+from booking.bulk import CREATED, INVALID, create_bookings
 from booking.validation import booking_validation
+from payment.aggregates import booking_paid_amount
 
 
-class BookingViewset(mixins.ListModelMixin,
+class BookingViewset(SparseFieldsMixin,
+                  mixins.ListModelMixin,
                   mixins.CreateModelMixin,
                   mixins.RetrieveModelMixin,
                   viewsets.GenericViewSet):
-    queryset = Booking.objects.filter()
+    queryset = Booking.objects.select_related('room')
     serializer_class = BookingSerializer
     pagination_class = CustomPagination
     lookup_field = 'pk'
     filter_backends = [filters.OrderingFilter, DjangoFilterBackend]
     ordering_fields = ['-created_at']
     permission_classes = [permissions.IsAuthenticated, ]
+    # Guests read back bookings right after making them; never serve these from a lagging replica
+    read_database = PRIMARY
+    bulk_limit = 500
 
     filterset_fields = [
         'customer_phone_no', 'room'
@@ -65,6 +74,12 @@ class BookingViewset(mixins.ListModelMixin,
         if not user.is_role_user():
             raise PermissionDenied("Only regular users can make bookings")
 
+        # Caller holds a transaction; the room lock serializes concurrent bookings of one room
+        data = serializer.validated_data
+        room = lock_room(data['room'])
+        if not is_room_free(room, data['booking_start_time'], data['booking_end_time']):
+            raise Conflict('Room is not available between the given time range.')
+
         serializer.save(created_by=user.email)
 
     def list(self, request, *args, **kwargs):
@@ -75,10 +90,87 @@ class BookingViewset(mixins.ListModelMixin,
         data = request.data.copy()
         serializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
+        with transaction.atomic():
+            self.perform_create(serializer)
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
+    def bulk(self, request, *args, **kwargs):
+        """
+        Create many bookings at once. Body: a list of booking objects.
+        Conflicts with existing bookings and within the batch are resolved per room in
+        start-time order; every item gets its own result.
+        """
+        user = request.user
+        if not user.is_role_user():
+            raise PermissionDenied("Only regular users can make bookings")
+
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError(detail='A non-empty list of bookings is required.')
+        if len(items) > self.bulk_limit:
+            raise ValidationError(detail=f'At most {self.bulk_limit} bookings can be created at once.')
+
+        results = {}
+        entries = []
+        for position, item in enumerate(items):
+            serializer = BookingBulkItemSerializer(data=item)
+            if serializer.is_valid():
+                entries.append((position, serializer.validated_data))
+            else:
+                results[position] = (INVALID, serializer.errors)
+        results.update(create_bookings(entries, created_by=user.email))
+
+        data = []
+        for position in range(len(items)):
+            result, detail = results[position]
+            if result == CREATED:
+                data.append({'index': position, 'status': result, 'booking': BookingSerializer(detail).data})
+            else:
+                data.append({'index': position, 'status': result, 'errors': detail})
+        created = sum(1 for result, detail in results.values() if result == CREATED)
+        return Response({
+            'created': created,
+            'failed': len(items) - created,
+            'results': data
+        }, status=status.HTTP_200_OK)
+
+    # (column, lookup) pairs; room and hotel columns are joined into the same query
+    EXPORT_COLUMNS = [
+        ('id', 'id'),
+        ('customer_phone_no', 'customer_phone_no'),
+        ('room', 'room_id'),
+        ('room_no', 'room__room_no'),
+        ('hotel', 'room__hotel_id'),
+        ('hotel_name', 'room__hotel__name'),
+        ('price', 'price'),
+        ('discounted_price', 'discounted_price'),
+        ('booking_time', 'booking_time'),
+        ('booking_start_time', 'booking_start_time'),
+        ('booking_end_time', 'booking_end_time'),
+        ('last_checkin_time', 'last_checkin_time'),
+        ('last_checkout_time', 'last_checkout_time'),
+        ('created_by', 'created_by'),
+        ('created_at', 'created_at'),
+    ]
+
+    def export(self, request, *args, **kwargs):
+        """
+        Stream the caller's bookings as CSV (default) or NDJSON for accounting.
+        Query params: data_format, gzip, hotel, start, end (on created_at) and the list filters.
+        """
+        params = request.query_params
+        queryset = self.filter_queryset(self.get_queryset())
+        hotel_id = parse_id(params, 'hotel')
+        if hotel_id:
+            queryset = queryset.filter(room__hotel=hotel_id)
+        queryset = filter_period(queryset, params)
+
+        columns, lookups = zip(*self.EXPORT_COLUMNS)
+        rows = queryset.order_by('created_at', 'id').values_list(*lookups).iterator(chunk_size=2000)
+        return stream_rows(columns, rows, data_format_param(request), 'bookings',
+                           compress=compress_param(request))
+
 
 @api_view(['PATCH'])
 # @permission_classes([permissions.IsAuthenticated])
@@ -88,8 +180,7 @@ def check_in(request, pk):
         booking = Booking.objects.get(pk=pk)
         booking.last_checkin_time = datetime.now().isoformat()
 
-        paid_amount = Payment.objects.filter(booking=pk).aggregate(sum=Sum('amount'))
-        paid_amount = paid_amount['sum'] if paid_amount['sum'] is not None else 0.0
+        paid_amount = booking_paid_amount(pk)
         if paid_amount * 2 < Booking.objects.get(pk=pk).discounted_price:
             raise ValidationError(detail=f'Minimum 50% advance payment required before check in.')
 
@@ -111,8 +202,7 @@ def check_out(request, pk):
         booking = Booking.objects.get(pk=pk)
         booking.last_checkout_time = datetime.now().isoformat()
 
-        paid_amount = Payment.objects.filter(booking=pk).aggregate(sum=Sum('amount'))
-        paid_amount = paid_amount['sum'] if paid_amount['sum'] is not None else 0.0
+        paid_amount = booking_paid_amount(pk)
         if paid_amount != Booking.objects.get(pk=pk).discounted_price:
             raise ValidationError(detail=f'Full payment required before check out.')
 
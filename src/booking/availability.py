@@ -0,0 +1,196 @@
+"""
+Room availability engine.
+
+A booking occupies its room over the half-open interval
+``[booking_start_time, booking_end_time)``. Two intervals overlap when each
+one starts before the other one ends, which also covers bookings that fully
+contain (or are contained by) the requested window.
+
+Single-room checks go to the database as one lookup on the
+``(room, booking_start_time, booking_end_time)`` index. Callers that need to
+answer many questions at once (search, bulk validation) can build an
+``AvailabilityIndex`` from a single query and probe it in memory.
+"""
+from bisect import bisect_left
+from datetime import datetime, time
+
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from booking.models import Booking
+from room.models import Room
+
+
+def parse_moment(value):
+    """Parse an ISO datetime or a plain date (taken as midnight) into an aware datetime"""
+    if not value:
+        return None
+    try:
+        moment = parse_datetime(value)
+        if moment is None:
+            day = parse_date(value)
+            moment = datetime.combine(day, time.min) if day else None
+    except ValueError:
+        return None
+    if moment is not None and timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def parse_window(start, end):
+    """Validate a requested ``[start, end)`` window given as query/body strings"""
+    start, end = parse_moment(start), parse_moment(end)
+    if start is None or end is None:
+        raise ValidationError(detail='Valid start and end are required.')
+    if end <= start:
+        raise ValidationError(detail='End must be after start.')
+    return start, end
+
+
+def parse_id(params, name):
+    """Optional positive integer id query param; ``None`` when absent"""
+    value = params.get(name)
+    if not value:
+        return None
+    if not value.isdigit() or int(value) == 0:
+        raise ValidationError(detail=f'{name} must be a positive integer id.')
+    return int(value)
+
+
+def filter_period(queryset, params, field='created_at'):
+    """Apply optional ``start`` (inclusive) and ``end`` (exclusive) query params to ``field``"""
+    for param, lookup in (('start', f'{field}__gte'), ('end', f'{field}__lt')):
+        if params.get(param):
+            moment = parse_moment(params.get(param))
+            if moment is None:
+                raise ValidationError(detail=f'Invalid {param}.')
+            queryset = queryset.filter(**{lookup: moment})
+    return queryset
+
+
+def overlapping(start, end, prefix=''):
+    """
+    Q object matching bookings that overlap ``[start, end)``.
+    ``prefix`` allows the lookup to be used across a relation, e.g. ``booking__``.
+    """
+    return Q(**{
+        f'{prefix}booking_start_time__lt': end,
+        f'{prefix}booking_end_time__gt': start,
+    })
+
+
+def overlapping_bookings(room, start, end):
+    """Bookings of ``room`` that overlap ``[start, end)``"""
+    return Booking.objects.filter(overlapping(start, end), room=room).order_by()
+
+
+def is_room_free(room, start, end):
+    """Single indexed lookup answering whether ``room`` is free for ``[start, end)``"""
+    return not overlapping_bookings(room, start, end).exists()
+
+
+def lock_room(room):
+    """
+    Take a row lock on ``room`` until the surrounding transaction ends.
+    Concurrent bookings of the same room queue up here, so a check followed by
+    an insert inside the same transaction cannot race.
+    """
+    return Room.objects.select_for_update().get(pk=getattr(room, 'pk', room))
+
+
+def exclude_booked(rooms, start, end):
+    """
+    Restrict a ``Room`` queryset to rooms without any booking overlapping ``[start, end)``.
+    Compiles to a single anti-join (``NOT EXISTS``) so it scales with the result, not the table.
+    """
+    booked = Booking.objects.filter(overlapping(start, end), room=OuterRef('pk'))
+    return rooms.filter(~Exists(booked.order_by()))
+
+
+class RoomIntervals:
+    """
+    Sorted intervals of one room.
+    ``ends_max[i]`` is the latest end among the first ``i + 1`` intervals, so an
+    overlap probe is a binary search plus one comparison even when legacy data
+    contains overlapping bookings.
+    """
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.ends_max = []
+
+    def _reindex(self, position):
+        running = self.ends_max[position - 1] if position else None
+        for i in range(position, len(self.ends)):
+            running = self.ends[i] if running is None or self.ends[i] > running else running
+            self.ends_max[i] = running
+
+    def add(self, start, end):
+        if not self.starts or start >= self.starts[-1]:
+            # Fast path for rows arriving in start order
+            previous = self.ends_max[-1] if self.ends_max else end
+            self.starts.append(start)
+            self.ends.append(end)
+            self.ends_max.append(end if end > previous else previous)
+            return
+        position = bisect_left(self.starts, start)
+        self.starts.insert(position, start)
+        self.ends.insert(position, end)
+        self.ends_max.insert(position, end)
+        self._reindex(position)
+
+    def is_free(self, start, end):
+        # Intervals starting before ``end`` are candidates; one of them overlaps
+        # if the latest end among them is after ``start``.
+        candidates = bisect_left(self.starts, end)
+        return not candidates or self.ends_max[candidates - 1] <= start
+
+    def __len__(self):
+        return len(self.starts)
+
+
+class AvailabilityIndex:
+    """
+    In-process per-room interval index rebuilt from the database.
+
+    Usage:
+        index = AvailabilityIndex.from_db(room_ids=[1, 2, 3], start=start, end=end)
+        index.is_free(1, start, end)
+    """
+
+    def __init__(self):
+        self._rooms = {}
+
+    @classmethod
+    def from_db(cls, room_ids=None, start=None, end=None):
+        """
+        Load bookings in one query. ``start``/``end`` limit the load to bookings
+        overlapping that window, which is all that is needed to answer probes inside it.
+        """
+        queryset = Booking.objects.order_by('room_id', 'booking_start_time')
+        if room_ids is not None:
+            queryset = queryset.filter(room_id__in=list(room_ids))
+        if start is not None and end is not None:
+            queryset = queryset.filter(overlapping(start, end))
+
+        index = cls()
+        rows = queryset.values_list('room_id', 'booking_start_time', 'booking_end_time')
+        for room_id, booking_start, booking_end in rows.iterator():
+            index.add(room_id, booking_start, booking_end)
+        return index
+
+    def add(self, room_id, start, end):
+        intervals = self._rooms.get(room_id)
+        if intervals is None:
+            intervals = self._rooms[room_id] = RoomIntervals()
+        intervals.add(start, end)
+
+    def is_free(self, room_id, start, end):
+        intervals = self._rooms.get(room_id)
+        return intervals is None or intervals.is_free(start, end)
+
+    def free_rooms(self, room_ids, start, end):
+        return [room_id for room_id in room_ids if self.is_free(room_id, start, end)]
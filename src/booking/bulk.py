@@ -0,0 +1,59 @@
+"""
+Set-based creation of many bookings in one transaction.
+
+All rooms of the batch are locked together (in id order, so concurrent batches
+cannot deadlock), existing bookings over the batch window are loaded in one
+query, and every room's requests are swept in start order against an
+``AvailabilityIndex``. Accepted rows are inserted with a single ``bulk_create``.
+"""
+from django.db import transaction
+
+from booking.availability import AvailabilityIndex
+from booking.models import Booking
+from booking.signals import bookings_bulk_created
+from room.models import Room
+
+CREATED = 'created'
+CONFLICT = 'conflict'
+INVALID = 'invalid'
+
+
+def create_bookings(entries, created_by):
+    """
+    ``entries`` is a list of (position, validated_data) with ``room`` as an id.
+    Returns {position: (status, booking or error message)}.
+    """
+    results = {}
+    if not entries:
+        return results
+
+    room_ids = sorted({data['room'] for position, data in entries})
+    window_start = min(data['booking_start_time'] for position, data in entries)
+    window_end = max(data['booking_end_time'] for position, data in entries)
+
+    with transaction.atomic():
+        # The locked rows are attached to the new bookings, so serializing them needs no query per room
+        rooms = {room.pk: room for room in Room.objects.select_for_update().filter(pk__in=room_ids).order_by('pk')}
+        index = AvailabilityIndex.from_db(room_ids=rooms, start=window_start, end=window_end)
+
+        accepted = []
+        ordered = sorted(entries, key=lambda entry: (entry[1]['room'], entry[1]['booking_start_time'], entry[0]))
+        for position, data in ordered:
+            room_id, start, end = data['room'], data['booking_start_time'], data['booking_end_time']
+            if room_id not in rooms:
+                results[position] = (INVALID, 'Room not found.')
+            elif not index.is_free(room_id, start, end):
+                results[position] = (CONFLICT, 'Room is not available between the given time range.')
+            else:
+                index.add(room_id, start, end)
+                fields = {key: value for key, value in data.items() if key != 'room'}
+                booking = Booking(room=rooms[room_id], created_by=created_by, **fields)
+                accepted.append((position, booking))
+
+        created = Booking.objects.bulk_create([booking for position, booking in accepted])
+        for (position, booking), saved in zip(accepted, created):
+            results[position] = (CREATED, saved)
+
+        if created:
+            bookings_bulk_created.send(sender=Booking, bookings=created)
+    return results
@@ -0,0 +1,131 @@
+"""
+Per-day room occupancy.
+
+``RoomNight`` holds one row per room per occupied night, derived from bookings.
+Signals keep it in step with booking saves and bulk creation (deletes cascade),
+and ``rebuild`` (the ``rebuild_calendar`` command) recomputes it from the
+bookings table. Reading a calendar is one ``(room, date)`` or ``(hotel, date)``
+index range.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from base.helpers.streaming import chunked
+from booking.models import Booking, RoomNight
+from room.models import Room
+
+DEFAULT_DAYS = 30
+MAX_DAYS = 366
+
+
+def _local_date(moment):
+    return timezone.localtime(moment).date() if timezone.is_aware(moment) else moment.date()
+
+
+def nights(start, end):
+    """Dates a stay over ``[start, end)`` occupies; a same-day stay occupies its day"""
+    first, last = _local_date(start), _local_date(end)
+    return [first + timedelta(days=offset) for offset in range(max((last - first).days, 1))]
+
+
+def _rows(booking, hotel_id):
+    dates = nights(booking.booking_start_time, booking.booking_end_time)
+    rate = booking.discounted_price / len(dates)
+    return [
+        RoomNight(room_id=booking.room_id, hotel_id=hotel_id, date=day, booking_id=booking.pk, rate=rate)
+        for day in dates
+    ]
+
+
+def _hotel_ids(room_ids):
+    return dict(Room.objects.filter(pk__in=room_ids).values_list('pk', 'hotel_id'))
+
+
+def sync_booking(booking):
+    """Replace the nights of one created or changed booking"""
+    hotel_id = _hotel_ids([booking.room_id]).get(booking.room_id)
+    with transaction.atomic():
+        RoomNight.objects.filter(booking=booking.pk).delete()
+        RoomNight.objects.bulk_create(_rows(booking, hotel_id))
+
+
+def add_bookings(bookings):
+    """Nights for newly created bookings, e.g. from ``bulk_create`` which sends no post_save"""
+    hotel_ids = _hotel_ids({booking.room_id for booking in bookings})
+    rows = [row for booking in bookings for row in _rows(booking, hotel_ids.get(booking.room_id))]
+    RoomNight.objects.bulk_create(rows, batch_size=1000)
+
+
+def move_room(room):
+    """Follow a room moved to another hotel"""
+    RoomNight.objects.filter(room=room).exclude(hotel_id=room.hotel_id).update(hotel_id=room.hotel_id)
+
+
+def rebuild(room_ids=None, chunk_size=2000):
+    """Recompute the calendar (of ``room_ids``, or everything); returns the number of bookings"""
+    bookings = Booking.objects.order_by('pk').only(
+        'id', 'room_id', 'booking_start_time', 'booking_end_time', 'discounted_price'
+    )
+    stale = RoomNight.objects.all()
+    if room_ids:
+        bookings, stale = bookings.filter(room__in=room_ids), stale.filter(room__in=room_ids)
+
+    count = 0
+    with transaction.atomic():
+        stale.delete()
+        for chunk in chunked(bookings.iterator(chunk_size=chunk_size), chunk_size):
+            add_bookings(chunk)
+            count += len(chunk)
+    return count
+
+
+def parse_range(params):
+    """``from`` (default today) and ``to`` (exclusive, default 30 days later) query params"""
+    try:
+        start = parse_date(params['from']) if params.get('from') else timezone.localdate()
+        end = parse_date(params['to']) if params.get('to') else start + timedelta(days=DEFAULT_DAYS)
+    except (ValueError, TypeError):
+        start = end = None
+    if start is None or end is None:
+        raise ValidationError(detail='from and to must be dates (YYYY-MM-DD).')
+    if not 0 < (end - start).days <= MAX_DAYS:
+        raise ValidationError(detail=f'to must be after from and at most {MAX_DAYS} days later.')
+    return start, end
+
+
+def _dates(start, end):
+    return [start + timedelta(days=offset) for offset in range((end - start).days)]
+
+
+def room_calendar(room, start, end):
+    """Every date of ``[start, end)`` with the booking occupying it (None when free) and its nightly rate"""
+    occupied = {}
+    for day, booking_id, rate in RoomNight.objects.filter(room=room, date__gte=start, date__lt=end).values_list(
+            'date', 'booking_id', 'rate'):
+        occupied.setdefault(day, (booking_id, rate))
+    return [
+        {'date': day, 'booking': occupied.get(day, (None, None))[0], 'rate': occupied.get(day, (None, None))[1]}
+        for day in _dates(start, end)
+    ]
+
+
+def hotel_grid(hotel, start, end):
+    """Rooms x dates of ``[start, end)``: each room maps occupied ISO dates to booking ids"""
+    rooms = list(Room.objects.filter(hotel=hotel).order_by('room_no').values('id', 'room_no', 'is_available'))
+    grid = {room['id']: {} for room in rooms}
+    for room_id, day, booking_id in RoomNight.objects.filter(hotel=hotel, date__gte=start, date__lt=end).values_list(
+            'room_id', 'date', 'booking_id'):
+        grid.setdefault(room_id, {}).setdefault(day.isoformat(), booking_id)
+
+    dates = _dates(start, end)
+    occupied = sum(len(grid[room['id']]) for room in rooms)
+    capacity = len(rooms) * len(dates)
+    return {
+        'dates': dates,
+        'rooms': [dict(room, nights=grid[room['id']]) for room in rooms],
+        'occupancy': round(occupied / capacity, 4) if capacity else 0.0,
+    }
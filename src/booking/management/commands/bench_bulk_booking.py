@@ -0,0 +1,73 @@
+import random
+import statistics
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from account.models import Account
+from base.benchmark import (
+    benchmark_start, make_landlord, measure, require_postgres, rolled_back, seed_hotels, seed_rooms, summary,
+)
+
+
+class Command(BaseCommand):
+    help = 'Compare POST /api/booking/bulk with one POST per booking (rolled back afterwards)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=200, help='Bookings per batch')
+        parser.add_argument('--rooms', type=int, default=50, help='Rooms the batch is spread over')
+        parser.add_argument('--days', type=int, default=60, help='Days the stays are spread over')
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        require_postgres()
+        rng = random.Random(options['seed'])
+        with rolled_back():
+            hotels = seed_hotels(1, make_landlord(), rng)
+            rooms = seed_rooms(hotels, options['rooms'], rng)
+            guest = Account.objects.create(email=f'bench-{uuid.uuid4().hex[:12]}@example.com', role=Account.USER)
+            client = APIClient()
+            client.force_authenticate(user=guest)
+
+            # Random stays, so part of the batch conflicts with itself
+            first_day = benchmark_start()
+            items = []
+            for number in range(options['size']):
+                start = first_day + timedelta(days=rng.randrange(options['days']))
+                items.append({
+                    'room': rng.choice(rooms),
+                    'customer_phone_no': f'0180{number:07d}',
+                    'price': 100,
+                    'discounted_price': 100,
+                    'booking_time': timezone.now().isoformat(),
+                    'booking_start_time': start.isoformat(),
+                    'booking_end_time': (start + timedelta(days=rng.randint(1, 4))).isoformat(),
+                    'updated_by': guest.email,
+                })
+
+            created = {}
+
+            def bulk():
+                with rolled_back():
+                    response = client.post(reverse('booking_api:booking-bulk'), items, format='json')
+                    created['bulk'] = response.data['created']
+
+            def singles():
+                with rolled_back():
+                    statuses = [client.post(reverse('booking_api:booking-list'), item, format='json').status_code
+                                for item in items]
+                    created['single'] = statuses.count(201)
+
+            bulk_samples = measure(bulk, options['repeat'], warmup=1)
+            single_samples = measure(singles, options['repeat'], warmup=1)
+
+        size = options['size']
+        self.stdout.write(summary(f'bulk, {size} bookings ({created["bulk"]} created)', bulk_samples))
+        self.stdout.write(summary(f'{size} single POSTs ({created["single"]} created)', single_samples))
+        speedup = statistics.median(single_samples) / statistics.median(bulk_samples)
+        self.stdout.write(self.style.SUCCESS(f'bulk is {speedup:.1f}x faster at the median'))
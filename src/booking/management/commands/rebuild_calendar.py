@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from booking.calendar import rebuild
+
+
+class Command(BaseCommand):
+    help = 'Recompute the room night calendar from the bookings table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--room', type=int, action='append', dest='rooms',
+                            help='Only rebuild this room (repeatable)')
+
+    def handle(self, *args, **options):
+        count = rebuild(room_ids=options['rooms'])
+        self.stdout.write(self.style.SUCCESS(f'Calendar rebuilt from {count} bookings.'))
@@ -0,0 +1,21 @@
+# Generated by Django 3.1.7 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0003_auto_20251123_2328'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='booking',
+            name='bookings_room_id_4c7af2_idx',
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['room', 'booking_start_time', 'booking_end_time'], name='bookings_room_id_7749eb_idx'),
+        ),
+    ]
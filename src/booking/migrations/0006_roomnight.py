@@ -0,0 +1,70 @@
+# Generated by Django 3.1.7 on 2026-10-18 14:00
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils import timezone
+import django.db.models.deletion
+
+
+def nights(start, end):
+    # Frozen copy of booking.calendar.nights; migrations must not import app code
+    def local_date(moment):
+        return timezone.localtime(moment).date() if timezone.is_aware(moment) else moment.date()
+    first, last = local_date(start), local_date(end)
+    return [first + timedelta(days=offset) for offset in range(max((last - first).days, 1))]
+
+
+def populate_room_nights(apps, schema_editor):
+    Booking = apps.get_model('booking', 'Booking')
+    RoomNight = apps.get_model('booking', 'RoomNight')
+    rows = []
+    bookings = Booking.objects.order_by('pk').values_list(
+        'pk', 'room_id', 'room__hotel_id', 'booking_start_time', 'booking_end_time', 'discounted_price')
+    for pk, room_id, hotel_id, start, end, price in bookings.iterator(chunk_size=2000):
+        dates = nights(start, end)
+        rows.extend(
+            RoomNight(booking_id=pk, room_id=room_id, hotel_id=hotel_id, date=day, rate=price / len(dates))
+            for day in dates
+        )
+        if len(rows) >= 5000:
+            RoomNight.objects.bulk_create(rows)
+            rows = []
+    RoomNight.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0006_auto_20261018_1300'),
+        ('room', '0004_auto_20261018_1100'),
+        ('booking', '0005_auto_20261018_1100'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomNight',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('rate', models.FloatField()),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='nights', to='booking.booking')),
+                ('hotel', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='hotel.hotel')),
+                ('room', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='nights', to='room.room')),
+            ],
+            options={
+                'verbose_name': 'Room night',
+                'verbose_name_plural': 'Room nights',
+                'db_table': 'room_nights',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='roomnight',
+            index=models.Index(fields=['room', 'date'], name='room_nights_room_id_e16f5e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='roomnight',
+            index=models.Index(fields=['hotel', 'date'], name='room_nights_hotel_i_126bdd_idx'),
+        ),
+        migrations.RunPython(populate_room_nights, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.7 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0006_roomnight'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['booking_start_time', 'id'], name='bookings_booking_4751d5_idx'),
+        ),
+    ]
@@ -29,5 +29,31 @@ class Booking(BaseModel):
         verbose_name_plural = _('Bookings')
         indexes = [
             models.Index(fields=['customer_phone_no']),
-            models.Index(fields=['room'])
+            models.Index(fields=['room', 'booking_start_time', 'booking_end_time']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['booking_start_time', 'id'])
+        ]
+
+
+class RoomNight(models.Model):
+    """
+    One row per room per occupied night, derived from bookings (see ``booking.calendar``).
+    ``hotel`` is copied from the room so a hotel-wide calendar is a single index range.
+    """
+    room           = models.ForeignKey(Room, on_delete=models.CASCADE, related_name='nights', db_index=False)
+    hotel          = models.ForeignKey('hotel.Hotel', on_delete=models.CASCADE, related_name='+', null=True, blank=True, db_index=False)
+    date           = models.DateField()
+    booking        = models.ForeignKey(Booking, on_delete=models.CASCADE, related_name='nights')
+    rate           = models.FloatField()
+
+    def __str__(self):
+        return f'{self.room_id} @ {self.date}'
+
+    class Meta:
+        db_table = 'room_nights'
+        verbose_name = _('Room night')
+        verbose_name_plural = _('Room nights')
+        indexes = [
+            models.Index(fields=['room', 'date']),
+            models.Index(fields=['hotel', 'date'])
         ]
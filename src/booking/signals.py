@@ -0,0 +1,26 @@
+from django.db.models.signals import post_save
+from django.dispatch import Signal, receiver
+
+from booking import calendar
+from booking.models import Booking
+from room.models import Room
+
+# Sent after Booking.objects.bulk_create, which skips post_save; provides ``bookings``
+bookings_bulk_created = Signal()
+
+
+@receiver(post_save, sender=Booking)
+def sync_room_nights(sender, instance, raw=False, **kwargs):
+    if not raw:
+        calendar.sync_booking(instance)
+
+
+@receiver(bookings_bulk_created)
+def add_room_nights(sender, bookings, **kwargs):
+    calendar.add_bookings(bookings)
+
+
+@receiver(post_save, sender=Room)
+def move_room_nights(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        calendar.move_room(instance)
@@ -1,3 +1,181 @@
-from django.test import TestCase
+import threading
+import unittest
+from collections import Counter
+from datetime import timedelta
 
-# Create your tests here.
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from account.models import Account
+from base.testing import ConstantQueriesMixin, make_account, make_booking, make_hotel, make_room
+from booking.models import Booking
+
+STRESS_REQUESTS = 200
+# Each worker holds its own connection; stay well below Postgres' default max_connections (100)
+STRESS_WORKERS = 20
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'Row locks need Postgres')
+class ConcurrentBookingTests(TransactionTestCase):
+    """
+    Fires simultaneous booking requests at one room and checks that no two
+    stored bookings overlap. TransactionTestCase, so every thread sees the
+    committed room and its own transaction is real.
+    """
+
+    def setUp(self):
+        landlord = make_account(Account.LANDLORD)
+        self.room = make_room(make_hotel(landlord))
+        self.guest = make_account(Account.USER)
+        self.url = reverse('booking_api:booking-list')
+        self.start = (timezone.now() + timedelta(days=7)).replace(microsecond=0)
+
+    def _payload(self, start, nights=2):
+        return {
+            'room': self.room.pk,
+            'customer_phone_no': '01700000000',
+            'price': 200,
+            'discounted_price': 200,
+            'booking_time': timezone.now().isoformat(),
+            'booking_start_time': start.isoformat(),
+            'booking_end_time': (start + timedelta(days=nights)).isoformat(),
+            'updated_by': self.guest.email,
+        }
+
+    def _fire(self, payloads):
+        """POST every payload from STRESS_WORKERS threads released together; returns the status codes"""
+        statuses = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(STRESS_WORKERS)
+
+        def worker(share):
+            client = APIClient()
+            client.force_authenticate(user=self.guest)
+            try:
+                barrier.wait()
+                for payload in share:
+                    response = client.post(self.url, payload, format='json')
+                    with lock:
+                        statuses.append(response.status_code)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker, args=(payloads[index::STRESS_WORKERS],))
+                   for index in range(STRESS_WORKERS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return Counter(statuses)
+
+    def _assert_no_overlaps(self):
+        stays = list(Booking.objects.filter(room=self.room).order_by('booking_start_time')
+                     .values_list('booking_start_time', 'booking_end_time'))
+        for (start, end), (next_start, next_end) in zip(stays, stays[1:]):
+            self.assertLessEqual(end, next_start, 'double booking stored')
+
+    def test_same_window_is_booked_once(self):
+        statuses = self._fire([self._payload(self.start)] * STRESS_REQUESTS)
+
+        self.assertEqual(statuses[201], 1, statuses)
+        self.assertEqual(statuses[409], STRESS_REQUESTS - 1, statuses)
+        self.assertEqual(Booking.objects.filter(room=self.room).count(), 1)
+
+    def test_overlapping_windows_never_double_book(self):
+        # Two-night stays starting every day overlap their neighbours on both sides
+        payloads = [self._payload(self.start + timedelta(days=index % 10)) for index in range(STRESS_REQUESTS)]
+        statuses = self._fire(payloads)
+
+        self.assertEqual(set(statuses) - {201, 409}, set(), statuses)
+        self.assertEqual(statuses[201], Booking.objects.filter(room=self.room).count())
+        self.assertGreater(statuses[201], 0)
+        self._assert_no_overlaps()
+
+
+class BookingPeriodTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.guest = make_account(Account.USER)
+        cls.room = make_room(make_hotel(make_account(Account.LANDLORD)))
+
+    def _post(self, start, end):
+        client = APIClient()
+        client.force_authenticate(user=self.guest)
+        return client.post(reverse('booking_api:booking-list'), {
+            'room': self.room.pk,
+            'customer_phone_no': '01700000000',
+            'price': 100,
+            'discounted_price': 100,
+            'booking_time': timezone.now().isoformat(),
+            'booking_start_time': start.isoformat(),
+            'booking_end_time': end.isoformat(),
+            'updated_by': self.guest.email,
+        }, format='json')
+
+    def test_reversed_and_empty_stays_are_rejected(self):
+        start = (timezone.now() + timedelta(days=7)).replace(microsecond=0)
+        for end in (start - timedelta(days=1), start):
+            response = self._post(start, end)
+            self.assertEqual(response.status_code, 400, response.content)
+        self.assertFalse(Booking.objects.exists())
+
+    def test_forward_stay_is_created(self):
+        start = (timezone.now() + timedelta(days=7)).replace(microsecond=0)
+        response = self._post(start, start + timedelta(days=1))
+        self.assertEqual(response.status_code, 201, response.content)
+
+
+class BookingListQueryTests(ConstantQueriesMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_account(Account.ADMIN)
+        hotel = make_hotel(make_account(Account.LANDLORD))
+        for _ in range(10):
+            make_booking(make_room(hotel))
+
+    def test_booking_list_queries_do_not_grow_with_page_size(self):
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        self.assertConstantQueries(reverse('booking_api:booking-list'), client=client)
+
+
+class BulkBookingQueryTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.guest = make_account(Account.USER)
+        hotel = make_hotel(make_account(Account.LANDLORD))
+        cls.rooms = [make_room(hotel) for _ in range(10)]
+
+    def _bulk_queries(self, client, size, start):
+        items = [{
+            'room': room.pk,
+            'customer_phone_no': '01700000000',
+            'price': 100,
+            'discounted_price': 100,
+            'booking_time': timezone.now().isoformat(),
+            'booking_start_time': start.isoformat(),
+            'booking_end_time': (start + timedelta(days=1)).isoformat(),
+        } for room in self.rooms[:size]]
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(reverse('booking_api:booking-bulk'), items, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data['created'], size)
+        self.assertTrue(all(result['booking']['room_no'] for result in response.data['results']))
+        return len(queries)
+
+    def test_bulk_queries_do_not_grow_with_batch_size(self):
+        client = APIClient()
+        client.force_authenticate(user=self.guest)
+        start = (timezone.now() + timedelta(days=7)).replace(microsecond=0)
+        # Each batch books its own night, so none conflict
+        self._bulk_queries(client, 1, start)
+        small = self._bulk_queries(client, 1, start + timedelta(days=2))
+        large = self._bulk_queries(client, 10, start + timedelta(days=4))
+        self.assertEqual(small, large, f'{small} queries for 1 booking but {large} for 10')
@@ -4,7 +4,6 @@ from rest_framework import status
 from django.db.models import Sum
 from rest_framework.response import Response
 
-from booking.models import Booking
 from payment.models import Payment
 from room.models import Room
 
@@ -28,13 +27,7 @@ def booking_validation(func):
                     detail='Required information missing', code=status.HTTP_400_BAD_REQUEST
                 )
 
-            booking_list = Booking.objects.filter(room=room)
-
-            if booking_list.filter(booking_start_time__gte=booking_start_time,
-                                   booking_start_time__lte=booking_end_time).exists() \
-                or booking_list.filter(booking_end_time__gte=booking_start_time,
-                                       booking_end_time__lte=booking_end_time).exists():
-                raise ValidationError(detail=f'Room is not available between the given time range.')
+            # Availability is checked in BookingViewset.perform_create while the room row is locked
 
             # if required_capacity > Room.objects.get(id=room).capacity:
             #     raise ValidationError(detail=f'Room capacity is not sufficient.')
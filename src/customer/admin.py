@@ -1,13 +1,16 @@
 from django.contrib import admin
 from django.utils.html import format_html
+from base.helpers.search import RankedSearchAdminMixin
 from customer.models import Customer
 
 
 @admin.register(Customer)
-class CustomerAdmin(admin.ModelAdmin):
+class CustomerAdmin(RankedSearchAdminMixin, admin.ModelAdmin):
     list_display = ('full_name', 'email', 'phone_no', 'gender', 'country', 'created_at')
     list_filter = ('gender', 'country', 'occupation', 'created_at')
+    # Searched through the search_vector column; listed so the search box is shown
     search_fields = ('first_name', 'last_name', 'email', 'phone_no', 'address', 'country', 'occupation')
+    search_trigram_fields = ('first_name', 'last_name')
     readonly_fields = ('created_at', 'updated_at', 'created_by', 'updated_by')
     list_per_page = 25
 
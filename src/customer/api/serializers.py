@@ -7,7 +7,7 @@ class CustomerSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Customer
-        fields = '__all__'
+        exclude = ('search_vector',)
         read_only_fields = ('created_by', 'updated_by', 'created_at', 'updated_at')
         extra_kwargs = {
             'phone_no': {'required': False},
@@ -20,4 +20,4 @@ class CustomerListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Customer
-        exclude = ('details', 'address', 'created_by', 'updated_by', 'created_at', 'updated_at')
+        exclude = ('details', 'address', 'created_by', 'updated_by', 'created_at', 'updated_at', 'search_vector')
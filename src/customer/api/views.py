@@ -5,12 +5,13 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework import status, filters, mixins, viewsets
 from rest_framework.response import Response
-from base.helpers import CustomPagination
+from base.helpers import CustomPagination, RankedSearchFilter, SparseFieldsMixin
 from customer.models import Customer
 from .serializers import CustomerSerializer, CustomerListSerializer
 
 
-class CustomerViewset(mixins.ListModelMixin,
+class CustomerViewset(SparseFieldsMixin,
+                  mixins.ListModelMixin,
                   mixins.CreateModelMixin,
                   mixins.RetrieveModelMixin,
                   viewsets.GenericViewSet):
@@ -18,8 +19,9 @@ class CustomerViewset(mixins.ListModelMixin,
     serializer_class = CustomerSerializer
     pagination_class = CustomPagination
     lookup_field = 'pk'
-    filter_backends = [filters.OrderingFilter, DjangoFilterBackend]
+    filter_backends = [filters.OrderingFilter, DjangoFilterBackend, RankedSearchFilter]
     ordering_fields = ['-created_at']
+    search_trigram_fields = ['first_name', 'last_name']
     permission_classes = [permissions.IsAuthenticated, ]
     # permission_classes = [permissions.AllowAny, ]
 
@@ -0,0 +1,63 @@
+# Generated by Django 3.1.7 on 2026-10-18 12:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION customers_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.first_name, '') || ' ' || coalesce(NEW.last_name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.phone_no, '') || ' ' || coalesce(NEW.email, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(NEW.occupation, '') || ' ' || coalesce(NEW.country, '') || ' ' || coalesce(NEW.address, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(NEW.details, '')), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE TRIGGER customers_search_vector_update_trigger
+    BEFORE INSERT OR UPDATE OF first_name, last_name, phone_no, email, occupation, country, address, details ON customers
+    FOR EACH ROW EXECUTE PROCEDURE customers_search_vector_update();
+"""
+
+# Fires the trigger once for existing rows
+SEARCH_VECTOR_BACKFILL = "UPDATE customers SET first_name = first_name;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customer', '0003_auto_20261018_1100'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='customer',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(
+            [SEARCH_VECTOR_FUNCTION, SEARCH_VECTOR_TRIGGER, SEARCH_VECTOR_BACKFILL],
+            reverse_sql=[
+                "DROP TRIGGER IF EXISTS customers_search_vector_update_trigger ON customers;",
+                "DROP FUNCTION IF EXISTS customers_search_vector_update();",
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='customers_search_vector_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['first_name'], name='customers_first_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['last_name'], name='customers_last_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
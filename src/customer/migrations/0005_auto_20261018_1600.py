@@ -0,0 +1,17 @@
+# Generated by Django 3.1.7 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customer', '0004_auto_20261018_1200'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['first_name', 'id'], name='customers_first_n_d1492f_idx'),
+        ),
+    ]
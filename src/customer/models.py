@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
@@ -19,6 +21,8 @@ class Customer(BaseModel):
     country          = models.CharField(max_length=100, null=True, blank=True)
     address          = models.CharField(max_length=100, null=True, blank=True)
     details          = models.TextField(max_length=500, null=True, blank=True)
+    # Maintained by a database trigger from the name, contact and profile columns
+    search_vector    = SearchVectorField(null=True, editable=False)
 
     def __str__(self):
         return f'{self.email} - {self.phone_no}'
@@ -34,5 +38,10 @@ class Customer(BaseModel):
             models.Index(fields=['email']),
             models.Index(fields=['country']),
             models.Index(fields=['occupation']),
-            models.Index(fields=['gender'])
+            models.Index(fields=['gender']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['first_name', 'id']),
+            GinIndex(fields=['search_vector'], name='customers_search_vector_gin'),
+            GinIndex(fields=['first_name'], name='customers_first_name_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['last_name'], name='customers_last_name_trgm', opclasses=['gin_trgm_ops'])
         ]
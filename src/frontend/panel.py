@@ -0,0 +1,130 @@
+"""
+Server-side listing for the admin-panel pages.
+
+Every list page is filtered, sorted and keyset-paginated in the database, so
+only one page of rows ever reaches the template. Each sort option is backed by
+a ``(column, id)`` index, which keeps deep pages as cheap as the first one;
+add the index along with any new option. A ranked search adds a Relevance
+option, the default while searching, which seeks on (``search_rank``, ``id``)
+within the matching rows.
+"""
+from collections import namedtuple
+
+from django.db.models import Q
+
+from base.helpers.keyset import InvalidCursor, estimated_count, keyset_paginate
+from base.helpers.search import RANK_FIELD
+
+PANEL_PAGE_SIZE = 25
+RELEVANCE_SORT = (f'-{RANK_FIELD}', 'Relevance')
+
+# param: query string key, lookup: ORM lookup, choices: None renders a text input,
+# cast: converts a text input value (e.g. int); a value it rejects is not applied
+PanelFilter = namedtuple('PanelFilter', ['param', 'lookup', 'label', 'choices', 'cast'])
+PanelFilter.__new__.__defaults__ = (None, None)
+
+BOOLEAN_VALUES = {'true': True, 'false': False}
+
+
+def _query_string(params, **overrides):
+    params = params.copy()
+    for key, value in overrides.items():
+        params.pop(key, None)
+        if value is not None:
+            params[key] = value
+    encoded = params.urlencode()
+    return f'?{encoded}' if encoded else ''
+
+
+def _filter_value(panel_filter, value):
+    """The lookup value for ``value``; raises ``ValueError`` when it is not valid for the filter"""
+    if panel_filter.choices is not None:
+        if value not in {str(choice) for choice, label in panel_filter.choices}:
+            raise ValueError(value)
+        return BOOLEAN_VALUES.get(value, value)
+    if panel_filter.cast is not None:
+        try:
+            return panel_filter.cast(value)
+        except (TypeError, ValueError):
+            raise ValueError(value)
+    return value
+
+
+def panel_list(request, queryset, sort_options, filters=(), search_fields=(), default_sort='-created_at',
+               search_function=None):
+    """
+    Apply whitelisted filters, free-text search and sorting from ``request.GET``
+    and return the template context for one keyset page.
+    ``sort_options`` is a list of (ordering, label); each ordering must name a non-null column.
+    ``search_function(queryset, text)`` replaces the ``icontains`` search over ``search_fields``;
+    when it annotates ``search_rank`` (``ranked_search`` does) results are sorted by relevance by default.
+    """
+    params = request.GET
+    applied = False
+
+    invalid = set()
+    for panel_filter in filters:
+        value = params.get(panel_filter.param, '').strip()
+        if not value:
+            continue
+        try:
+            lookup_value = _filter_value(panel_filter, value)
+        except ValueError:
+            invalid.add(panel_filter.param)
+            continue
+        queryset = queryset.filter(**{panel_filter.lookup: lookup_value})
+        applied = True
+
+    search = params.get('q', '').strip()
+    if search and search_function:
+        queryset = search_function(queryset, search)
+        applied = True
+    elif search and search_fields:
+        condition = Q()
+        for field in search_fields:
+            condition |= Q(**{f'{field}__icontains': search})
+        queryset = queryset.filter(condition)
+        applied = True
+
+    # Ranked results keep their rank order unless another sort is picked
+    if RANK_FIELD in queryset.query.annotations:
+        sort_options = [RELEVANCE_SORT, *sort_options]
+        default_sort = RELEVANCE_SORT[0]
+
+    allowed_sorts = [ordering for ordering, label in sort_options]
+    sort = params.get('sort') if params.get('sort') in allowed_sorts else default_sort
+
+    try:
+        page = keyset_paginate(queryset, cursor=params.get('cursor'), page_size=PANEL_PAGE_SIZE, ordering=sort)
+    except InvalidCursor:
+        page = keyset_paginate(queryset, page_size=PANEL_PAGE_SIZE, ordering=sort)
+
+    # An exact COUNT(*) over millions of rows is what we are avoiding; estimate unless filtered
+    if applied:
+        total_count, count_is_estimate = queryset.count(), False
+    else:
+        total_count, count_is_estimate = estimated_count(queryset.model), True
+
+    return {
+        'page': page,
+        # Filtered and searched, before pagination; for page totals
+        'queryset': queryset,
+        'total_count': total_count,
+        'count_is_estimate': count_is_estimate,
+        'next_url': _query_string(params, cursor=page.next_cursor) if page.has_next() else None,
+        'previous_url': _query_string(params, cursor=page.previous_cursor) if page.has_previous() else None,
+        'sort': sort,
+        'sort_options': sort_options,
+        'search': search,
+        'searchable': bool(search_fields or search_function),
+        'filters': [
+            {
+                'param': panel_filter.param,
+                'label': panel_filter.label,
+                'choices': panel_filter.choices,
+                'value': params.get(panel_filter.param, ''),
+                'invalid': panel_filter.param in invalid,
+            }
+            for panel_filter in filters
+        ],
+    }
@@ -14,12 +14,7 @@ document.addEventListener("DOMContentLoaded", () => {
 async function loadDashboardData() {
   try {
     await Promise.all([
-      loadHotelsData(),
-      loadBookingsData(),
-      loadRoomsData(),
-      loadUsersData(),
-      loadCustomersData(),
-      loadPaymentsData(),
+      loadDashboardStats(),
       loadRecentHotels(),
       loadRecentRooms(),
       loadRecentBookings(),
@@ -31,95 +26,26 @@ async function loadDashboardData() {
   }
 }
 
-// Load hotels data
-async function loadHotelsData() {
+// Load all counters in one request
+async function loadDashboardStats() {
   try {
-    const response = await fetch("/api/hotel/");
-    if (response.ok) {
-      const data = await response.json();
-      const count = data.count || data.results?.length || data.length || 0;
-      document.getElementById("totalHotels").textContent = count;
-      document.getElementById("hotelsPercent").textContent = "100%";
-    }
-  } catch (error) {
-    console.error("Error loading hotels:", error);
-  }
-}
-
-// Load bookings data
-async function loadBookingsData() {
-  try {
-    const response = await fetch("/api/booking/");
-    if (response.ok) {
-      const data = await response.json();
-      const count = data.count || data.results?.length || data.length || 0;
-      document.getElementById("totalBookings").textContent = count;
-      document.getElementById("bookingsPercent").textContent = "85%";
-    }
-  } catch (error) {
-    console.error("Error loading bookings:", error);
-  }
-}
-
-// Load rooms data
-async function loadRoomsData() {
-  try {
-    const response = await fetch("/api/room/");
-    if (response.ok) {
-      const data = await response.json();
-      const count = data.count || data.results?.length || data.length || 0;
-      document.getElementById("totalRooms").textContent = count;
-      document.getElementById("roomsPercent").textContent = "70%";
-    }
-  } catch (error) {
-    console.error("Error loading rooms:", error);
-  }
-}
-
-// Load users data
-async function loadUsersData() {
-  try {
-    const response = await fetch("/api/account/");
-    if (response.ok) {
-      const data = await response.json();
-      const count = data.count || data.results?.length || data.length || 0;
-      document.getElementById("totalUsers").textContent = count;
-      document.getElementById("usersChange").textContent = "+12%";
-    }
-  } catch (error) {
-    console.error("Error loading users:", error);
-  }
-}
-
-// Load customers data
-async function loadCustomersData() {
-  try {
-    const response = await fetch("/api/customer/");
-    if (response.ok) {
-      const data = await response.json();
-      const count = data.count || data.results?.length || data.length || 0;
-      document.getElementById("totalCustomers").textContent = count;
-      document.getElementById("customersChange").textContent = "+8%";
-    }
-  } catch (error) {
-    console.error("Error loading customers:", error);
-    document.getElementById("totalCustomers").textContent = "0";
-  }
-}
-
-// Load payments data
-async function loadPaymentsData() {
-  try {
-    const response = await fetch("/api/payment/");
+    const token = localStorage.getItem("token");
+    const response = await fetch("/api/stats/dashboard", {
+      headers: token ? { Authorization: `Token ${token}` } : {},
+    });
     if (response.ok) {
-      const data = await response.json();
-      const count = data.count || data.results?.length || data.length || 0;
-      document.getElementById("totalPayments").textContent = count;
-      document.getElementById("paymentsChange").textContent = "+15%";
+      const stats = await response.json();
+      document.getElementById("totalHotels").textContent = stats.hotels;
+      document.getElementById("totalBookings").textContent = stats.bookings;
+      document.getElementById("totalRooms").textContent = stats.rooms;
+      document.getElementById("totalUsers").textContent = stats.users;
+      document.getElementById("totalCustomers").textContent = stats.customers;
+      document.getElementById("totalPayments").textContent = stats.payments;
+      document.getElementById("roomsPercent").textContent =
+        `${Math.round(stats.occupancy.rate * 100)}%`;
     }
   } catch (error) {
-    console.error("Error loading payments:", error);
-    document.getElementById("totalPayments").textContent = "0";
+    console.error("Error loading dashboard stats:", error);
   }
 }
 
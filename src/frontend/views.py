@@ -1,6 +1,7 @@
 from django.shortcuts import render, get_object_or_404
 from django.views.decorators.http import require_http_methods
 from django.http import JsonResponse
+from django.db.models import Count, Q
 import requests
 import json
 
@@ -11,6 +12,10 @@ from booking.models import Booking
 from customer.models import Customer
 from payment.models import Payment
 from account.models import Account
+from payment.aggregates import booking_paid_amount, payment_totals
+from booking.calendar import parse_range, room_calendar
+from frontend.panel import PanelFilter, panel_list
+from base.helpers.search import ranked_search
 
 # API Base URL
 API_BASE_URL = 'http://localhost:8000/api'
@@ -70,9 +75,13 @@ def landlord_rooms(request):
 
 def landlord_room_detail(request, pk):
     """Landlord Room Detail"""
-    from room.models import Room
-    room = get_object_or_404(Room, pk=pk)
-    return render(request, 'landlord/room_detail.html', {'room': room})
+    room = get_object_or_404(Room.objects.select_related('hotel'), pk=pk)
+    start, end = parse_range({})
+    context = {
+        'room': room,
+        'calendar': room_calendar(room, start, end),
+    }
+    return render(request, 'landlord/room_detail.html', context)
 
 
 def landlord_bookings(request):
@@ -118,11 +127,18 @@ def payments(request):
 
 def admin_hotels(request):
     """Admin Hotels List Page"""
-    hotels = Hotel.objects.all().select_related('landlord').order_by('-created_at')
-    context = {
-        'hotels': hotels,
-        'total_count': hotels.count(),
-    }
+    context = panel_list(
+        request,
+        Hotel.objects.select_related('landlord'),
+        sort_options=[('-created_at', 'Newest'), ('created_at', 'Oldest'), ('name', 'Name'), ('-star_rating', 'Rating')],
+        filters=[
+            PanelFilter('city', 'city', 'City'),
+            PanelFilter('star_rating', 'star_rating', 'Rating', [(str(i), f'{i} Star') for i in range(1, 6)]),
+            PanelFilter('is_active', 'is_active', 'Status', [('true', 'Active'), ('false', 'Inactive')]),
+        ],
+        search_function=lambda queryset, text: ranked_search(queryset, text, ['name', 'city']),
+    )
+    context['hotels'] = context['page']
     return render(request, 'admin/hotels_list.html', context)
 
 
@@ -140,11 +156,18 @@ def admin_hotel_detail(request, slug):
 
 def admin_rooms(request):
     """Admin Rooms List Page"""
-    rooms = Room.objects.all().select_related('hotel').order_by('-created_at')
-    context = {
-        'rooms': rooms,
-        'total_count': rooms.count(),
-    }
+    context = panel_list(
+        request,
+        Room.objects.select_related('hotel'),
+        sort_options=[('-created_at', 'Newest'), ('created_at', 'Oldest'), ('price', 'Price'), ('-capacity', 'Capacity')],
+        filters=[
+            PanelFilter('hotel', 'hotel', 'Hotel ID', cast=int),
+            PanelFilter('capacity', 'capacity', 'Capacity', cast=int),
+            PanelFilter('is_available', 'is_available', 'Available', [('true', 'Yes'), ('false', 'No')]),
+        ],
+        search_fields=['room_no'],
+    )
+    context['rooms'] = context['page']
     return render(request, 'admin/rooms_list.html', context)
 
 
@@ -152,21 +175,29 @@ def admin_room_detail(request, pk):
     """Admin Room Detail Page"""
     room = get_object_or_404(Room, pk=pk)
     bookings = Booking.objects.filter(room=room).order_by('-created_at')
+    start, end = parse_range({})
     context = {
         'room': room,
         'bookings': bookings,
         'bookings_count': bookings.count(),
+        'calendar': room_calendar(room, start, end),
     }
     return render(request, 'admin/room_detail.html', context)
 
 
 def admin_bookings(request):
     """Admin Bookings List Page"""
-    bookings = Booking.objects.all().select_related('room', 'room__hotel').order_by('-created_at')
-    context = {
-        'bookings': bookings,
-        'total_count': bookings.count(),
-    }
+    context = panel_list(
+        request,
+        Booking.objects.select_related('room', 'room__hotel'),
+        sort_options=[('-created_at', 'Newest'), ('created_at', 'Oldest'), ('-booking_start_time', 'Check-in')],
+        filters=[
+            PanelFilter('room', 'room', 'Room ID', cast=int),
+            PanelFilter('hotel', 'room__hotel', 'Hotel ID', cast=int),
+            PanelFilter('phone', 'customer_phone_no', 'Customer Phone'),
+        ],
+    )
+    context['bookings'] = context['page']
     return render(request, 'admin/bookings_list.html', context)
 
 
@@ -174,7 +205,7 @@ def admin_booking_detail(request, pk):
     """Admin Booking Detail Page"""
     booking = get_object_or_404(Booking, pk=pk)
     payments = Payment.objects.filter(booking=booking).order_by('-created_at')
-    total_paid = sum(p.amount for p in payments)
+    total_paid = booking_paid_amount(booking)
     context = {
         'booking': booking,
         'payments': payments,
@@ -186,11 +217,17 @@ def admin_booking_detail(request, pk):
 
 def admin_customers(request):
     """Admin Customers List Page"""
-    customers = Customer.objects.all().order_by('-created_at')
-    context = {
-        'customers': customers,
-        'total_count': customers.count(),
-    }
+    context = panel_list(
+        request,
+        Customer.objects.all(),
+        sort_options=[('-created_at', 'Newest'), ('created_at', 'Oldest'), ('first_name', 'Name')],
+        filters=[
+            PanelFilter('phone', 'phone_no', 'Phone'),
+            PanelFilter('country', 'country', 'Country'),
+            PanelFilter('gender', 'gender', 'Gender', Customer.Gender.choices),
+        ],
+    )
+    context['customers'] = context['page']
     return render(request, 'admin/customers_list.html', context)
 
 
@@ -209,13 +246,18 @@ def admin_customer_detail(request, pk):
 
 def admin_payments(request):
     """Admin Payments List Page"""
-    payments = Payment.objects.all().select_related('booking', 'booking__room').order_by('-created_at')
-    total_amount = sum(p.amount for p in payments)
-    context = {
-        'payments': payments,
-        'total_count': payments.count(),
-        'total_amount': total_amount,
-    }
+    context = panel_list(
+        request,
+        Payment.objects.select_related('booking', 'booking__room'),
+        sort_options=[('-created_at', 'Newest'), ('created_at', 'Oldest'), ('-amount', 'Amount')],
+        filters=[
+            PanelFilter('booking', 'booking', 'Booking ID', cast=int),
+            PanelFilter('payment_method', 'payment_method', 'Method', Payment.Payment_Method_Choices.choices),
+        ],
+    )
+    context['payments'] = context['page']
+    # Total of the payments matching the active filters, not of the whole table
+    context['total_amount'] = payment_totals(context['queryset'])['total_amount']
     return render(request, 'admin/payments_list.html', context)
 
 
@@ -230,14 +272,25 @@ def admin_payment_detail(request, pk):
 
 def admin_users(request):
     """Admin Users List Page"""
-    users = Account.objects.all().order_by('-date_joined')
-    context = {
-        'users': users,
-        'total_count': users.count(),
-        'admin_count': users.filter(role='ADMIN').count(),
-        'landlord_count': users.filter(role='LANDLORD').count(),
-        'user_count': users.filter(role='USER').count(),
-    }
+    context = panel_list(
+        request,
+        Account.objects.all(),
+        sort_options=[('-date_joined', 'Newest'), ('date_joined', 'Oldest'), ('email', 'Email')],
+        filters=[
+            PanelFilter('role', 'role', 'Role', Account.ROLE_CHOICES),
+            PanelFilter('is_active', 'is_active', 'Status', [('true', 'Active'), ('false', 'Inactive')]),
+        ],
+        search_fields=['email', 'first_name', 'last_name'],
+        default_sort='-date_joined',
+    )
+    # One grouped pass instead of a COUNT per role
+    role_counts = Account.objects.aggregate(
+        admin_count=Count('id', filter=Q(role=Account.ADMIN)),
+        landlord_count=Count('id', filter=Q(role=Account.LANDLORD)),
+        user_count=Count('id', filter=Q(role=Account.USER)),
+    )
+    context.update(role_counts)
+    context['users'] = context['page']
     return render(request, 'admin/users_list.html', context)
 
 
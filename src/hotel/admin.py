@@ -1,22 +1,28 @@
 from django.contrib import admin
 from django.utils.html import format_html
+from base.helpers.search import RankedSearchAdminMixin
+from hotel import images
 from hotel.models import Hotel
 
 
 @admin.register(Hotel)
-class HotelAdmin(admin.ModelAdmin):
+class HotelAdmin(RankedSearchAdminMixin, admin.ModelAdmin):
     list_display = ('image_thumbnail', 'name', 'location', 'landlord_info', 'rating_display', 'contact_info', 'status_badge', 'created_at')
     list_filter = ('is_active', 'star_rating', 'city', 'country', 'created_at')
-    search_fields = ('name', 'city', 'country', 'landlord__email', 'landlord__first_name', 'landlord__last_name')
+    # Searched through the search_vector column; listed so the search box is shown
+    search_fields = ('name', 'city', 'country', 'address', 'description')
+    search_trigram_fields = ('name', 'city')
+    search_lookup_fields = ('landlord__email', 'landlord__first_name', 'landlord__last_name')
     readonly_fields = ('created_at', 'updated_at', 'created_by', 'updated_by', 'room_count', 'image_preview')
     list_per_page = 25
+    list_select_related = ('landlord',)
 
     fieldsets = (
         ('Hotel Information', {
             'fields': ('name', 'description', 'image', 'image_preview', 'star_rating', 'is_active')
         }),
         ('Location', {
-            'fields': ('address', 'city', 'country')
+            'fields': ('address', 'city', 'country', 'latitude', 'longitude')
         }),
         ('Contact', {
             'fields': ('phone_no', 'email')
@@ -85,8 +91,8 @@ class HotelAdmin(admin.ModelAdmin):
         """Display small thumbnail in list view"""
         if obj.image:
             return format_html(
-                '<img src="{}" style="width: 50px; height: 50px; object-fit: cover; border-radius: 5px;" />',
-                obj.image.url
+                '<img src="{}" loading="lazy" style="width: 50px; height: 50px; object-fit: cover; border-radius: 5px;" />',
+                images.thumbnail_url(obj, 100)
             )
         return format_html('<span style="color: #999;">No image</span>')
     image_thumbnail.short_description = 'Image'
@@ -94,9 +100,11 @@ class HotelAdmin(admin.ModelAdmin):
     def image_preview(self, obj):
         """Display larger image preview in detail view"""
         if obj.image:
+            srcset = images.srcset(obj)
             return format_html(
-                '<img src="{}" style="max-width: 400px; max-height: 300px; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);" />',
-                obj.image.url
+                '<picture>{}<img src="{}" style="max-width: 400px; max-height: 300px; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);" /></picture>',
+                format_html('<source type="image/webp" srcset="{}" sizes="400px" />', srcset['webp']) if srcset.get('webp') else '',
+                images.thumbnail_url(obj, 800)
             )
         return format_html('<span style="color: #999;">No image uploaded</span>')
     image_preview.short_description = 'Image Preview'
@@ -1,16 +1,50 @@
 from rest_framework import serializers
+from hotel import images
 from hotel.models import Hotel
 
 
-class HotelSerializer(serializers.ModelSerializer):
+def validate_coordinates(attrs, instance=None):
+    """Latitude and longitude are set together or not at all"""
+    latitude = attrs.get('latitude', getattr(instance, 'latitude', None))
+    longitude = attrs.get('longitude', getattr(instance, 'longitude', None))
+    if (latitude is None) != (longitude is None):
+        raise serializers.ValidationError('Latitude and longitude must be provided together.')
+    return attrs
+
+
+class HotelImageMixin:
+    """``image_srcset`` ({'webp': ..., 'jpeg': ...}) and a list sized ``thumbnail_url`` from the image derivatives"""
+    thumbnail_width = 480
+    image_sources = {'image_srcset': ['image', 'image_variants'], 'thumbnail_url': ['image', 'image_variants']}
+    landlord_sources = {'landlord_name': ['landlord__first_name', 'landlord__last_name'],
+                        'landlord_email': ['landlord__email']}
+
+    def _build_url(self, url):
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+    def get_image_srcset(self, obj):
+        return images.srcset(obj, self._build_url)
+
+    def get_thumbnail_url(self, obj):
+        return images.thumbnail_url(obj, self.thumbnail_width, self._build_url)
+
+
+class HotelSerializer(HotelImageMixin, serializers.ModelSerializer):
     landlord_name = serializers.SerializerMethodField()
     landlord_email = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
+    sparse_sources = {**HotelImageMixin.image_sources, **HotelImageMixin.landlord_sources}
 
     class Meta:
         model = Hotel
-        fields = '__all__'
+        exclude = ('search_vector', 'geohash', 'image_variants')
         read_only_fields = ('created_by', 'updated_by', 'created_at', 'updated_at', 'landlord', 'slug')
 
+    def validate(self, attrs):
+        return validate_coordinates(attrs, self.instance)
+
     def get_landlord_name(self, obj):
         return f"{obj.landlord.first_name} {obj.landlord.last_name}"
 
@@ -18,14 +52,20 @@ class HotelSerializer(serializers.ModelSerializer):
         return obj.landlord.email
 
 
-class HotelListSerializer(serializers.ModelSerializer):
+class HotelListSerializer(HotelImageMixin, serializers.ModelSerializer):
     landlord_name = serializers.SerializerMethodField()
     landlord_email = serializers.SerializerMethodField()
     image_url = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
+    distance_km = serializers.SerializerMethodField()
+    sparse_sources = {**HotelImageMixin.image_sources, **HotelImageMixin.landlord_sources,
+                      'image_url': ['image'], 'distance_km': []}
 
     class Meta:
         model = Hotel
-        fields = ['id', 'name', 'slug', 'city', 'country', 'phone_no', 'star_rating', 'landlord_name', 'landlord_email', 'is_active', 'image', 'image_url']
+        fields = ['id', 'name', 'slug', 'city', 'country', 'phone_no', 'star_rating', 'landlord_name', 'landlord_email', 'is_active', 'image', 'image_url',
+                  'image_srcset', 'thumbnail_url', 'latitude', 'longitude', 'distance_km']
 
     def get_landlord_name(self, obj):
         return f"{obj.landlord.first_name} {obj.landlord.last_name}"
@@ -34,19 +74,24 @@ class HotelListSerializer(serializers.ModelSerializer):
         return obj.landlord.email
 
     def get_image_url(self, obj):
-        """Return full URL for image"""
+        """Return full URL for the original image; lists should show ``thumbnail_url``"""
         if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url
+            return self._build_url(obj.image.url)
         return None
 
+    def get_distance_km(self, obj):
+        """Only set for ``near`` searches"""
+        distance = getattr(obj, 'distance_km', None)
+        return round(distance, 3) if distance is not None else None
+
 
 class HotelCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating hotels - landlord is set from request.user"""
 
     class Meta:
         model = Hotel
-        fields = ['name', 'description', 'image', 'address', 'city', 'country', 'phone_no', 'email', 'star_rating']
+        fields = ['name', 'description', 'image', 'address', 'city', 'country', 'phone_no', 'email', 'star_rating', 'latitude', 'longitude']
+
+    def validate(self, attrs):
+        return validate_coordinates(attrs)
 
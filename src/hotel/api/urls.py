@@ -13,9 +13,13 @@ hotel_detail = HotelViewset.as_view({
     'put': 'update',
     'delete': 'destroy'
 })
+hotel_calendar = HotelViewset.as_view({
+    'get': 'calendar'
+})
 
 urlpatterns = [
     path('', hotel_list, name='hotel-list'),
     path('<int:pk>/', hotel_detail, name='hotel-detail'),
+    path('<int:pk>/calendar', hotel_calendar, name='hotel-calendar'),
 ]
 
@@ -4,22 +4,29 @@ from django_filters.rest_framework import DjangoFilterBackend
 
 from hotel.models import Hotel
 from hotel.api.serializers import HotelSerializer, HotelListSerializer, HotelCreateSerializer
+from base.helpers.conditional import ConditionalGetMixin
+from base.helpers.fields import SparseFieldsMixin
 from base.helpers.pagination import CustomPagination
+from base.helpers.search import RankedSearchFilter
+from booking.calendar import hotel_grid, parse_range
+from hotel.geo import HotelGeoFilter
 
 
-class HotelViewset(mixins.ListModelMixin,
+class HotelViewset(ConditionalGetMixin,
+                   SparseFieldsMixin,
+                   mixins.ListModelMixin,
                    mixins.CreateModelMixin,
                    mixins.RetrieveModelMixin,
                    mixins.UpdateModelMixin,
                    mixins.DestroyModelMixin,
                    viewsets.GenericViewSet):
-    queryset = Hotel.objects.filter(is_active=True)
+    queryset = Hotel.objects.filter(is_active=True).select_related('landlord')
     serializer_class = HotelSerializer
     pagination_class = CustomPagination
     lookup_field = 'pk'
-    filter_backends = [filters.OrderingFilter, DjangoFilterBackend, filters.SearchFilter]
+    filter_backends = [filters.OrderingFilter, DjangoFilterBackend, RankedSearchFilter, HotelGeoFilter]
     ordering_fields = ['-created_at', 'name', 'star_rating']
-    search_fields = ['name', 'city', 'country']
+    search_trigram_fields = ['name', 'city']
     filterset_fields = ['city', 'country', 'star_rating', 'landlord']
     
     def get_permissions(self):
@@ -27,6 +34,7 @@ class HotelViewset(mixins.ListModelMixin,
         GET (list, retrieve) - Public (AllowAny)
         POST (create) - Landlord & Admin only
         PUT/PATCH/DELETE - Landlord (own hotels) & Admin only
+        GET (calendar) - Landlord (own hotels) & Admin only
         """
         if self.action in ['list', 'retrieve']:
             permission_classes = [permissions.AllowAny]
@@ -45,12 +53,16 @@ class HotelViewset(mixins.ListModelMixin,
         
         # For list and retrieve, show all active hotels
         if self.action in ['list', 'retrieve']:
-            return queryset
+            return queryset.cache()
         
+        # Owners check the calendar of inactive hotels too
+        if self.action == 'calendar':
+            queryset = Hotel.objects.select_related('landlord')
+
         # For create/update/delete, filter by ownership
         if user.is_authenticated:
             if user.is_role_admin():
-                return Hotel.objects.all()  # Admin sees all
+                return Hotel.objects.select_related('landlord')  # Admin sees all
             elif user.is_role_landlord():
                 return queryset.filter(landlord=user)  # Landlord sees only their hotels
         
@@ -109,3 +121,10 @@ class HotelViewset(mixins.ListModelMixin,
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
+    def calendar(self, request, *args, **kwargs):
+        """Rooms x dates occupancy grid of one hotel. Query params: from (default today), to (exclusive)."""
+        hotel = self.get_object()
+        start, end = parse_range(request.query_params)
+        data = {'hotel': hotel.pk, 'from': start, 'to': end}
+        data.update(hotel_grid(hotel, start, end))
+        return Response(data)
@@ -0,0 +1,174 @@
+"""
+Geo search over hotel coordinates on stock Postgres.
+
+Each hotel stores a geohash of its coordinates. A geohash prefix is a
+rectangular cell and nearby points share prefixes, so a bounding box can be
+covered by a handful of cells and fetched with ``geohash LIKE 'prefix%'``
+range scans on a btree (``varchar_pattern_ops``) index. The exact box and,
+for radius searches, the great-circle distance are then checked on the few
+candidate rows.
+"""
+import math
+
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import ASin, Cos, Least, Power, Radians, Sin, Sqrt
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+EARTH_RADIUS_KM = 6371.0088
+GEOHASH_PRECISION = 9
+MAX_COVER_CELLS = 16
+MAX_RADIUS_KM = 500
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        span, coordinate = (lon_range, longitude) if even else (lat_range, latitude)
+        middle = (span[0] + span[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            span[0] = middle
+        else:
+            span[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits, value = 0, 0
+    return ''.join(chars)
+
+
+def _cell_size(precision):
+    """(height, width) in degrees of a geohash cell"""
+    bits = 5 * precision
+    return 180.0 / 2 ** (bits // 2), 360.0 / 2 ** ((bits + 1) // 2)
+
+
+def _steps(low, high, size):
+    value = low
+    while value < high:
+        yield value
+        value += size
+    yield high
+
+
+def _cells(south, west, north, east, precision):
+    height, width = _cell_size(precision)
+    return {
+        encode_geohash(latitude, longitude, precision)
+        for latitude in _steps(south, north, height)
+        for longitude in _steps(west, east, width)
+    }
+
+
+def cover(south, west, north, east):
+    """
+    Smallest set of geohash prefixes, at the finest precision needing no more
+    than ``MAX_COVER_CELLS`` cells, whose union contains the box.
+    """
+    best = {''}
+    for precision in range(1, GEOHASH_PRECISION + 1):
+        height, width = _cell_size(precision)
+        if ((north - south) / height + 2) * ((east - west) / width + 2) > MAX_COVER_CELLS * 4:
+            break
+        cells = _cells(south, west, north, east, precision)
+        if len(cells) > MAX_COVER_CELLS:
+            break
+        best = cells
+    return best
+
+
+def _box(south, west, north, east):
+    condition = Q()
+    for prefix in sorted(cover(south, west, north, east)):
+        condition |= Q(geohash__startswith=prefix)
+    return condition & Q(latitude__range=(south, north), longitude__range=(west, east))
+
+
+def within_box(south, west, north, east):
+    """Q for hotels inside the box; ``west > east`` means it crosses the antimeridian"""
+    if west > east:
+        return _box(south, west, north, 180.0) | _box(south, -180.0, north, east)
+    return _box(south, west, north, east)
+
+
+def radius_box(latitude, longitude, radius_km):
+    """Bounding box (south, west, north, east) of a circle"""
+    delta_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    south, north = max(latitude - delta_lat, -90.0), min(latitude + delta_lat, 90.0)
+    cos_lat = math.cos(math.radians(latitude))
+    if south == -90.0 or north == 90.0 or cos_lat < 1e-6:
+        return south, -180.0, north, 180.0
+    delta_lon = math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat))
+    if delta_lon >= 180.0:
+        return south, -180.0, north, 180.0
+    west, east = longitude - delta_lon, longitude + delta_lon
+    # Wrap into [-180, 180]; within_box treats west > east as crossing the antimeridian
+    west = west + 360.0 if west < -180.0 else west
+    east = east - 360.0 if east > 180.0 else east
+    return south, west, north, east
+
+
+def distance_km(latitude, longitude):
+    """Haversine distance from the point to each row's coordinates, computed by the database"""
+    half_dlat = Radians(F('latitude') - latitude) / 2
+    half_dlon = Radians(F('longitude') - longitude) / 2
+    a = Power(Sin(half_dlat), 2) + Cos(Radians(F('latitude'))) * math.cos(math.radians(latitude)) * Power(Sin(half_dlon), 2)
+    return Value(2 * EARTH_RADIUS_KM, output_field=FloatField()) * ASin(Sqrt(Least(a, Value(1.0))))
+
+
+def near(queryset, latitude, longitude, radius_km):
+    """Hotels within ``radius_km``, annotated with ``distance_km`` and ordered nearest first"""
+    return queryset.filter(within_box(*radius_box(latitude, longitude, radius_km))).annotate(
+        distance_km=distance_km(latitude, longitude),
+    ).filter(distance_km__lte=radius_km).order_by('distance_km')
+
+
+def _floats(value, count, name):
+    try:
+        numbers = [float(part) for part in value.split(',')]
+    except ValueError:
+        numbers = []
+    if len(numbers) != count or not all(math.isfinite(number) for number in numbers):
+        raise ValidationError(detail=f'{name} must be {count} comma separated numbers.')
+    return numbers
+
+
+def _check_point(latitude, longitude, name):
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValidationError(detail=f'{name} is out of range.')
+
+
+class HotelGeoFilter(BaseFilterBackend):
+    """
+    ``?near=lat,lng&radius=km`` (nearest first, adds ``distance_km``) or
+    ``?bbox=south,west,north,east``. Combines with the other filters; an
+    explicit ``ordering`` overrides the distance order.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        if params.get('bbox'):
+            south, west, north, east = _floats(params['bbox'], 4, 'bbox')
+            _check_point(south, west, 'bbox')
+            _check_point(north, east, 'bbox')
+            if south > north:
+                raise ValidationError(detail='bbox south must not be greater than north.')
+            queryset = queryset.filter(within_box(south, west, north, east))
+
+        if params.get('near'):
+            latitude, longitude = _floats(params['near'], 2, 'near')
+            _check_point(latitude, longitude, 'near')
+            radius = _floats(params.get('radius', '10'), 1, 'radius')[0]
+            if not 0 < radius <= MAX_RADIUS_KM:
+                raise ValidationError(detail=f'radius must be between 0 and {MAX_RADIUS_KM} km.')
+            ordering = queryset.query.order_by
+            queryset = near(queryset, latitude, longitude, radius)
+            if params.get(api_settings.ORDERING_PARAM) and ordering:
+                queryset = queryset.order_by(*ordering)
+        return queryset
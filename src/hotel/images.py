@@ -0,0 +1,134 @@
+"""
+Resized derivatives of ``Hotel.image``.
+
+Uploads are stored as given; ``Hotel.save`` clears ``image_variants`` whenever
+the image changes, and the ``generate_thumbnails`` worker renders the pending
+ones off the request thread: WebP (when Pillow supports it) and JPEG at each
+width of ``THUMBNAIL_WIDTHS`` no larger than the original. The result is
+recorded as::
+
+    {"source": "hotels/pool.png", "width": 2400, "height": 1600,
+     "webp": [[160, "hotels/derivatives/7/pool-160w.webp"], ...],
+     "jpeg": [[160, "hotels/derivatives/7/pool-160w.jpg"], ...]}
+
+Until then ``srcset`` is empty and ``thumbnail_url`` falls back to the original.
+"""
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from PIL import Image, ImageOps, features
+
+from hotel.models import Hotel
+
+THUMBNAIL_WIDTHS = (160, 480, 960)
+FORMATS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+DERIVATIVE_DIR = 'hotels/derivatives'
+
+
+def _formats():
+    return [name for name in FORMATS if name != 'webp' or features.check('webp')]
+
+
+def _encode(image, name):
+    pil_format, extension, options = FORMATS[name]
+    buffer = BytesIO()
+    image.save(buffer, pil_format, **options)
+    return extension, buffer.getvalue()
+
+
+def _clear_directory(directory, keep=()):
+    try:
+        _, files = default_storage.listdir(directory)
+    except (FileNotFoundError, NotImplementedError):
+        return
+    for name in files:
+        path = f'{directory}/{name}'
+        if path not in keep:
+            default_storage.delete(path)
+
+
+def render(hotel):
+    """Write the derivatives of ``hotel.image``; returns the ``image_variants`` value"""
+    with hotel.image.open('rb') as source:
+        original = ImageOps.exif_transpose(Image.open(source))
+        original.load()
+    if original.mode in ('RGBA', 'LA', 'PA') or 'transparency' in original.info:
+        # JPEG has no alpha channel; flatten onto white
+        rgba = original.convert('RGBA')
+        original = Image.new('RGB', rgba.size, (255, 255, 255))
+        original.paste(rgba, mask=rgba.split()[-1])
+    elif original.mode != 'RGB':
+        original = original.convert('RGB')
+
+    directory = f'{DERIVATIVE_DIR}/{hotel.pk}'
+    stem = os.path.splitext(os.path.basename(hotel.image.name))[0]
+    widths = [width for width in THUMBNAIL_WIDTHS if width < original.width] or [original.width]
+    variants = {'source': hotel.image.name, 'width': original.width, 'height': original.height}
+    for name in _formats():
+        variants[name] = []
+    for width in widths:
+        height = max(1, round(original.height * width / original.width))
+        resized = original.resize((width, height), Image.LANCZOS) if width != original.width else original
+        for name in _formats():
+            extension, content = _encode(resized, name)
+            path = f'{directory}/{stem}-{width}w.{extension}'
+            if default_storage.exists(path):
+                default_storage.delete(path)
+            variants[name].append([width, default_storage.save(path, ContentFile(content))])
+
+    _clear_directory(directory, keep={path for name in _formats() for width, path in variants[name]})
+    return variants
+
+
+def pending(regenerate=False):
+    hotels = Hotel.objects.exclude(image='').exclude(image__isnull=True)
+    if not regenerate:
+        hotels = hotels.filter(image_variants={})
+    return hotels.order_by('pk')
+
+
+def process(hotel):
+    """
+    Render and store one hotel's derivatives; False when the image could not be
+    read (recorded so it is not retried until re-uploaded or ``--all``).
+    """
+    try:
+        variants = render(hotel)
+    except (OSError, ValueError, Image.DecompressionBombError) as error:
+        variants = {'source': hotel.image.name, 'error': str(error)[:500] or error.__class__.__name__}
+    # Guarded on the image so an upload made while rendering is not overwritten; a plain
+    # update() would leave the cached hotel querysets (cacheops) serving the old value
+    Hotel.objects.filter(pk=hotel.pk, image=hotel.image.name).invalidated_update(
+        image_variants=variants, updated_at=timezone.now())
+    return 'error' not in variants
+
+
+def srcset(hotel, build_url=None):
+    """{'webp': 'url 160w, url 480w', 'jpeg': ...}; empty until derivatives exist"""
+    build_url = build_url or (lambda url: url)
+    variants = hotel.image_variants or {}
+    if not hotel.image or variants.get('source') != hotel.image.name:
+        return {}
+    return {
+        name: ', '.join(f'{build_url(default_storage.url(path))} {width}w' for width, path in variants[name])
+        for name in FORMATS if variants.get(name)
+    }
+
+
+def thumbnail_url(hotel, width, build_url=None):
+    """URL of the smallest JPEG derivative at least ``width`` wide (or the largest one)"""
+    build_url = build_url or (lambda url: url)
+    if not hotel.image:
+        return None
+    variants = hotel.image_variants or {}
+    if variants.get('source') != hotel.image.name or not variants.get('jpeg'):
+        return build_url(hotel.image.url)
+    candidates = variants['jpeg']
+    path = next((path for size, path in candidates if size >= width), candidates[-1][1])
+    return build_url(default_storage.url(path))
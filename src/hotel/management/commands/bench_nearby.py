@@ -0,0 +1,77 @@
+import random
+
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.benchmark import analyze, make_landlord, measure, require_postgres, rolled_back, seed_hotels, summary
+from hotel.geo import distance_km, near, within_box
+from hotel.models import Hotel
+
+PAGE = 20
+
+
+class Command(BaseCommand):
+    help = 'Time geohash-backed radius and bounding-box hotel search over synthetic hotels (rolled back afterwards)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hotels', type=int, default=1000000)
+        parser.add_argument('--radius', type=float, default=5.0, help='km')
+        parser.add_argument('--repeat', type=int, default=30)
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        require_postgres()
+        rng = random.Random(options['seed'])
+        radius, repeat = options['radius'], options['repeat']
+
+        def point():
+            return rng.uniform(21.0, 26.0), rng.uniform(88.5, 92.0)
+
+        with rolled_back():
+            self.stdout.write(f"Seeding {options['hotels']} hotels with coordinates...")
+            seed_hotels(options['hotels'], make_landlord(), rng, coordinates=True)
+            analyze(Hotel)
+            hotels = Hotel.objects.all()
+            client = APIClient()
+            url = reverse('hotel_api:hotel-list')
+
+            def radius_search():
+                list(near(hotels, *point(), radius)[:PAGE])
+
+            def radius_search_with_rating():
+                list(near(hotels.filter(star_rating=4), *point(), radius)[:PAGE])
+
+            def box_search():
+                south, west = point()
+                list(hotels.filter(within_box(south, west, south + 0.1, west + 0.1))[:PAGE])
+
+            def full_scan():
+                # What a radius search costs without the geohash prefix filter
+                latitude, longitude = point()
+                list(hotels.annotate(distance_km=distance_km(latitude, longitude))
+                     .filter(distance_km__lte=radius).order_by('distance_km')[:PAGE])
+
+            def api_search(**params):
+                response = client.get(url, params)
+                if response.status_code != 200:
+                    raise AssertionError(response.content)
+
+            def api_radius():
+                api_search(near='{},{}'.format(*point()), radius=radius)
+
+            def api_box():
+                south, west = point()
+                api_search(bbox=f'{south},{west},{south + 0.1},{west + 0.1}')
+
+            results = [
+                (f'{radius:g} km radius', measure(radius_search, repeat)),
+                (f'{radius:g} km radius, 4 stars', measure(radius_search_with_rating, repeat)),
+                ('0.1 degree bounding box', measure(box_search, repeat)),
+                (f'{radius:g} km radius, full-scan haversine', measure(full_scan, repeat)),
+                (f'GET ?near=&radius={radius:g}', measure(api_radius, repeat)),
+                ('GET ?bbox=', measure(api_box, repeat)),
+            ]
+
+        for label, samples in results:
+            self.stdout.write(summary(label, samples))
@@ -0,0 +1,85 @@
+import random
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from base.benchmark import (
+    BATCH_SIZE, BENCH_USER, CITIES, NAME_WORDS, analyze, make_landlord, measure, require_postgres, rolled_back,
+    seed_hotels, summary,
+)
+from base.helpers.search import ranked_search
+from customer.models import Customer
+from hotel.models import Hotel
+
+FIRST_NAMES = ['Amirul', 'Nusrat', 'Tanvir', 'Farhana', 'Rakib', 'Sadia', 'Imran', 'Mehjabin', 'Arif', 'Sabrina']
+LAST_NAMES = ['Islam', 'Rahman', 'Hossain', 'Ahmed', 'Chowdhury', 'Karim', 'Akter', 'Haque', 'Uddin', 'Begum']
+PAGE = 20
+
+
+def _icontains(fields, text):
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f'{field}__icontains': text})
+    return condition
+
+
+def _typo(word, rng):
+    position = rng.randrange(1, len(word))
+    return word[:position] + word[position + 1:]
+
+
+class Command(BaseCommand):
+    help = 'Compare ranked full-text search with the old ILIKE search over synthetic rows (rolled back afterwards)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hotels', type=int, default=1000000)
+        parser.add_argument('--customers', type=int, default=0, help='Also benchmark customer search')
+        parser.add_argument('--repeat', type=int, default=30)
+        parser.add_argument('--seed', type=int, default=1)
+
+    def seed_customers(self, count, rng):
+        token = uuid.uuid4().hex[:6]
+        for first in range(0, count, BATCH_SIZE):
+            Customer.objects.bulk_create([
+                Customer(phone_no=f'b{token}{number:09d}', first_name=rng.choice(FIRST_NAMES),
+                         last_name=rng.choice(LAST_NAMES), email=f'customer{number}@example.com',
+                         country='Bangladesh', address=f'{number} {rng.choice(CITIES)} Road',
+                         created_by=BENCH_USER, updated_by=BENCH_USER)
+                for number in range(first, min(first + BATCH_SIZE, count))
+            ])
+
+    def compare(self, label, queryset, terms, trigram_fields, old_fields, repeat):
+        def ranked():
+            list(ranked_search(queryset, next(terms), trigram_fields)[:PAGE])
+
+        def old():
+            list(queryset.filter(_icontains(old_fields, next(terms))).order_by('-created_at')[:PAGE])
+
+        self.stdout.write(summary(f'{label}, ranked search', measure(ranked, repeat)))
+        self.stdout.write(summary(f'{label}, ILIKE search', measure(old, repeat)))
+
+    def handle(self, *args, **options):
+        require_postgres()
+        rng = random.Random(options['seed'])
+        repeat = options['repeat']
+
+        def terms(words):
+            # Whole words, prefixes and one-letter typos
+            while True:
+                word = rng.choice(words)
+                yield rng.choice([word, word[:4], _typo(word, rng)])
+
+        with rolled_back():
+            self.stdout.write(f"Seeding {options['hotels']} hotels and {options['customers']} customers...")
+            seed_hotels(options['hotels'], make_landlord(), rng)
+            self.seed_customers(options['customers'], rng)
+            analyze(Hotel, Customer)
+
+            self.compare('hotels', Hotel.objects.all(), terms(NAME_WORDS + CITIES), ['name', 'city'],
+                         ['name', 'city', 'country'], repeat)
+            if options['customers']:
+                self.compare('customers', Customer.objects.all(), terms(FIRST_NAMES + LAST_NAMES),
+                             ['first_name', 'last_name'],
+                             ['first_name', 'last_name', 'email', 'phone_no', 'address', 'country', 'occupation'],
+                             repeat)
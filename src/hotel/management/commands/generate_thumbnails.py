@@ -0,0 +1,39 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from hotel.images import pending, process
+
+
+class Command(BaseCommand):
+    help = 'Render resized WebP/JPEG copies of hotel images that have none (all existing ones on the first run)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new uploads instead of exiting')
+        parser.add_argument('--all', action='store_true', help='Regenerate every image, e.g. after changing sizes')
+        parser.add_argument('--batch-size', type=int, default=50)
+
+    def handle(self, *args, **options):
+        regenerate = options['all']
+        while True:
+            done = failed = 0
+            last_pk = 0
+            while True:
+                batch = list(pending(regenerate).filter(pk__gt=last_pk)[:options['batch_size']])
+                if not batch:
+                    break
+                for hotel in batch:
+                    if process(hotel):
+                        done += 1
+                    else:
+                        failed += 1
+                        self.stderr.write(f'Hotel {hotel.pk}: unreadable image {hotel.image.name}')
+                last_pk = batch[-1].pk
+            if done or failed:
+                self.stdout.write(f'Rendered {done}, failed {failed}.')
+            regenerate = False
+            if not options['loop']:
+                break
+            time.sleep(settings.THUMBNAIL_POLL_INTERVAL)
+        self.stdout.write(self.style.SUCCESS('Thumbnails up to date.'))
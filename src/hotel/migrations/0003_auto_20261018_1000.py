@@ -0,0 +1,17 @@
+# Generated by Django 3.1.7 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0002_hotel_slug'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='hotel',
+            index=models.Index(fields=['city'], name='hotel_hotel_city_3da5ba_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.7 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0003_auto_20261018_1000'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='hotel',
+            index=models.Index(fields=['created_at', 'id'], name='hotel_hotel_created_af6647_idx'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 3.1.7 on 2026-10-18 12:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION hotel_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.city, '') || ' ' || coalesce(NEW.country, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(NEW.address, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE TRIGGER hotel_search_vector_update_trigger
+    BEFORE INSERT OR UPDATE OF name, city, country, address, description ON hotel_hotel
+    FOR EACH ROW EXECUTE PROCEDURE hotel_search_vector_update();
+"""
+
+# Fires the trigger once for existing rows
+SEARCH_VECTOR_BACKFILL = "UPDATE hotel_hotel SET name = name;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0004_auto_20261018_1100'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='hotel',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(
+            [SEARCH_VECTOR_FUNCTION, SEARCH_VECTOR_TRIGGER, SEARCH_VECTOR_BACKFILL],
+            reverse_sql=[
+                "DROP TRIGGER IF EXISTS hotel_search_vector_update_trigger ON hotel_hotel;",
+                "DROP FUNCTION IF EXISTS hotel_search_vector_update();",
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='hotel',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='hotel_search_vector_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='hotel',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='hotel_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='hotel',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['city'], name='hotel_city_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
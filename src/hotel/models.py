@@ -1,7 +1,11 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.conf import settings
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.utils.text import slugify
 from base.models import BaseModel
+from hotel.geo import encode_geohash
 
 
 class Hotel(BaseModel):
@@ -10,6 +14,8 @@ class Hotel(BaseModel):
     slug = models.SlugField(max_length=250, unique=True, blank=True)
     description = models.TextField(blank=True, null=True)
     image = models.ImageField(upload_to='hotels/', blank=True, null=True, help_text='Hotel main image')
+    # Resized copies of image, written by the generate_thumbnails worker; see hotel.images
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     address = models.TextField()
     city = models.CharField(max_length=100)
     country = models.CharField(max_length=100)
@@ -22,12 +28,28 @@ class Hotel(BaseModel):
         related_name='hotels',
         limit_choices_to={'role': 'LANDLORD'}
     )
+    latitude = models.FloatField(blank=True, null=True, validators=[MinValueValidator(-90), MaxValueValidator(90)])
+    longitude = models.FloatField(blank=True, null=True, validators=[MinValueValidator(-180), MaxValueValidator(180)])
+    # Derived from latitude/longitude on save; see hotel.geo
+    geohash = models.CharField(max_length=12, blank=True, null=True, editable=False)
     is_active = models.BooleanField(default=True)
+    # Maintained by a database trigger from name, city, country, address and description
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Hotel'
         verbose_name_plural = 'Hotels'
+        indexes = [
+            models.Index(fields=['city']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['name', 'id']),
+            models.Index(fields=['star_rating', 'id']),
+            GinIndex(fields=['search_vector'], name='hotel_search_vector_gin'),
+            GinIndex(fields=['name'], name='hotel_name_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['city'], name='hotel_city_trgm', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['geohash'], name='hotel_geohash_like', opclasses=['varchar_pattern_ops'])
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.city}"
@@ -46,6 +68,15 @@ class Hotel(BaseModel):
 
             self.slug = slug
 
+        if self.latitude is not None and self.longitude is not None:
+            self.geohash = encode_geohash(self.latitude, self.longitude)
+        else:
+            self.geohash = None
+
+        # A new or removed image invalidates the derivatives; the worker picks up the empty value
+        if self.image_variants and self.image_variants.get('source') != (self.image.name if self.image else None):
+            self.image_variants = {}
+
         super().save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -1,3 +1,84 @@
-from django.test import TestCase
+import os
+import unittest
 
-# Create your tests here.
+import redis
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from account.models import Account
+from base.testing import ConstantQueriesMixin, make_account, make_hotel
+from hotel.models import Hotel
+
+# A scratch Redis database for the cacheops tests; it is flushed before each test
+TEST_REDIS_URL = os.environ.get('TEST_REDIS_URL')
+
+
+def _redis_available():
+    if not TEST_REDIS_URL:
+        return False
+    try:
+        return redis.Redis.from_url(TEST_REDIS_URL, socket_connect_timeout=1).ping()
+    except redis.RedisError:
+        return False
+
+
+class HotelListQueryTests(ConstantQueriesMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        # Several landlords, so landlord_name/landlord_email cannot come from one cached row
+        for _ in range(5):
+            landlord = make_account(Account.LANDLORD, first_name='Land', last_name='Lord')
+            make_hotel(landlord)
+            make_hotel(landlord)
+
+    def test_hotel_list_queries_do_not_grow_with_page_size(self):
+        self.assertConstantQueries(reverse('hotel_api:hotel-list'))
+
+
+@unittest.skipUnless(_redis_available(), 'Without Redis cacheops is off (CACHEOPS_ENABLED), so invalidation '
+                                         'cannot be observed; set TEST_REDIS_URL to a scratch Redis database')
+@override_settings(CACHEOPS_ENABLED=True, CACHEOPS_REDIS=TEST_REDIS_URL)
+class HotelCacheInvalidationTests(TransactionTestCase):
+    """
+    Cached hotel querysets must not outlive a write. TransactionTestCase, since
+    cacheops neither caches nor invalidates until the surrounding transaction commits.
+    """
+
+    def setUp(self):
+        redis.Redis.from_url(TEST_REDIS_URL).flushdb()
+        self.hotel = make_hotel(make_account(Account.LANDLORD), name='Old Name')
+
+    def _cached_names(self):
+        return list(Hotel.objects.filter(pk=self.hotel.pk).cache().values_list('name', flat=True))
+
+    def _warm(self):
+        self.assertEqual(self._cached_names(), ['Old Name'])
+        with self.assertNumQueries(0):
+            self.assertEqual(self._cached_names(), ['Old Name'])
+
+    def test_save_invalidates(self):
+        self._warm()
+        self.hotel.name = 'New Name'
+        self.hotel.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(self._cached_names(), ['New Name'])
+
+    def test_invalidated_update_invalidates(self):
+        self._warm()
+        Hotel.objects.filter(pk=self.hotel.pk).invalidated_update(name='New Name')
+        with self.assertNumQueries(1):
+            self.assertEqual(self._cached_names(), ['New Name'])
+
+    def test_plain_update_serves_stale_rows(self):
+        # Why bulk writes to cached models go through invalidated_update or invalidate_model
+        self._warm()
+        Hotel.objects.filter(pk=self.hotel.pk).update(name='New Name')
+        self.assertEqual(self._cached_names(), ['Old Name'])
+
+    def test_hotel_list_reflects_a_save(self):
+        url = reverse('hotel_api:hotel-list')
+        self.assertEqual([hotel['name'] for hotel in self.client.get(url).data['data']], ['Old Name'])
+        self.hotel.name = 'New Name'
+        self.hotel.save()
+        self.assertEqual([hotel['name'] for hotel in self.client.get(url).data['data']], ['New Name'])
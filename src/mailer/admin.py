@@ -0,0 +1,24 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from mailer.models import OutgoingEmail
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'recipient_list', 'status', 'attempts', 'next_attempt_at', 'sent_at', 'created_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('subject',)
+    readonly_fields = ('created_at', 'sent_at', 'attempts', 'last_error')
+    actions = ['retry_now']
+
+    def recipient_list(self, obj):
+        return ', '.join(obj.recipients)
+    recipient_list.short_description = 'Recipients'
+
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=OutgoingEmail.Status.SENT).update(
+            status=OutgoingEmail.Status.PENDING, next_attempt_at=timezone.now(), attempts=0
+        )
+        self.message_user(request, f'{updated} emails queued for retry.')
+    retry_now.short_description = 'Retry selected emails now'
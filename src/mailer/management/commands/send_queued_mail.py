@@ -0,0 +1,30 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from mailer.outbox import purge_sent, send_pending
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued emails in batches over one SMTP connection per batch'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Keep polling instead of exiting when the queue is empty')
+        parser.add_argument('--batch-size', type=int, default=settings.MAIL_OUTBOX_BATCH_SIZE)
+        parser.add_argument('--purge-days', type=int, help='Also delete emails sent more than this many days ago')
+
+    def handle(self, *args, **options):
+        if options['purge_days']:
+            purged = purge_sent(options['purge_days'])
+            self.stdout.write(f'Purged {purged} sent emails.')
+
+        while True:
+            sent, failed = send_pending(options['batch_size'])
+            if sent or failed:
+                self.stdout.write(f'Sent {sent}, failed {failed}.')
+            elif not options['loop']:
+                break
+            else:
+                time.sleep(settings.MAIL_OUTBOX_POLL_INTERVAL)
+        self.stdout.write(self.style.SUCCESS('Mail queue drained.'))
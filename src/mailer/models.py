@@ -0,0 +1,35 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+
+class OutgoingEmail(models.Model):
+    """Email queued by ``mailer.outbox.enqueue`` and delivered by the ``send_queued_mail`` worker"""
+    class Status(models.TextChoices):
+        PENDING = 'pending', _('pending')
+        SENT = 'sent', _('sent')
+        FAILED = 'failed', _('failed')
+
+    subject          = models.CharField(max_length=255)
+    body             = models.TextField()
+    html_body        = models.TextField(null=True, blank=True)
+    from_email       = models.CharField(max_length=254, null=True, blank=True)
+    recipients       = models.JSONField(default=list)
+    status           = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts         = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at  = models.DateTimeField(default=timezone.now)
+    last_error       = models.TextField(null=True, blank=True)
+    created_at       = models.DateTimeField(auto_now_add=True)
+    sent_at          = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f'{self.subject} -> {", ".join(self.recipients)}'
+
+    class Meta:
+        ordering = ['-created_at']
+        db_table = 'mailer_outgoing_emails'
+        verbose_name = _('Outgoing email')
+        verbose_name_plural = _('Outgoing emails')
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'])
+        ]
@@ -0,0 +1,118 @@
+"""
+Transactional email outbox.
+
+Requests only ``enqueue`` a row, so a slow or unreachable SMTP server never
+adds to response time. The ``send_queued_mail`` worker claims due rows with
+``SELECT ... FOR UPDATE SKIP LOCKED`` (several workers can run side by side),
+sends each batch over one reused backend connection and reschedules failures
+with exponential backoff until ``MAIL_OUTBOX_MAX_ATTEMPTS``.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from mailer.models import OutgoingEmail
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(subject, body, recipients, from_email=None, html_body=None):
+    """Queue an email; it is sent by the worker once the current transaction commits"""
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        body=body,
+        html_body=html_body,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=list(recipients),
+    )
+
+
+def retry_delay(attempts):
+    """Backoff after the ``attempts``-th failure: base, 2 x base, 4 x base ... capped"""
+    delay = settings.MAIL_OUTBOX_RETRY_BASE * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, settings.MAIL_OUTBOX_RETRY_MAX))
+
+
+def _message(email, connection):
+    message = EmailMultiAlternatives(email.subject, email.body, email.from_email, email.recipients,
+                                     connection=connection)
+    if email.html_body:
+        message.attach_alternative(email.html_body, 'text/html')
+    return message
+
+
+def _failed(email, error, now):
+    email.attempts += 1
+    email.last_error = str(error)[:2000] or error.__class__.__name__
+    if email.attempts >= settings.MAIL_OUTBOX_MAX_ATTEMPTS:
+        email.status = OutgoingEmail.Status.FAILED
+    else:
+        email.next_attempt_at = now + retry_delay(email.attempts)
+
+
+def send_pending(batch_size=None, connection=None):
+    """
+    Send one batch of due emails; returns (sent, failed).
+    ``connection`` defaults to ``get_connection()`` (``EMAIL_BACKEND``), so the
+    locmem backend collects the messages in ``django.core.mail.outbox``.
+    """
+    batch_size = batch_size or settings.MAIL_OUTBOX_BATCH_SIZE
+    connection = connection or get_connection()
+    sent = failed = 0
+
+    with transaction.atomic():
+        now = timezone.now()
+        emails = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutgoingEmail.Status.PENDING, next_attempt_at__lte=now)
+            .order_by('next_attempt_at', 'id')[:batch_size]
+        )
+        if not emails:
+            return sent, failed
+
+        try:
+            connection.open()
+        except Exception as error:
+            logger.warning('Mail outbox: could not connect: %s', error)
+            for email in emails:
+                _failed(email, error, now)
+            OutgoingEmail.objects.bulk_update(emails, ['attempts', 'last_error', 'status', 'next_attempt_at'])
+            return sent, len(emails)
+
+        try:
+            for email in emails:
+                try:
+                    connection.send_messages([_message(email, connection)])
+                except Exception as error:
+                    logger.warning('Mail outbox: email %s failed: %s', email.pk, error)
+                    _failed(email, error, now)
+                    failed += 1
+                    # The connection may be broken; start the rest of the batch on a fresh one
+                    connection.close()
+                    try:
+                        connection.open()
+                    except Exception:
+                        pass
+                else:
+                    email.status = OutgoingEmail.Status.SENT
+                    email.sent_at = timezone.now()
+                    email.attempts += 1
+                    sent += 1
+        finally:
+            connection.close()
+
+        OutgoingEmail.objects.bulk_update(
+            emails, ['attempts', 'last_error', 'status', 'next_attempt_at', 'sent_at']
+        )
+    return sent, failed
+
+
+def purge_sent(days):
+    """Delete emails sent more than ``days`` ago"""
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = OutgoingEmail.objects.filter(status=OutgoingEmail.Status.SENT, sent_at__lt=cutoff).delete()
+    return deleted
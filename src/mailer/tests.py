@@ -0,0 +1,83 @@
+from django.conf import settings
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from base.testing import make_account
+from mailer.models import OutgoingEmail
+from mailer.outbox import enqueue, retry_delay, send_pending
+
+
+class FailingBackend(EmailBackend):
+    """Connects, then refuses every message"""
+
+    def send_messages(self, messages):
+        raise ConnectionResetError('connection reset by peer')
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class OutboxTests(TestCase):
+
+    def _enqueue(self):
+        return enqueue('Welcome', 'Hello there', ['guest@example.com'], from_email='hotel@example.com')
+
+    def test_send_pending_delivers_and_marks_sent(self):
+        email = self._enqueue()
+
+        self.assertEqual(send_pending(), (1, 0))
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, 'Welcome')
+        self.assertEqual(mail.outbox[0].to, ['guest@example.com'])
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutgoingEmail.Status.SENT)
+        self.assertEqual(email.attempts, 1)
+        self.assertIsNotNone(email.sent_at)
+        # Nothing left to send
+        self.assertEqual(send_pending(), (0, 0))
+
+    def test_failure_is_rescheduled_with_backoff(self):
+        email = self._enqueue()
+        before = timezone.now()
+
+        self.assertEqual(send_pending(connection=FailingBackend()), (0, 1))
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutgoingEmail.Status.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn('connection reset', email.last_error)
+        self.assertGreaterEqual(email.next_attempt_at, before + retry_delay(1))
+        self.assertEqual(mail.outbox, [])
+        # Not due yet, so the next run leaves it alone
+        self.assertEqual(send_pending(), (0, 0))
+
+    def test_failed_after_max_attempts(self):
+        email = self._enqueue()
+
+        for attempt in range(settings.MAIL_OUTBOX_MAX_ATTEMPTS):
+            OutgoingEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+            self.assertEqual(send_pending(connection=FailingBackend()), (0, 1))
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutgoingEmail.Status.FAILED)
+        self.assertEqual(email.attempts, settings.MAIL_OUTBOX_MAX_ATTEMPTS)
+        OutgoingEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(send_pending(), (0, 0))
+        self.assertEqual(mail.outbox, [])
+
+    def test_password_reset_only_enqueues(self):
+        user = make_account()
+
+        response = APIClient().post(reverse('password_reset:reset-password-request'), {'email': user.email})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mail.outbox, [])
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.recipients, [user.email])
+        self.assertEqual(email.status, OutgoingEmail.Status.PENDING)
+
+        self.assertEqual(send_pending(), (1, 0))
+        self.assertEqual(mail.outbox[0].to, [user.email])
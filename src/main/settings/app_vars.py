@@ -23,11 +23,62 @@ DB_USER = os.environ.get('DB_USER')
 DB_PASS = os.environ.get('DB_PASSWORD')
 DB_HOST = os.environ.get('DB_HOST')
 DB_PORT = int(os.environ.get('DB_PORT'))
+# Seconds a connection is kept for reuse (0 closes it after every request)
+DB_CONN_MAX_AGE = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+DB_CONN_HEALTH_CHECKS = os.environ.get('DB_CONN_HEALTH_CHECKS', 'true').lower() == 'true'
+DB_CONN_HEALTH_CHECK_IDLE = int(os.environ.get('DB_CONN_HEALTH_CHECK_IDLE', 10))
+DB_CONNECT_TIMEOUT = int(os.environ.get('DB_CONNECT_TIMEOUT', 5))
+# Set when DB_HOST is a pgbouncer in transaction pooling mode
+DB_PGBOUNCER = os.environ.get('DB_PGBOUNCER', 'false').lower() == 'true'
+# Read replicas as comma separated host[:port], same database and credentials as the primary
+DB_REPLICAS = [host.strip() for host in os.environ.get('DB_REPLICAS', '').split(',') if host.strip()]
+# Seconds a client reads the primary after writing, to cover replication lag
+DB_REPLICA_PIN_SECONDS = int(os.environ.get('DB_REPLICA_PIN_SECONDS', 5))
+
+# Cache
+REDIS_URL = os.environ.get('REDIS_URL')
+CATALOG_CACHE_TIMEOUT = int(os.environ.get('CATALOG_CACHE_TIMEOUT', 60 * 15))
+# Cache-Control max-age of anonymous hotel and room responses (base.helpers.conditional)
+CATALOG_HTTP_MAX_AGE = int(os.environ.get('CATALOG_HTTP_MAX_AGE', 60))
+
+# Authorization service
+AUTHORIZATION_SERVICE = os.environ.get('AUTHORIZATION_SERVICE')
+EVALY_API_SECRET_KEY = os.environ.get('EVALY_API_SECRET_KEY')
+AUTHORIZATION_CONNECT_TIMEOUT = float(os.environ.get('AUTHORIZATION_CONNECT_TIMEOUT', 1.0))
+AUTHORIZATION_READ_TIMEOUT = float(os.environ.get('AUTHORIZATION_READ_TIMEOUT', 2.0))
+AUTHORIZATION_CACHE_TTL = int(os.environ.get('AUTHORIZATION_CACHE_TTL', 300))
+AUTHORIZATION_CACHE_SIZE = int(os.environ.get('AUTHORIZATION_CACHE_SIZE', 1024))
+# module:role:action triples, comma separated, warmed into the decision cache when the
+# client is first used (base.authorization), e.g. hotel:landlord:create,room:admin:delete
+AUTHORIZATION_PRELOAD = [
+    tuple(entry.strip().split(':')) for entry in os.environ.get('AUTHORIZATION_PRELOAD', '').split(',') if entry.strip()
+]
+
+# Token authentication cache; AUTH_TOKEN_CACHE_ALIAS names a shared Django cache (optional)
+AUTH_TOKEN_CACHE_TTL = int(os.environ.get('AUTH_TOKEN_CACHE_TTL', 30))
+AUTH_TOKEN_CACHE_SIZE = int(os.environ.get('AUTH_TOKEN_CACHE_SIZE', 10000))
+AUTH_TOKEN_CACHE_ALIAS = os.environ.get('AUTH_TOKEN_CACHE_ALIAS') or None
+# Signed token lifetime (seconds), revocation list cache and legacy token pruning (prune_tokens)
+AUTH_TOKEN_LIFETIME = int(os.environ.get('AUTH_TOKEN_LIFETIME', 7 * 24 * 3600))
+AUTH_REVOCATION_CACHE_TTL = int(os.environ.get('AUTH_REVOCATION_CACHE_TTL', 10))
+AUTH_LEGACY_TOKEN_MAX_AGE_DAYS = int(os.environ.get('AUTH_LEGACY_TOKEN_MAX_AGE_DAYS', 90))
 
 # Email
-EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND')
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
 EMAIL_HOST = os.environ.get('EMAIL_HOST')
-EMAIT_PORT = os.environ.get('EMAIL_PORT')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 25))
 # EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER')
-EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD')
\ No newline at end of file
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD')
+EMAIL_TIMEOUT = int(os.environ.get('EMAIL_TIMEOUT', 30))
+DEFAULT_FROM_EMAIL = os.environ.get('EMAIL_SENDER', 'webmaster@localhost')
+
+# Email outbox (mailer app)
+MAIL_OUTBOX_BATCH_SIZE = int(os.environ.get('MAIL_OUTBOX_BATCH_SIZE', 50))
+MAIL_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('MAIL_OUTBOX_MAX_ATTEMPTS', 6))
+MAIL_OUTBOX_RETRY_BASE = int(os.environ.get('MAIL_OUTBOX_RETRY_BASE', 60))
+MAIL_OUTBOX_RETRY_MAX = int(os.environ.get('MAIL_OUTBOX_RETRY_MAX', 3600))
+MAIL_OUTBOX_POLL_INTERVAL = int(os.environ.get('MAIL_OUTBOX_POLL_INTERVAL', 5))
+
+# Hotel image derivatives worker (generate_thumbnails --loop)
+THUMBNAIL_POLL_INTERVAL = int(os.environ.get('THUMBNAIL_POLL_INTERVAL', 10))
@@ -7,6 +7,7 @@ DJANGO_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 ON_TOP_APPS = [
@@ -30,6 +31,8 @@ LOCAL_APPS = [
     'room',
     'booking',
     'payment',
+    'stats',
+    'mailer',
     'frontend'
 ]
 
@@ -41,7 +44,7 @@ if DEBUG:
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'account.authentication.CachedTokenAuthentication',
     ]
 }
 
@@ -55,7 +58,8 @@ DEFAULT_MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ON_TOP_MIDDLEWARE = ['corsheaders.middleware.CorsMiddleware', ]
+# ReplicaMiddleware is outermost so writes made by other middleware (sessions) pin to the primary too
+ON_TOP_MIDDLEWARE = ['base.routers.ReplicaMiddleware', 'corsheaders.middleware.CorsMiddleware', ]
 
 ROOT_URLCONF = 'main.urls'
 
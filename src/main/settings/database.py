@@ -1,4 +1,6 @@
-from main.settings import DB_NAME, DB_USER, DB_PASS, DB_HOST, DB_PORT
+from main.settings import (
+    DB_NAME, DB_USER, DB_PASS, DB_HOST, DB_PORT, DB_CONN_MAX_AGE, DB_CONNECT_TIMEOUT, DB_PGBOUNCER, DB_REPLICAS,
+)
 
 DATABASES = {
     'default': {
@@ -8,6 +10,31 @@ DATABASES = {
         'PASSWORD': DB_PASS,
         'HOST': DB_HOST,
         'PORT': DB_PORT,
+        # Persistent connections. At request start base.db.check_connections replaces dead ones, but only
+        # pings (SELECT 1) a connection that sat idle longer than DB_CONN_HEALTH_CHECK_IDLE seconds (default 10)
+        # or whose last request raised database errors; connections in steady use skip the round trip.
+        'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        # A pooler in transaction mode may hand the next transaction to another server
+        # connection, so named cursors (.iterator()) cannot outlive their transaction.
+        # psycopg2 does not use server-side prepared statements, so nothing else is needed.
+        'DISABLE_SERVER_SIDE_CURSORS': DB_PGBOUNCER,
+        'OPTIONS': {
+            'connect_timeout': DB_CONNECT_TIMEOUT,
+        },
     }
 }
 
+# Read replicas, used by base.routers.ReplicaRouter for safe requests
+DB_REPLICA_ALIASES = []
+for number, replica in enumerate(DB_REPLICAS):
+    replica_host, _, replica_port = replica.partition(':')
+    alias = f'replica_{number}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': replica_host,
+        'PORT': int(replica_port) if replica_port else DB_PORT,
+        'TEST': {'MIRROR': 'default'},
+    }
+    DB_REPLICA_ALIASES.append(alias)
+
+DATABASE_ROUTERS = ['base.routers.ReplicaRouter'] if DB_REPLICA_ALIASES else []
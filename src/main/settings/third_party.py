@@ -1,9 +1,9 @@
-from main.settings import DEBUG
+from main.settings import DEBUG, REDIS_URL, CATALOG_CACHE_TIMEOUT
 
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'account.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
@@ -69,3 +69,19 @@ CORS_ALLOW_METHODS = [
 SWAGGER_SETTINGS = {
       'JSON_EDITOR': True,
 }
+
+
+# Query cache (django-cacheops)
+# Public hotel/room querysets opt in with .cache(); saves invalidate them automatically.
+# cacheops needs a real Redis (its invalidation runs Lua scripts using cjson), so without
+# REDIS_URL it is switched off and .cache() querysets read from Postgres; tests run offline.
+# The invalidation tests (hotel.tests) switch it on against TEST_REDIS_URL and are skipped without it.
+CACHEOPS_DEGRADE_ON_FAILURE = True
+
+CACHEOPS = {
+    'hotel.hotel': {'ops': (), 'timeout': CATALOG_CACHE_TIMEOUT},
+    'room.room': {'ops': (), 'timeout': CATALOG_CACHE_TIMEOUT},
+}
+
+CACHEOPS_REDIS = REDIS_URL or {}
+CACHEOPS_ENABLED = bool(REDIS_URL)
@@ -20,6 +20,7 @@ urlpatterns = [
     path('api/room/', include('room.api.urls', 'room_api')),
     path('api/booking/', include('booking.api.urls', 'booking_api')),
     path('api/payment/', include('payment.api.urls', 'payment_api')),
+    path('api/stats/', include('stats.api.urls', 'stats_api')),
 
     path('', include('frontend.urls', 'frontend')),
 
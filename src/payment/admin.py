@@ -11,6 +11,7 @@ class PaymentAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'updated_at', 'created_by', 'updated_by')
     date_hierarchy = 'created_at'
     list_per_page = 25
+    list_select_related = ('booking', 'booking__room')
 
     fieldsets = (
         ('Payment Information', {
@@ -0,0 +1,50 @@
+"""
+Payment aggregation done by the database.
+
+Every function takes an optional ``Payment`` queryset (already filtered by the
+caller) and returns ``Sum``/``Count`` results, so totals are exact and never
+require loading payment rows into Python.
+"""
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDay
+
+from payment.models import Payment
+
+# group name -> (values() call producing the group key, ordering)
+GROUPINGS = {
+    'method': (lambda queryset: queryset.values('payment_method'), 'payment_method'),
+    'hotel': (lambda queryset: queryset.values(hotel=F('booking__room__hotel'),
+                                                hotel_name=F('booking__room__hotel__name')), 'hotel'),
+    'day': (lambda queryset: queryset.values(day=TruncDay('created_at')), 'day'),
+}
+
+
+def _base(queryset):
+    return (Payment.objects.all() if queryset is None else queryset).order_by()
+
+
+def payment_totals(queryset=None):
+    """{'total_amount': float, 'count': int} for the given payments"""
+    totals = _base(queryset).aggregate(total_amount=Sum('amount'), count=Count('id'))
+    totals['total_amount'] = totals['total_amount'] or 0.0
+    return totals
+
+
+def grouped_totals(group_by, queryset=None):
+    """
+    Totals per payment method, hotel or day.
+    ``group_by`` is one of ``GROUPINGS``; raises ``KeyError`` otherwise.
+    """
+    group, ordering = GROUPINGS[group_by]
+    rows = group(_base(queryset)).annotate(total_amount=Sum('amount'), count=Count('id')).order_by(ordering)
+    return list(rows)
+
+
+def booking_paid_amount(booking):
+    """Amount paid so far towards ``booking`` (instance or pk)"""
+    return payment_totals(Payment.objects.filter(booking=booking))['total_amount']
+
+
+def booking_balance(booking):
+    """Amount still due on ``booking``"""
+    return booking.discounted_price - booking_paid_amount(booking)
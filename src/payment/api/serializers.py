@@ -5,6 +5,7 @@ from payment.models import Payment
 
 class PaymentSerializer(serializers.ModelSerializer):
     booking_id = serializers.SerializerMethodField()
+    sparse_sources = {'booking_id': ['booking']}
 
     class Meta:
         model = Payment
@@ -12,4 +13,4 @@ class PaymentSerializer(serializers.ModelSerializer):
         read_only_fields = ('created_by', 'updated_by', 'created_at', 'updated_at')
 
     def get_booking_id(self, obj):
-        return obj.booking.id if obj.booking else None
+        return obj.booking_id
@@ -7,11 +7,19 @@ payment_list = PaymentViewset.as_view({
     'get': 'list',
     'post': 'create'
 })
+payment_summary = PaymentViewset.as_view({
+    'get': 'summary'
+})
+payment_export = PaymentViewset.as_view({
+    'get': 'export'
+})
 payment_detail = PaymentViewset.as_view({
     'get': 'retrieve'
 })
 
 urlpatterns = [
     path('', payment_list, name='payment-list'),
+    path('summary', payment_summary, name='payment-summary'),
+    path('export', payment_export, name='payment-export'),
     path('<int:pk>/', payment_detail, name='payment-detail'),
 ]
@@ -2,15 +2,20 @@ from rest_framework import permissions
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, filters, mixins, viewsets
 from rest_framework.response import Response
-from base.helpers import CustomPagination
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from base.helpers import CustomPagination, SparseFieldsMixin
+from base.helpers.streaming import compress_param, data_format_param, stream_rows
+from booking.availability import filter_period, parse_id
 from payment.models import Payment
 from .serializers import PaymentSerializer
 from django.utils.decorators import method_decorator
 
+from payment.aggregates import GROUPINGS, grouped_totals, payment_totals
 from payment.validation import payment_validation
 
 
-class PaymentViewset(mixins.ListModelMixin,
+class PaymentViewset(SparseFieldsMixin,
+                  mixins.ListModelMixin,
                   mixins.CreateModelMixin,
                   mixins.RetrieveModelMixin,
                   viewsets.GenericViewSet):
@@ -45,3 +50,64 @@ class PaymentViewset(mixins.ListModelMixin,
         self.perform_create(serializer)
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+
+    def _reporting_queryset(self, request, verb):
+        """Admins report on every payment, landlords on their own hotels' payments, others not at all"""
+        user = request.user
+        queryset = self.filter_queryset(self.get_queryset())
+        if user.is_role_admin():
+            return queryset
+        if user.is_role_landlord():
+            return queryset.filter(booking__room__hotel__landlord=user)
+        raise PermissionDenied(f"Only landlords and admins can {verb} payments")
+
+    def summary(self, request, *args, **kwargs):
+        """
+        Database-side payment totals; landlords see only their own hotels.
+        Query params: group_by (method, hotel, day), hotel, start, end and the list filters.
+        """
+        params = request.query_params
+        queryset = self._reporting_queryset(request, 'summarize')
+        hotel_id = parse_id(params, 'hotel')
+        if hotel_id:
+            queryset = queryset.filter(booking__room__hotel=hotel_id)
+        queryset = filter_period(queryset, params)
+
+        data = payment_totals(queryset)
+        group_by = params.get('group_by')
+        if group_by:
+            if group_by not in GROUPINGS:
+                raise ValidationError(detail=f'group_by must be one of: {", ".join(GROUPINGS)}.')
+            data['groups'] = grouped_totals(group_by, queryset)
+        return Response(data)
+
+    # (column, lookup) pairs; related columns are joined into the same query
+    EXPORT_COLUMNS = [
+        ('id', 'id'),
+        ('booking', 'booking_id'),
+        ('hotel', 'booking__room__hotel_id'),
+        ('hotel_name', 'booking__room__hotel__name'),
+        ('room_no', 'booking__room__room_no'),
+        ('customer_phone_no', 'booking__customer_phone_no'),
+        ('amount', 'amount'),
+        ('payment_method', 'payment_method'),
+        ('created_by', 'created_by'),
+        ('created_at', 'created_at'),
+    ]
+
+    def export(self, request, *args, **kwargs):
+        """
+        Stream payments as CSV (default) or NDJSON for accounting.
+        Query params: data_format, gzip, hotel, start, end (on created_at) and the list filters.
+        """
+        queryset = self._reporting_queryset(request, 'export')
+        params = request.query_params
+        hotel_id = parse_id(params, 'hotel')
+        if hotel_id:
+            queryset = queryset.filter(booking__room__hotel=hotel_id)
+        queryset = filter_period(queryset, params)
+
+        columns, lookups = zip(*self.EXPORT_COLUMNS)
+        rows = queryset.order_by('created_at', 'id').values_list(*lookups).iterator(chunk_size=2000)
+        return stream_rows(columns, rows, data_format_param(request), 'payments',
+                           compress=compress_param(request))
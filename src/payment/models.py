@@ -28,5 +28,7 @@ class Payment(BaseModel):
         verbose_name_plural = _('Payments')
         indexes = [
             models.Index(fields=['booking']),
-            models.Index(fields=['payment_method'])
+            models.Index(fields=['payment_method']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['amount', 'id'])
         ]
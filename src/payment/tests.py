@@ -1,3 +1,21 @@
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from account.models import Account
+from base.testing import ConstantQueriesMixin, make_account, make_booking, make_hotel, make_payment, make_room
+
+
+class PaymentListQueryTests(ConstantQueriesMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_account(Account.ADMIN)
+        hotel = make_hotel(make_account(Account.LANDLORD))
+        for _ in range(10):
+            make_payment(make_booking(make_room(hotel)))
+
+    def test_payment_list_queries_do_not_grow_with_page_size(self):
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        self.assertConstantQueries(reverse('payment_api:payment-list'), client=client)
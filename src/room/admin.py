@@ -10,6 +10,7 @@ class RoomAdmin(admin.ModelAdmin):
     search_fields = ('room_no', 'hotel__name', 'hotel__city', 'details')
     readonly_fields = ('created_at', 'updated_at', 'created_by', 'updated_by')
     list_per_page = 25
+    list_select_related = ('hotel',)
 
     fieldsets = (
         ('Room Information', {
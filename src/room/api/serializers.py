@@ -6,6 +6,7 @@ from room.models import Room
 class RoomSerializer(serializers.ModelSerializer):
     hotel_name = serializers.SerializerMethodField()
     hotel_city = serializers.SerializerMethodField()
+    sparse_sources = {'hotel_name': ['hotel__name'], 'hotel_city': ['hotel__city']}
 
     class Meta:
         model = Room
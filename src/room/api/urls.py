@@ -7,6 +7,18 @@ room_list = RoomViewset.as_view({
     'get': 'list',
     'post': 'create'
 })
+room_available = RoomViewset.as_view({
+    'get': 'available'
+})
+room_import = RoomViewset.as_view({
+    'post': 'import_rooms'
+})
+room_export = RoomViewset.as_view({
+    'get': 'export_rooms'
+})
+room_calendar = RoomViewset.as_view({
+    'get': 'calendar'
+})
 room_detail = RoomViewset.as_view({
     'get': 'retrieve',
     'patch': 'update'
@@ -14,5 +26,9 @@ room_detail = RoomViewset.as_view({
 
 urlpatterns = [
     path('', room_list, name='room-list'),
+    path('available', room_available, name='room-available'),
+    path('import', room_import, name='room-import'),
+    path('export', room_export, name='room-export'),
     path('<int:pk>/', room_detail, name='room-detail'),
+    path('<int:pk>/calendar', room_calendar, name='room-calendar'),
 ]
@@ -1,26 +1,37 @@
+import csv
+
+from cacheops import invalidate_model
 from rest_framework import permissions
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, filters, mixins, viewsets
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied
-from base.helpers import CustomPagination
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from base.helpers import ConditionalGetMixin, CustomPagination, SparseFieldsMixin
+from base.helpers.streaming import compress_param, data_format_param, read_records, stream_rows
+from booking.availability import exclude_booked, parse_id, parse_window
+from booking.calendar import parse_range, room_calendar
+from room.bulk import RoomImport
 from room.models import Room
 from hotel.models import Hotel
 from .serializers import RoomSerializer
 
 
-class RoomViewset(mixins.ListModelMixin,
+class RoomViewset(ConditionalGetMixin,
+                  SparseFieldsMixin,
+                  mixins.ListModelMixin,
                   mixins.CreateModelMixin,
                   mixins.RetrieveModelMixin,
                   mixins.UpdateModelMixin,
                   mixins.DestroyModelMixin,
                   viewsets.GenericViewSet):
-    queryset = Room.objects.filter(is_available=True)
+    queryset = Room.objects.filter(is_available=True).select_related('hotel')
     serializer_class = RoomSerializer
     pagination_class = CustomPagination
     lookup_field = 'pk'
     filter_backends = [filters.OrderingFilter, DjangoFilterBackend]
     ordering_fields = ['-created_at', 'price']
+    # hotel_name and hotel_city are part of each room
+    conditional_related = ('hotel',)
 
     filterset_fields = [
         'room_no', 'floor_no', 'capacity', 'hotel', 'is_available'
@@ -28,11 +39,12 @@ class RoomViewset(mixins.ListModelMixin,
 
     def get_permissions(self):
         """
-        GET (list, retrieve) - Public (AllowAny)
-        POST (create) - Landlord (own hotels) & Admin only
+        GET (list, retrieve, available) - Public (AllowAny)
+        POST (create, import) - Landlord (own hotels) & Admin only
+        GET (export, calendar) - Landlord (own hotels) & Admin only
         PUT/PATCH/DELETE - Landlord (own hotels) & Admin only
         """
-        if self.action in ['list', 'retrieve']:
+        if self.action in ['list', 'retrieve', 'available']:
             permission_classes = [permissions.AllowAny]
         else:
             permission_classes = [permissions.IsAuthenticated]
@@ -49,12 +61,20 @@ class RoomViewset(mixins.ListModelMixin,
 
         # For list and retrieve, show all available rooms
         if self.action in ['list', 'retrieve']:
-            return queryset
+            return queryset.cache()
+
+        # For date range search, only rooms of active hotels are bookable
+        if self.action == 'available':
+            return queryset.filter(hotel__is_active=True)
+
+        # Owners check the calendar of rooms off sale too
+        if self.action == 'calendar':
+            queryset = Room.objects.select_related('hotel')
 
         # For create/update/delete, filter by hotel ownership
         if user.is_authenticated:
             if user.is_role_admin():
-                return Room.objects.all()  # Admin sees all
+                return Room.objects.select_related('hotel')  # Admin sees all
             elif user.is_role_landlord():
                 return queryset.filter(hotel__landlord=user)  # Landlord sees only rooms in their hotels
 
@@ -66,12 +86,12 @@ class RoomViewset(mixins.ListModelMixin,
         hotel_id = self.request.data.get('hotel')
 
         if not hotel_id:
-            raise serializers.ValidationError("Hotel is required")
+            raise ValidationError("Hotel is required")
 
         try:
             hotel = Hotel.objects.get(id=hotel_id)
         except Hotel.DoesNotExist:
-            raise serializers.ValidationError("Hotel not found")
+            raise ValidationError("Hotel not found")
 
         # Check permissions
         if not user.is_role_admin() and hotel.landlord != user:
@@ -110,3 +130,87 @@ class RoomViewset(mixins.ListModelMixin,
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
+    def available(self, request, *args, **kwargs):
+        """
+        Rooms free for the whole ``[start, end)`` window.
+        Query params: start, end (required), capacity (minimum), city, hotel.
+        """
+        params = request.query_params
+        start, end = parse_window(params.get('start'), params.get('end'))
+
+        queryset = self.get_queryset()
+        if params.get('capacity'):
+            if not params.get('capacity').isdigit():
+                raise ValidationError(detail='Capacity must be a positive number.')
+            queryset = queryset.filter(capacity__gte=params.get('capacity'))
+        if params.get('city'):
+            queryset = queryset.filter(hotel__city=params.get('city'))
+        hotel_id = parse_id(params, 'hotel')
+        if hotel_id:
+            queryset = queryset.filter(hotel=hotel_id)
+
+        queryset = filters.OrderingFilter().filter_queryset(request, exclude_booked(queryset, start, end), self)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    EXPORT_FIELDS = ['id', 'hotel', 'room_no', 'floor_no', 'capacity', 'price', 'details', 'is_available']
+
+    def import_rooms(self, request, *args, **kwargs):
+        """
+        Create or update rooms from an uploaded CSV/NDJSON file (multipart field ``file``).
+        Rows are matched on (hotel, room_no); the response reports per-line errors.
+        """
+        user = request.user
+        if not (user.is_role_admin() or user.is_role_landlord()):
+            raise PermissionDenied("Only landlords and admins can import rooms")
+
+        upload = request.FILES.get('file')
+        if upload is None:
+            raise ValidationError(detail='A file is required.')
+        data_format = data_format_param(request, filename=upload.name)
+
+        importer = RoomImport(user)
+        try:
+            report = importer.run(read_records(upload, data_format))
+        except (UnicodeDecodeError, csv.Error):
+            # Chunks before the unreadable part are already committed; say which
+            return Response({
+                'detail': 'File must be UTF-8 encoded CSV or NDJSON. Rows before the error were imported.',
+                **importer.report(),
+            }, status=status.HTTP_400_BAD_REQUEST)
+        finally:
+            # bulk_create/bulk_update bypass cacheops' save hooks
+            invalidate_model(Room)
+        return Response(report, status=status.HTTP_200_OK)
+
+    def export_rooms(self, request, *args, **kwargs):
+        """Stream the caller's rooms as CSV (default) or NDJSON, selected by ``data_format``; ``gzip=true`` compresses"""
+        user = request.user
+        if user.is_role_admin():
+            queryset = Room.objects.all()
+        elif user.is_role_landlord():
+            queryset = Room.objects.filter(hotel__landlord=user)
+        else:
+            raise PermissionDenied("Only landlords and admins can export rooms")
+
+        fields = [field if field != 'hotel' else 'hotel_id' for field in self.EXPORT_FIELDS]
+        rows = queryset.order_by('hotel_id', 'room_no').values_list(*fields).iterator(chunk_size=2000)
+        return stream_rows(self.EXPORT_FIELDS, rows, data_format_param(request), 'rooms',
+                           compress=compress_param(request))
+
+    def calendar(self, request, *args, **kwargs):
+        """Per-day occupancy of one room. Query params: from (default today), to (exclusive)."""
+        room = self.get_object()
+        start, end = parse_range(request.query_params)
+        return Response({
+            'room': room.pk,
+            'from': start,
+            'to': end,
+            'days': room_calendar(room, start, end),
+        })
@@ -0,0 +1,141 @@
+"""
+Bulk room import keyed on the (hotel, room_no) unique pair.
+
+Records are validated in chunks; hotel ownership is checked once per hotel for
+the whole import, and each chunk is written with one ``bulk_create`` and one
+``bulk_update`` inside its own transaction. Chunks are committed as they go, so
+when the file turns out to be unreadable partway through, ``report()`` still
+describes the rows already written.
+"""
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from base.helpers.streaming import chunked
+from hotel.models import Hotel
+from room.models import Room
+from room.signals import rooms_bulk_created, rooms_bulk_updated
+
+IMPORT_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+UPDATABLE_FIELDS = ['floor_no', 'capacity', 'price', 'details', 'is_available']
+
+
+class RoomImportSerializer(serializers.ModelSerializer):
+    hotel = serializers.IntegerField()
+
+    class Meta:
+        model = Room
+        fields = ['hotel', 'room_no', 'floor_no', 'capacity', 'price', 'details', 'is_available']
+        # Uniqueness is resolved as an upsert below, not rejected
+        validators = []
+
+
+class RoomImport:
+    """
+    Usage:
+        report = RoomImport(user).run(read_records(upload, data_format))
+
+    ``run`` raises ``UnicodeDecodeError`` / ``csv.Error`` from the reader
+    after committing the chunks before the bad one.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.created = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors = []
+        self._hotel_allowed = {}
+
+    def _error(self, line, detail):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'errors': detail})
+
+    def _check_hotels(self, hotel_ids):
+        """Ownership is resolved once per hotel for the whole import"""
+        unknown = set(hotel_ids) - set(self._hotel_allowed)
+        if not unknown:
+            return
+        owners = dict(Hotel.objects.filter(pk__in=unknown).values_list('pk', 'landlord_id'))
+        for hotel_id in unknown:
+            if hotel_id not in owners:
+                self._hotel_allowed[hotel_id] = 'Hotel not found.'
+            elif self.user.is_role_admin() or owners[hotel_id] == self.user.pk:
+                self._hotel_allowed[hotel_id] = None
+            else:
+                self._hotel_allowed[hotel_id] = 'You can only add rooms to your own hotels.'
+
+    def _import_chunk(self, chunk):
+        valid = {}
+        for line, record in chunk:
+            if record is None:
+                self._error(line, 'Invalid record.')
+                continue
+            # Empty CSV cells mean "not given" so model defaults apply
+            record = {name: value for name, value in record.items() if value not in ('', None)}
+            serializer = RoomImportSerializer(data=record)
+            if not serializer.is_valid():
+                self._error(line, serializer.errors)
+                continue
+            data = serializer.validated_data
+            # A repeated (hotel, room_no) inside the file: the last record wins
+            valid[(data['hotel'], data['room_no'])] = (line, data)
+
+        self._check_hotels({hotel_id for hotel_id, room_no in valid})
+        for key, (line, data) in list(valid.items()):
+            problem = self._hotel_allowed[key[0]]
+            if problem:
+                self._error(line, problem)
+                del valid[key]
+        if not valid:
+            return
+
+        with transaction.atomic():
+            existing = {
+                (room.hotel_id, room.room_no): room
+                for room in Room.objects.select_for_update().filter(
+                    hotel_id__in={hotel_id for hotel_id, room_no in valid},
+                    room_no__in={room_no for hotel_id, room_no in valid},
+                )
+            }
+            to_create, to_update = [], []
+            now = timezone.now()
+            for key, (line, data) in valid.items():
+                room = existing.get(key)
+                if room is None:
+                    fields = {name: value for name, value in data.items() if name != 'hotel'}
+                    to_create.append(Room(hotel_id=data['hotel'], created_by=self.user.email, **fields))
+                else:
+                    for name in UPDATABLE_FIELDS:
+                        if name in data:
+                            setattr(room, name, data[name])
+                    room.updated_by = self.user.email
+                    room.updated_at = now
+                    to_update.append(room)
+
+            created = Room.objects.bulk_create(to_create)
+            if to_update:
+                Room.objects.bulk_update(to_update, UPDATABLE_FIELDS + ['updated_by', 'updated_at'])
+            if created:
+                rooms_bulk_created.send(sender=Room, rooms=created)
+            if to_update:
+                rooms_bulk_updated.send(sender=Room, rooms=to_update)
+
+        self.created += len(to_create)
+        self.updated += len(to_update)
+
+    def run(self, records):
+        for chunk in chunked(records, IMPORT_CHUNK_SIZE):
+            self._import_chunk(chunk)
+        return self.report()
+
+    def report(self):
+        """Counts and reported errors of the rows processed so far"""
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'failed': self.failed,
+            'errors': self.errors,
+        }
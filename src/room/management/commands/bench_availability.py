@@ -0,0 +1,64 @@
+import random
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from base.benchmark import (
+    CITIES, analyze, benchmark_start, make_landlord, measure, percentile, require_postgres, rolled_back,
+    seed_bookings, seed_hotels, seed_rooms, summary,
+)
+from booking.models import Booking
+from hotel.models import Hotel
+from room.models import Room
+
+
+class Command(BaseCommand):
+    help = 'Time /api/room/available over synthetic rooms and bookings (rolled back afterwards)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rooms', type=int, default=100000)
+        parser.add_argument('--bookings', type=int, default=5000000)
+        parser.add_argument('--rooms-per-hotel', type=int, default=50)
+        parser.add_argument('--repeat', type=int, default=50)
+        parser.add_argument('--budget-ms', type=float, default=100.0, help='p95 target per search')
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        require_postgres()
+        rng = random.Random(options['seed'])
+        repeat = options['repeat']
+        with rolled_back():
+            self.stdout.write(f"Seeding {options['rooms']} rooms and {options['bookings']} bookings...")
+            hotels = seed_hotels(max(1, options['rooms'] // options['rooms_per_hotel']), make_landlord(), rng)
+            seed_rooms(hotels, options['rooms'], rng)
+            first_day = benchmark_start()
+            last_day = seed_bookings(options['bookings'], first_day)
+            analyze(Hotel, Room, Booking)
+
+            client = APIClient()
+            url = reverse('room_api:room-available')
+            span = max((last_day - first_day).days - 3, 1)
+
+            def search(**params):
+                start = first_day + timedelta(days=rng.randrange(span))
+                query = {'start': start.isoformat(), 'end': (start + timedelta(days=rng.randint(1, 3))).isoformat()}
+                query.update(params)
+                response = client.get(url, query)
+                if response.status_code != 200:
+                    raise AssertionError(response.content)
+
+            results = [
+                ('whole catalog', measure(search, repeat)),
+                ('one city', measure(lambda: search(city=rng.choice(CITIES)), repeat)),
+                ('one city, capacity >= 4', measure(lambda: search(city=rng.choice(CITIES), capacity=4), repeat)),
+                ('one hotel', measure(lambda: search(hotel=rng.choice(hotels)), repeat)),
+            ]
+
+        for label, samples in results:
+            line = summary(label, samples)
+            if percentile(samples, 95) <= options['budget_ms']:
+                self.stdout.write(self.style.SUCCESS(line))
+            else:
+                self.stdout.write(self.style.ERROR(f"{line}; p95 over the {options['budget_ms']:.0f} ms budget"))
@@ -25,5 +25,8 @@ class Room(BaseModel):
             models.Index(fields=['room_no']),
             models.Index(fields=['floor_no']),
             models.Index(fields=['capacity']),
-            models.Index(fields=['hotel'])
+            models.Index(fields=['hotel']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['price', 'id']),
+            models.Index(fields=['capacity', 'id'])
         ]
@@ -0,0 +1,7 @@
+from django.dispatch import Signal
+
+# Sent after Room.objects.bulk_create, which skips post_save; provides ``rooms``
+rooms_bulk_created = Signal()
+
+# Sent after the import's Room.objects.bulk_update, which skips post_save; provides ``rooms``
+rooms_bulk_updated = Signal()
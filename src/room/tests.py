@@ -1,3 +1,19 @@
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from account.models import Account
+from base.testing import ConstantQueriesMixin, make_account, make_hotel, make_room
+
+
+class RoomListQueryTests(ConstantQueriesMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        landlord = make_account(Account.LANDLORD)
+        for _ in range(5):
+            hotel = make_hotel(landlord)
+            make_room(hotel)
+            make_room(hotel)
+
+    def test_room_list_queries_do_not_grow_with_page_size(self):
+        self.assertConstantQueries(reverse('room_api:room-list'))
@@ -0,0 +1,17 @@
+from django.contrib import admin
+from stats.models import Counter, HotelDay
+
+
+@admin.register(Counter)
+class CounterAdmin(admin.ModelAdmin):
+    list_display = ('name', 'scope', 'value', 'updated_at')
+    list_filter = ('name',)
+    readonly_fields = ('name', 'scope', 'value', 'updated_at')
+
+
+@admin.register(HotelDay)
+class HotelDayAdmin(admin.ModelAdmin):
+    list_display = ('hotel', 'date', 'rooms', 'occupied', 'room_revenue', 'payments', 'updated_at')
+    list_filter = ('date',)
+    list_select_related = ('hotel',)
+    readonly_fields = ('hotel', 'date', 'rooms', 'occupied', 'room_revenue', 'payments', 'updated_at')
@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import analytics, dashboard_stats
+
+app_name = 'stats'
+
+urlpatterns = [
+    path('dashboard', dashboard_stats, name='dashboard'),
+    path('analytics', analytics, name='analytics'),
+]
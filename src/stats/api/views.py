@@ -0,0 +1,83 @@
+from django.utils import timezone
+from rest_framework import permissions, status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.response import Response
+
+from booking.availability import overlapping
+from booking.calendar import parse_range
+from booking.models import Booking
+from payment.aggregates import payment_totals
+from payment.models import Payment
+from stats.counters import CUSTOMERS, HOTELS, LANDLORD_COUNTERS, ROOMS, read_counters
+from stats.models import Counter, HotelDay
+from stats.rollups import PERIODS, hotel_analytics
+
+
+def _occupancy(rooms, bookings):
+    """Rooms with a booking in progress right now, read from the booking index"""
+    now = timezone.now()
+    occupied = bookings.filter(overlapping(now, now)).order_by().values('room').distinct().count()
+    return {
+        'occupied_rooms': occupied,
+        'rate': round(occupied / rooms, 4) if rooms else 0.0,
+    }
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def dashboard_stats(request):
+    """
+    All dashboard numbers in one response.
+    Admin - system-wide counters
+    Landlord - counters for their own hotels
+    User - public catalog counters, their own bookings and payments
+    """
+    user = request.user
+
+    if user.is_role_admin():
+        data = read_counters()
+        data['occupancy'] = _occupancy(data[ROOMS], Booking.objects.all())
+    elif user.is_role_landlord():
+        data = read_counters(scope=user.pk, names=LANDLORD_COUNTERS)
+        data['occupancy'] = _occupancy(data[ROOMS], Booking.objects.filter(room__hotel__landlord=user))
+    else:
+        data = read_counters(scope=Counter.GLOBAL, names=(HOTELS, ROOMS, CUSTOMERS))
+        data['bookings'] = Booking.objects.filter(created_by=user.email).count()
+        data['revenue'] = payment_totals(Payment.objects.filter(booking__created_by=user.email))['total_amount']
+
+    return Response(data, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def analytics(request):
+    """
+    Occupancy, ADR and RevPAR per hotel and day or month, read from the daily rollups.
+    Query params: from, to (exclusive), period (day, month), hotel.
+    Admin - all hotels
+    Landlord - their own hotels
+    """
+    user = request.user
+    params = request.query_params
+
+    if user.is_role_admin():
+        hotel_days = HotelDay.objects.all()
+    elif user.is_role_landlord():
+        hotel_days = HotelDay.objects.filter(hotel__landlord=user)
+    else:
+        raise PermissionDenied("Only landlords and admins can view analytics")
+
+    period = params.get('period', 'day')
+    if period not in PERIODS:
+        raise ValidationError(detail=f'period must be one of: {", ".join(PERIODS)}.')
+    start, end = parse_range(params)
+    hotel_days = hotel_days.filter(date__gte=start, date__lt=end)
+    if params.get('hotel'):
+        if not params.get('hotel').isdigit():
+            raise ValidationError(detail='hotel must be an id.')
+        hotel_days = hotel_days.filter(hotel=params.get('hotel'))
+
+    data = {'from': start, 'to': end, 'period': period}
+    data.update(hotel_analytics(hotel_days, period))
+    return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,94 @@
+"""
+Materialized dashboard counters.
+
+Signals bump the counters as rows are created and deleted, so reading the
+dashboard is a single lookup instead of a COUNT over every table. Changes the
+signals cannot see (bulk operations, edits moving a row to another landlord)
+are reconciled by ``refresh_counters``, run from the ``refresh_stats``
+management command.
+"""
+from django.apps import apps as django_apps
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+
+from stats.models import Counter
+
+HOTELS = 'hotels'
+ROOMS = 'rooms'
+BOOKINGS = 'bookings'
+PAYMENTS = 'payments'
+REVENUE = 'revenue'
+CUSTOMERS = 'customers'
+USERS = 'users'
+
+GLOBAL_COUNTERS = (HOTELS, ROOMS, BOOKINGS, PAYMENTS, REVENUE, CUSTOMERS, USERS)
+LANDLORD_COUNTERS = (HOTELS, ROOMS, BOOKINGS, PAYMENTS, REVENUE)
+
+
+def _add(name, scope, delta):
+    if Counter.objects.filter(name=name, scope=scope).update(value=F('value') + delta):
+        return
+    try:
+        with transaction.atomic():
+            Counter.objects.create(name=name, scope=scope, value=delta)
+    except IntegrityError:
+        # Created concurrently
+        Counter.objects.filter(name=name, scope=scope).update(value=F('value') + delta)
+
+
+def bump(name, delta, landlord_id=None):
+    """
+    Add ``delta`` to the global counter and, when given, the landlord's counter.
+    Applied after the surrounding transaction commits so the hot counter rows are
+    only locked for one short statement.
+    """
+    def apply():
+        _add(name, Counter.GLOBAL, delta)
+        if landlord_id:
+            _add(name, landlord_id, delta)
+    transaction.on_commit(apply)
+
+
+def read_counters(scope=Counter.GLOBAL, names=GLOBAL_COUNTERS):
+    values = dict(Counter.objects.filter(scope=scope, name__in=names).values_list('name', 'value'))
+    return {name: values.get(name, 0) for name in names}
+
+
+def refresh_counters(apps=django_apps):
+    """Recompute every counter from the source tables; ``apps`` allows use from migrations"""
+    Hotel = apps.get_model('hotel', 'Hotel')
+    Room = apps.get_model('room', 'Room')
+    Booking = apps.get_model('booking', 'Booking')
+    Payment = apps.get_model('payment', 'Payment')
+    Customer = apps.get_model('customer', 'Customer')
+    Account = apps.get_model('account', 'Account')
+    StoredCounter = apps.get_model('stats', 'Counter')
+
+    payments = Payment.objects.order_by().aggregate(count=Count('id'), revenue=Sum('amount'))
+    values = {
+        (HOTELS, Counter.GLOBAL): Hotel.objects.count(),
+        (ROOMS, Counter.GLOBAL): Room.objects.count(),
+        (BOOKINGS, Counter.GLOBAL): Booking.objects.count(),
+        (PAYMENTS, Counter.GLOBAL): payments['count'],
+        (REVENUE, Counter.GLOBAL): payments['revenue'] or 0.0,
+        (CUSTOMERS, Counter.GLOBAL): Customer.objects.count(),
+        (USERS, Counter.GLOBAL): Account.objects.count(),
+    }
+
+    per_landlord = [
+        (HOTELS, Hotel.objects.values_list('landlord').annotate(value=Count('id'))),
+        (ROOMS, Room.objects.values_list('hotel__landlord').annotate(value=Count('id'))),
+        (BOOKINGS, Booking.objects.values_list('room__hotel__landlord').annotate(value=Count('id'))),
+        (PAYMENTS, Payment.objects.values_list('booking__room__hotel__landlord').annotate(value=Count('id'))),
+        (REVENUE, Payment.objects.values_list('booking__room__hotel__landlord').annotate(value=Sum('amount'))),
+    ]
+    for name, rows in per_landlord:
+        for landlord_id, value in rows.order_by():
+            if landlord_id:
+                values[(name, landlord_id)] = value or 0
+
+    with transaction.atomic():
+        StoredCounter.objects.all().delete()
+        StoredCounter.objects.bulk_create(
+            StoredCounter(name=name, scope=scope, value=value) for (name, scope), value in values.items()
+        )
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from stats.counters import refresh_counters
+
+
+class Command(BaseCommand):
+    help = 'Recompute the materialized dashboard counters from the source tables'
+
+    def handle(self, *args, **options):
+        refresh_counters()
+        self.stdout.write(self.style.SUCCESS('Dashboard counters refreshed.'))
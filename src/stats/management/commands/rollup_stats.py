@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from stats.rollups import mark_all, rollup
+
+
+class Command(BaseCommand):
+    help = 'Recompute the daily hotel rollups for every day changed since the last run'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help='Queue every day with room nights or payments first (full rebuild)')
+
+    def handle(self, *args, **options):
+        if options['all']:
+            mark_all()
+        processed = rollup()
+        self.stdout.write(self.style.SUCCESS(f'Rolled up {processed} queued hotel day changes.'))
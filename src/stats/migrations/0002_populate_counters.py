@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+def populate(apps, schema_editor):
+    from stats.counters import refresh_counters
+    refresh_counters(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0001_initial'),
+        ('account', '0003_auto_20261018_1100'),
+        ('customer', '0003_auto_20261018_1100'),
+        ('hotel', '0004_auto_20261018_1100'),
+        ('room', '0004_auto_20261018_1100'),
+        ('booking', '0005_auto_20261018_1100'),
+        ('payment', '0004_auto_20261018_1100'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 3.1.7 on 2026-10-18 15:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0006_auto_20261018_1300'),
+        ('stats', '0002_populate_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DirtyHotelDay',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('hotel', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='hotel.hotel')),
+            ],
+            options={
+                'db_table': 'stats_dirty_hotel_days',
+            },
+        ),
+        migrations.CreateModel(
+            name='HotelDay',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('rooms', models.PositiveIntegerField(default=0)),
+                ('occupied', models.PositiveIntegerField(default=0)),
+                ('room_revenue', models.FloatField(default=0)),
+                ('payments', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('hotel', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='hotel.hotel')),
+            ],
+            options={
+                'verbose_name': 'Hotel day',
+                'verbose_name_plural': 'Hotel days',
+                'db_table': 'stats_hotel_days',
+                'unique_together': {('hotel', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+
+class Counter(models.Model):
+    """
+    Materialized dashboard counter.
+    ``scope`` is 0 for system-wide values, otherwise the id of the landlord the value belongs to.
+    """
+    GLOBAL = 0
+
+    name           = models.CharField(max_length=50)
+    scope          = models.PositiveIntegerField(default=GLOBAL)
+    value          = models.FloatField(default=0)
+    updated_at     = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'{self.name}[{self.scope}] = {self.value}'
+
+    class Meta:
+        db_table = 'stats_counters'
+        verbose_name = _('Counter')
+        verbose_name_plural = _('Counters')
+        unique_together = [['name', 'scope']]
+
+
+class HotelDay(models.Model):
+    """
+    Daily rollup for one hotel (see ``stats.rollups``).
+    ``rooms`` is the rooms on sale that day and ``occupied`` the rooms with a booked night.
+    """
+    # The (hotel, date) unique index also serves lookups by hotel
+    hotel          = models.ForeignKey('hotel.Hotel', on_delete=models.CASCADE, related_name='+', db_index=False)
+    date           = models.DateField()
+    rooms          = models.PositiveIntegerField(default=0)
+    occupied       = models.PositiveIntegerField(default=0)
+    room_revenue   = models.FloatField(default=0)
+    payments       = models.FloatField(default=0)
+    updated_at     = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'{self.hotel_id} @ {self.date}'
+
+    class Meta:
+        db_table = 'stats_hotel_days'
+        verbose_name = _('Hotel day')
+        verbose_name_plural = _('Hotel days')
+        unique_together = [['hotel', 'date']]
+
+
+class DirtyHotelDay(models.Model):
+    """
+    A hotel day whose rollup is stale. Append-only: every change adds a row and the
+    rollup deletes exactly the rows it processed, so a change made while it runs is never lost.
+    No constraint on ``hotel``: rows are also queued while a hotel's own delete cascades.
+    """
+    hotel          = models.ForeignKey('hotel.Hotel', on_delete=models.DO_NOTHING, related_name='+',
+                                       db_constraint=False, db_index=False)
+    date           = models.DateField()
+
+    class Meta:
+        db_table = 'stats_dirty_hotel_days'
@@ -0,0 +1,167 @@
+"""
+Daily hotel rollups: occupancy, ADR and RevPAR.
+
+Signals record every hotel day a change touches in ``DirtyHotelDay``, and
+``rollup`` (the ``rollup_stats`` command, run on a schedule) recomputes only
+those days into ``HotelDay`` from the room night calendar, rooms and payments.
+Analytics then read the small ``HotelDay`` table through its (hotel, date) index.
+
+    occupancy = occupied / rooms
+    ADR       = room_revenue / occupied
+    RevPAR    = room_revenue / rooms
+
+``rooms`` is inventory as of the day. Rooms keep no availability history, so a
+day that has ended keeps the count stored when it was last rolled up (room
+changes queue today, so today's row holds the day's final inventory). A day
+rolled up for the first time counts the rooms on sale now that existed by the
+end of it; for a past day that misses rooms since taken off sale or deleted.
+"""
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+
+from base.helpers.streaming import chunked
+from booking.models import RoomNight
+from hotel.models import Hotel
+from payment.models import Payment
+from room.models import Room
+from stats.models import DirtyHotelDay, HotelDay
+
+ROLLUP_BATCH_SIZE = 500
+# Serializes concurrent rollup runs so two never rewrite the same hotel day
+ROLLUP_LOCK_ID = 7_301_017
+
+PERIODS = {
+    'day': F('date'),
+    'month': TruncMonth('date'),
+}
+
+
+def mark_dirty(hotel_days):
+    """Queue (hotel_id, date) pairs for the next rollup"""
+    rows = [DirtyHotelDay(hotel_id=hotel_id, date=day) for hotel_id, day in set(hotel_days) if hotel_id]
+    if rows:
+        DirtyHotelDay.objects.bulk_create(rows)
+
+
+def mark_all():
+    """Queue every hotel day that has room nights or payments, e.g. for a first full rollup"""
+    nights = RoomNight.objects.order_by().values_list('hotel_id', 'date').distinct()
+    payments = (Payment.objects.order_by().annotate(day=TruncDate('created_at'))
+                .values_list('booking__room__hotel_id', 'day').distinct())
+    for source in (nights, payments):
+        for chunk in chunked(source.iterator(chunk_size=5000), 5000):
+            mark_dirty(chunk)
+
+
+def _day_bounds(first, last):
+    """Aware [start of ``first``, start of the day after ``last``) in the current timezone"""
+    start = timezone.make_aware(datetime.combine(first, time.min))
+    end = timezone.make_aware(datetime.combine(last + timedelta(days=1), time.min))
+    return start, end
+
+
+def _inventory(hotel_id, dates, stored):
+    """Rooms on sale per day: ``stored`` counts for ended days, otherwise rooms on sale now created by the day's end"""
+    created = sorted(Room.objects.filter(hotel=hotel_id, is_available=True).values_list('created_at', flat=True))
+    return {day: stored[day] if day in stored else bisect_left(created, _day_bounds(day, day)[1]) for day in dates}
+
+
+def _compute(hotel_id, dates, stored_rooms):
+    rooms = _inventory(hotel_id, dates, stored_rooms)
+    nights = {
+        row['date']: row
+        for row in RoomNight.objects.filter(hotel=hotel_id, date__in=dates).order_by().values('date').annotate(
+            occupied=Count('room', distinct=True), revenue=Sum('rate'))
+    }
+    start, end = _day_bounds(min(dates), max(dates))
+    payments = dict(
+        Payment.objects.filter(booking__room__hotel=hotel_id, created_at__gte=start, created_at__lt=end)
+        .order_by().annotate(day=TruncDate('created_at')).values('day').annotate(total=Sum('amount'))
+        .values_list('day', 'total')
+    )
+    return [
+        HotelDay(
+            hotel_id=hotel_id,
+            date=day,
+            rooms=rooms[day],
+            occupied=nights.get(day, {}).get('occupied', 0),
+            room_revenue=nights.get(day, {}).get('revenue') or 0.0,
+            payments=payments.get(day) or 0.0,
+        )
+        for day in dates
+    ]
+
+
+def _rollup_batch(batch_size):
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_xact_lock(%s)', [ROLLUP_LOCK_ID])
+        dirty = list(DirtyHotelDay.objects.order_by('pk').values_list('pk', 'hotel_id', 'date')[:batch_size])
+        if not dirty:
+            return 0
+
+        by_hotel = defaultdict(set)
+        for pk, hotel_id, day in dirty:
+            by_hotel[hotel_id].add(day)
+        # Days of hotels deleted since they were queued are dropped
+        existing = set(Hotel.objects.filter(pk__in=by_hotel).values_list('pk', flat=True))
+        by_hotel = {hotel_id: dates for hotel_id, dates in by_hotel.items() if hotel_id in existing}
+        today = timezone.localdate()
+        for hotel_id, dates in by_hotel.items():
+            dates = sorted(dates)
+            current = HotelDay.objects.filter(hotel=hotel_id, date__in=dates)
+            stored_rooms = dict(current.filter(date__lt=today).values_list('date', 'rooms'))
+            current.delete()
+            HotelDay.objects.bulk_create(_compute(hotel_id, dates, stored_rooms))
+
+        DirtyHotelDay.objects.filter(pk__in=[pk for pk, hotel_id, day in dirty]).delete()
+        return len(dirty)
+
+
+def rollup(batch_size=ROLLUP_BATCH_SIZE):
+    """Recompute every dirty hotel day; returns the number of queued changes processed"""
+    total = 0
+    while True:
+        processed = _rollup_batch(batch_size)
+        if not processed:
+            return total
+        total += processed
+
+
+def _metrics(row):
+    rooms, occupied, revenue = row['rooms'] or 0, row['occupied'] or 0, row['room_revenue'] or 0.0
+    row.update({
+        'room_revenue': round(revenue, 2),
+        'payments': round(row['payments'] or 0.0, 2),
+        'occupancy': round(occupied / rooms, 4) if rooms else 0.0,
+        'adr': round(revenue / occupied, 2) if occupied else 0.0,
+        'revpar': round(revenue / rooms, 2) if rooms else 0.0,
+    })
+    return row
+
+
+def hotel_analytics(hotel_days, period='day'):
+    """
+    Per hotel and period rows plus overall totals from a ``HotelDay`` queryset.
+    ``rooms`` and ``occupied`` are summed room nights; ``period`` is one of ``PERIODS``.
+    """
+    sums = {
+        'rooms': Sum('rooms'),
+        'occupied': Sum('occupied'),
+        'room_revenue': Sum('room_revenue'),
+        'payments': Sum('payments'),
+    }
+    hotel_days = hotel_days.order_by()
+    rows = (hotel_days.values('hotel', hotel_name=F('hotel__name'), period=PERIODS[period])
+            .annotate(**sums).order_by('hotel', 'period'))
+    return {
+        'results': [_metrics(row) for row in rows],
+        'totals': _metrics(hotel_days.aggregate(**sums)),
+    }
@@ -0,0 +1,183 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from booking.calendar import nights
+from booking.models import Booking
+from booking.signals import bookings_bulk_created
+from customer.models import Customer
+from hotel.models import Hotel
+from payment.models import Payment
+from room.models import Room
+from room.signals import rooms_bulk_created, rooms_bulk_updated
+from stats.counters import BOOKINGS, CUSTOMERS, HOTELS, PAYMENTS, REVENUE, ROOMS, USERS, bump
+from stats.rollups import mark_dirty
+
+
+def _delta(signal, created):
+    """+1 for an insert, -1 for a delete, 0 for an update"""
+    if signal is post_delete:
+        return -1
+    return 1 if created else 0
+
+
+def _hotel_landlord(hotel_id):
+    return Hotel.objects.filter(pk=hotel_id).values_list('landlord_id', flat=True).first()
+
+
+def _room_landlord(room_id):
+    return Room.objects.filter(pk=room_id).values_list('hotel__landlord_id', flat=True).first()
+
+
+def _booking_landlord(booking_id):
+    return Booking.objects.filter(pk=booking_id).values_list('room__hotel__landlord_id', flat=True).first()
+
+
+@receiver(post_save, sender=Hotel)
+@receiver(post_delete, sender=Hotel)
+def count_hotel(sender, instance, signal, created=False, **kwargs):
+    delta = _delta(signal, created)
+    if delta:
+        bump(HOTELS, delta, instance.landlord_id)
+
+
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+def count_room(sender, instance, signal, created=False, **kwargs):
+    delta = _delta(signal, created)
+    if delta:
+        bump(ROOMS, delta, _hotel_landlord(instance.hotel_id))
+
+
+@receiver(rooms_bulk_created)
+def count_bulk_rooms(sender, rooms, **kwargs):
+    landlords = dict(Hotel.objects.filter(pk__in={room.hotel_id for room in rooms}).values_list('pk', 'landlord_id'))
+    per_landlord = {}
+    for room in rooms:
+        landlord_id = landlords.get(room.hotel_id)
+        per_landlord[landlord_id] = per_landlord.get(landlord_id, 0) + 1
+    for landlord_id, count in per_landlord.items():
+        bump(ROOMS, count, landlord_id)
+
+
+@receiver(post_save, sender=Booking)
+@receiver(post_delete, sender=Booking)
+def count_booking(sender, instance, signal, created=False, **kwargs):
+    delta = _delta(signal, created)
+    if delta:
+        bump(BOOKINGS, delta, _room_landlord(instance.room_id))
+
+
+@receiver(bookings_bulk_created)
+def count_bulk_bookings(sender, bookings, **kwargs):
+    landlords = dict(Room.objects.filter(pk__in={booking.room_id for booking in bookings})
+                     .values_list('pk', 'hotel__landlord_id'))
+    per_landlord = {}
+    for booking in bookings:
+        landlord_id = landlords.get(booking.room_id)
+        per_landlord[landlord_id] = per_landlord.get(landlord_id, 0) + 1
+    for landlord_id, count in per_landlord.items():
+        bump(BOOKINGS, count, landlord_id)
+
+
+@receiver(pre_save, sender=Payment)
+def remember_payment_amount(sender, instance, **kwargs):
+    if instance.pk:
+        instance._stats_previous_amount = Payment.objects.filter(pk=instance.pk).values_list('amount', flat=True).first()
+
+
+@receiver(post_save, sender=Payment)
+def count_payment(sender, instance, created, **kwargs):
+    landlord_id = _booking_landlord(instance.booking_id)
+    if created:
+        bump(PAYMENTS, 1, landlord_id)
+        bump(REVENUE, instance.amount, landlord_id)
+    elif getattr(instance, '_stats_previous_amount', None) is not None:
+        delta = instance.amount - instance._stats_previous_amount
+        if delta:
+            bump(REVENUE, delta, landlord_id)
+
+
+@receiver(post_delete, sender=Payment)
+def uncount_payment(sender, instance, **kwargs):
+    landlord_id = _booking_landlord(instance.booking_id)
+    bump(PAYMENTS, -1, landlord_id)
+    bump(REVENUE, -instance.amount, landlord_id)
+
+
+@receiver(post_save, sender=Customer)
+@receiver(post_delete, sender=Customer)
+def count_customer(sender, instance, signal, created=False, **kwargs):
+    delta = _delta(signal, created)
+    if delta:
+        bump(CUSTOMERS, delta)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def count_account(sender, instance, signal, created=False, **kwargs):
+    delta = _delta(signal, created)
+    if delta:
+        bump(USERS, delta)
+
+
+# Rollup invalidation: queue every hotel day a change touches
+
+def _room_hotels(room_ids):
+    return dict(Room.objects.filter(pk__in=room_ids).values_list('pk', 'hotel_id'))
+
+
+def _stay_days(hotel_id, start, end):
+    return [(hotel_id, day) for day in nights(start, end)]
+
+
+@receiver(pre_save, sender=Booking)
+def remember_booking_stay(sender, instance, **kwargs):
+    if instance.pk:
+        instance._stats_previous_stay = Booking.objects.filter(pk=instance.pk).values_list(
+            'room_id', 'booking_start_time', 'booking_end_time').first()
+
+
+@receiver(post_save, sender=Booking)
+@receiver(post_delete, sender=Booking)
+def dirty_booking_days(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    stays = [(instance.room_id, instance.booking_start_time, instance.booking_end_time)]
+    previous = getattr(instance, '_stats_previous_stay', None)
+    if previous and previous != stays[0]:
+        stays.append(previous)
+    hotels = _room_hotels({room_id for room_id, start, end in stays})
+    mark_dirty([day for room_id, start, end in stays for day in _stay_days(hotels.get(room_id), start, end)])
+
+
+@receiver(bookings_bulk_created)
+def dirty_bulk_booking_days(sender, bookings, **kwargs):
+    hotels = _room_hotels({booking.room_id for booking in bookings})
+    mark_dirty([
+        day for booking in bookings
+        for day in _stay_days(hotels.get(booking.room_id), booking.booking_start_time, booking.booking_end_time)
+    ])
+
+
+@receiver(post_save, sender=Payment)
+@receiver(post_delete, sender=Payment)
+def dirty_payment_day(sender, instance, raw=False, **kwargs):
+    if not raw:
+        hotel_id = Booking.objects.filter(pk=instance.booking_id).values_list('room__hotel_id', flat=True).first()
+        mark_dirty([(hotel_id, timezone.localtime(instance.created_at).date())])
+
+
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+def dirty_room_day(sender, instance, raw=False, **kwargs):
+    # Rooms on sale are counted when a day is rolled up; today is the day that changed
+    if not raw:
+        mark_dirty([(instance.hotel_id, timezone.localdate())])
+
+
+@receiver(rooms_bulk_created)
+@receiver(rooms_bulk_updated)
+def dirty_bulk_room_day(sender, rooms, **kwargs):
+    mark_dirty([(room.hotel_id, timezone.localdate()) for room in rooms])
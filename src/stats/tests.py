@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from account.models import Account
+from base.testing import make_account, make_hotel, make_room
+from room.models import Room
+from stats.models import HotelDay
+from stats.rollups import mark_dirty, rollup
+
+
+class RollupInventoryTests(TestCase):
+
+    def setUp(self):
+        self.hotel = make_hotel(make_account(Account.LANDLORD))
+        self.today = timezone.localdate()
+        self.yesterday = self.today - timedelta(days=1)
+
+    def _make_old_room(self):
+        room = make_room(self.hotel)
+        Room.objects.filter(pk=room.pk).update(created_at=timezone.now() - timedelta(days=3))
+        return room
+
+    def _rooms_on(self, day):
+        mark_dirty([(self.hotel.pk, day)])
+        rollup()
+        return HotelDay.objects.get(hotel=self.hotel, date=day).rooms
+
+    def test_ended_day_keeps_its_inventory(self):
+        self._make_old_room()
+        room = self._make_old_room()
+        self.assertEqual(self._rooms_on(self.yesterday), 2)
+
+        room.is_available = False
+        room.save()
+
+        self.assertEqual(self._rooms_on(self.yesterday), 2)
+        self.assertEqual(self._rooms_on(self.today), 1)
+
+    def test_first_rollup_of_a_past_day_skips_rooms_added_since(self):
+        self._make_old_room()
+        make_room(self.hotel)
+
+        self.assertEqual(self._rooms_on(self.yesterday), 1)
+        self.assertEqual(self._rooms_on(self.today), 2)